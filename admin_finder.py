@@ -8,19 +8,56 @@ Version: 2.0
 
 import argparse
 import asyncio
-import aiohttp
-import json
-import csv
+import concurrent.futures
+import functools
+import importlib
 import random
+import re
 import time
 import sys
+import collections
+import contextlib
+import email.utils
+from http.cookies import SimpleCookie, CookieError
+import multiprocessing
 import os
+import queue
+import signal
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, AsyncIterator, Sequence, Callable
+from dataclasses import dataclass, asdict, field, fields, replace
 import ssl
-import certifi
+import gzip
+import html
+import io
+import tempfile
+import math
+import sqlite3
+import hashlib
+import bisect
+import codecs
+import heapq
+import itertools
+import ipaddress
+import socket
+import uuid
+
+class _LazyModule:
+    """Placeholder for a module that is only imported on first attribute
+    access, after which the real module replaces it in this namespace"""
+    
+    def __init__(self, name: str):
+        self._name = name
+    
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self._name)
+        globals()[self._name] = module
+        return getattr(module, attr)
+
+# Imported on first use so --help and short library calls start fast
+aiohttp = _LazyModule('aiohttp')
+json = _LazyModule('json')
 
 # Color codes for terminal output
 class Colors:
@@ -33,24 +70,2315 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
     RESET = '\033[0m'
+
+class NoColors(Colors):
+    """Colors with every code blanked, for output that is not a terminal"""
+    HEADER = BLUE = CYAN = GREEN = YELLOW = RED = BOLD = UNDERLINE = RESET = ''
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted
+@dataclass
+class ScanResult:
+    url: str
+    status_code: int
+    response_time: float
+    redirect_url: Optional[str]
+    content_length: int
+    server: Optional[str]
+    title: Optional[str]
+    admin_indicators: List[str]
+    target: Optional[str] = None
+    score: float = 0.0
+    classification: Optional[str] = None
+    aliases: List[str] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+class IndicatorMatcher:
+    """Precompiled matcher for admin indicator keywords and the page title.
+    
+    Built once per scan.  Works directly on body bytes (no decode), lowercases
+    them once and runs CPython's C substring search per keyword, which beats a
+    single alternation regex since `re` has no literal-trie optimization.
+    """
+    
+    TITLE_PATTERN = re.compile(rb'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+    
+    def __init__(self, indicators):
+        if isinstance(indicators, dict):
+            items = indicators.items()
+        else:
+            items = ((indicator, 1.0) for indicator in indicators)
+        
+        self.weights: Dict[str, float] = {}
+        for indicator, weight in items:
+            indicator = indicator.strip().lower()
+            if indicator:
+                self.weights[indicator] = float(weight)
+        self._needles = [(indicator, indicator.encode('utf-8')) for indicator in self.weights]
+    
+    def title(self, body: bytes, encoding: Optional[str] = None) -> Optional[str]:
+        """Extract the page title from raw body bytes"""
+        match = self.TITLE_PATTERN.search(body)
+        if not match:
+            return None
+        try:
+            codec = codecs.lookup(encoding or 'utf-8').name
+        except LookupError:
+            # Unknown charset from the server: fall back like aiohttp does
+            codec = 'utf-8'
+        return match.group(1).decode(codec, errors='replace').strip() or None
+    
+    def match(self, body: bytes, encoding: Optional[str] = None) -> Tuple[List[str], Optional[str], float]:
+        """Return (indicators found, title, weighted score) for a body"""
+        lowered = body.lower()
+        found = [indicator for indicator, needle in self._needles if needle in lowered]
+        score = sum(self.weights[indicator] for indicator in found)
+        return found, self.title(body, encoding), score
+
+def load_indicators(source: str) -> Dict[str, float]:
+    """Read weighted indicators from a file of "keyword[:weight]" lines"""
+    indicators: Dict[str, float] = {}
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            keyword, sep, weight = line.rpartition(':')
+            try:
+                indicators[keyword if sep else weight] = float(weight) if sep else 1.0
+            except ValueError:
+                indicators[line] = 1.0
+    return indicators
+
+# Analysis executor kinds; 'thread' only helps parsers that release the GIL
+ANALYSIS_MODES = ('process', 'thread')
+# Response headers forwarded to the analysis stage
+ANALYSIS_HEADERS = ('Content-Type', 'WWW-Authenticate', 'Location')
+
+PASSWORD_FIELD_PATTERN = re.compile(rb'<input[^>]+type\s*=\s*["\']?password', re.IGNORECASE)
+
+def analyze_body(matcher: IndicatorMatcher, body: bytes, status: int, headers: Dict[str, str],
+                 encoding: Optional[str] = None) -> Tuple[List[str], Optional[str], float, str]:
+    """Analyze a candidate response: (indicators, title, score, classification)"""
+    indicators, title, score = matcher.match(body, encoding)
+    
+    if status == 401 or 'WWW-Authenticate' in headers:
+        classification = 'http-auth'
+    elif PASSWORD_FIELD_PATTERN.search(body):
+        classification = 'login-form'
+    elif status == 403:
+        classification = 'forbidden'
+    elif 300 <= status < 400:
+        classification = 'redirect'
+    else:
+        classification = 'page'
+    
+    return indicators, title, score, classification
+
+# Per-process matcher used by analysis pool workers
+_worker_matcher: Optional[IndicatorMatcher] = None
+
+def _init_analysis_worker(weights: Dict[str, float]):
+    """Build the indicator matcher once in each analysis process"""
+    global _worker_matcher
+    _worker_matcher = IndicatorMatcher(weights)
+
+def _analyze_job(matcher: IndicatorMatcher, body: bytes, status: int, headers: Dict[str, str],
+                 encoding: Optional[str], paths: Optional[Tuple[str, ...]]) -> Tuple[Tuple, Optional['BodyDigest']]:
+    """analyze_body plus, when ``paths`` is given, the body digest used for deduplication"""
+    return (analyze_body(matcher, body, status, headers, encoding),
+            body_digest(body, *paths) if paths is not None else None)
+
+def _analyze_in_worker(body: bytes, status: int, headers: Dict[str, str],
+                       encoding: Optional[str], paths: Optional[Tuple[str, ...]]) -> Tuple[Tuple, Optional['BodyDigest']]:
+    """Process pool entry point for _analyze_job"""
+    return _analyze_job(_worker_matcher, body, status, headers, encoding, paths)
+
+@dataclass
+class WildcardFingerprint:
+    """Fingerprint of a target's response to a nonexistent path"""
+    status: int
+    length: Optional[int]
+    location: Optional[str]
+    prefix_hash: str
+    simhash: int
+    # Length of the calibration path and how often the page echoed it
+    path_length: int = 0
+    reflections: int = 0
+
+    def matches_headers(self, status: int, location: Optional[str], length: Optional[int],
+                        path: str = '') -> bool:
+        """Match on status, redirect target and Content-Length alone.
+        
+        The length must be exact, up to the drift explained by echoing a
+        path of a different length as often as the calibration page did.
+        """
+        if status != self.status or location != self.location or length is None or self.length is None:
+            return False
+        drift = self.reflections * (len(path.strip('/')) - self.path_length)
+        return length == self.length + drift
+
+    def matches_prefix(self, status: int, location: Optional[str], prefix_hash: str, simhash: int) -> bool:
+        """Match on the normalized body prefix once it has been read"""
+        if status != self.status or location != self.location:
+            return False
+        return prefix_hash == self.prefix_hash or bin(simhash ^ self.simhash).count('1') <= SIMHASH_DISTANCE
+
+# Bytes of body read before deciding whether a response is a wildcard page
+WILDCARD_PREFIX_BYTES = 4096
+# Random nonexistent paths requested per target during calibration
+WILDCARD_PROBES = ("{token}", "{token}.php", "{token}/")
+
+# Probe strategies: full GET, HEAD then GET for candidates, or a single ranged GET
+PROBE_STRATEGIES = ('get', 'head', 'range')
+# Default cap on body bytes read per candidate
+DEFAULT_MAX_BODY = 64 * 1024
+# Once </title> has been seen, stop reading after this much text
+INDICATOR_WINDOW = 16 * 1024
+# HEAD answers meaning the server does not support HEAD for this resource
+HEAD_UNSUPPORTED = (405, 501)
+
+def _strip_reflection(data: bytes, path: str) -> bytes:
+    """Remove reflected copies of the requested path so pages compare equal"""
+    path = path.strip('/')
+    return data.replace(path.encode('utf-8', 'ignore'), b'') if path else data
+
+# Simhash distance (in bits) at or below which two pages count as the same
+SIMHASH_DISTANCE = 3
+# Maps every byte outside [a-z0-9_] to a space, so split() yields the body's tokens
+BODY_TOKEN_TABLE = bytes(value if value in b'abcdefghijklmnopqrstuvwxyz0123456789_' else 32
+                         for value in range(256))
+
+@dataclass(frozen=True)
+class BodyDigest:
+    """Exact and similarity hashes of a normalized response body"""
+    body_hash: str
+    simhash: int
+
+# Per bit, the byte values that have it clear (deleted to count the ones)
+_BIT_CLEAR = [bytes(value for value in range(256) if not value >> bit & 1) for bit in range(8)]
+
+def _simhash(tokens: Iterable[bytes]) -> int:
+    """64-bit simhash of a token sequence, weighted by token frequency.
+    
+    Each distinct token's digest is repeated by its weight into one buffer,
+    and the 64 per-bit counts come from slicing that buffer per digest byte
+    and deleting the bytes with the bit clear, so the only Python-level
+    work is one hash per distinct token.
+    """
+    counts = collections.Counter(tokens)
+    total = sum(counts.values())
+    digests = b''.join(hashlib.blake2b(token, digest_size=8).digest() * weight
+                       for token, weight in counts.items())
+    fingerprint = 0
+    for i in range(8):
+        column = digests[i::8]
+        for bit in range(8):
+            if len(column.translate(None, _BIT_CLEAR[bit])) * 2 > total:
+                fingerprint |= 1 << (i * 8 + bit)
+    return fingerprint
+
+def body_digest(body: bytes, *paths: str) -> BodyDigest:
+    """Digest a body with the given paths stripped and whitespace/case folded.
+    
+    Pass both the probed path and the path the body was finally served
+    from, so a page echoing its own URL digests the same whichever path
+    led to it.
+    """
+    # Longest first, so stripping "admin" cannot break up "administrator"
+    for path in sorted({path.strip('/') for path in paths}, key=len, reverse=True):
+        body = _strip_reflection(body, path)
+    normalized = b' '.join(body.lower().split())
+    return BodyDigest(
+        body_hash=hashlib.sha1(normalized).hexdigest(),
+        simhash=_simhash(normalized.translate(BODY_TOKEN_TABLE).split())
+    )
+
+class ResponseClusterer:
+    """Online grouping of results that are the same page reached by different paths.
+    
+    Two results of one target with the same status are merged when they share
+    a final redirect URL, an exact body hash, or simhashes within
+    SIMHASH_DISTANCE bits.  The first result seen stays the finding; later
+    ones are recorded as its aliases, and their redirect targets and
+    digests lead to it too, so the outcome does not depend on probe order.
+    """
+    
+    def __init__(self):
+        self._redirects: Dict[Tuple[str, int, str], ScanResult] = {}
+        self._hashes: Dict[Tuple[str, int, str], ScanResult] = {}
+        self._simhashes: Dict[Tuple[str, int], List[Tuple[int, ScanResult]]] = {}
+        self.primaries: List[ScanResult] = []
+        # Per finding or alias URL, for forwarding to a parent scan
+        self.digests: Dict[str, BodyDigest] = {}
+        self.redirects: Dict[str, str] = {}
+        self.merged = 0
+    
+    def known_redirect(self, target: str, status: int, redirect_url: Optional[str]) -> Optional[ScanResult]:
+        """Finding already reached through the same redirect target, if any"""
+        if redirect_url is None:
+            return None
+        return self._redirects.get((target, status, redirect_url))
+    
+    def assign(self, result: ScanResult, digest: Optional[BodyDigest]) -> Optional[ScanResult]:
+        """Register a result; return the finding it duplicates, or None if new"""
+        target, status = result.target, result.status_code
+        primary = self.known_redirect(target, status, result.redirect_url)
+        if primary is None and digest is not None:
+            primary = self._hashes.get((target, status, digest.body_hash))
+            if primary is None:
+                for simhash, candidate in self._simhashes.get((target, status), ()):
+                    if bin(simhash ^ digest.simhash).count('1') <= SIMHASH_DISTANCE:
+                        primary = candidate
+                        break
+        
+        if primary is not None:
+            if result.url != primary.url and result.url not in primary.aliases:
+                primary.aliases.append(result.url)
+                self.merged += 1
+            self.link(primary, result.url, result.redirect_url, digest)
+            return primary
+        
+        self.link(result, result.url, result.redirect_url, digest)
+        self.primaries.append(result)
+        return None
+    
+    def link(self, primary: ScanResult, url: str, redirect_url: Optional[str], digest: Optional[BodyDigest]):
+        """Make the redirect target and digest of ``url`` (the finding itself
+        or one of its aliases) lead to ``primary``"""
+        target, status = primary.target, primary.status_code
+        if redirect_url is not None:
+            self.redirects[url] = redirect_url
+            self._redirects.setdefault((target, status, redirect_url), primary)
+        if digest is not None:
+            self.digests[url] = digest
+            key = (target, status, digest.body_hash)
+            if key not in self._hashes:
+                self._hashes[key] = primary
+                self._simhashes.setdefault((target, status), []).append((digest.simhash, primary))
+
+# Starting per-host concurrency in adaptive mode (slow start grows it from here)
+ADAPTIVE_INITIAL_LIMIT = 4
+# Multiplicative decrease applied on overload signals
+ADAPTIVE_BACKOFF = 0.5
+# Gentler decrease when latency climbs above the host's baseline
+ADAPTIVE_LATENCY_BACKOFF = 0.9
+# Smoothed latency above baseline * tolerance counts as congestion
+LATENCY_TOLERANCE = 2.0
+# Statuses that mean "slow down"
+OVERLOAD_STATUSES = (429, 503)
+# Upper bound honoured for Retry-After pauses (seconds)
+MAX_RETRY_AFTER = 300
+# Items paused or throttled hosts may have set aside in total before the producer waits
+PARKED_LIMIT = 65536
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    seconds = when.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+class HostController:
+    """Per-host concurrency limit driven by latency and error feedback.
+    
+    In adaptive mode the limit starts small and doubles per round trip
+    (slow start) until the first congestion signal, then grows additively
+    while latency stays within LATENCY_TOLERANCE of the host's baseline.
+    Timeouts, connection resets, 429 and 503 cut it multiplicatively, at
+    most once per round trip, and Retry-After pauses the host entirely.
+    An optional rate paces request starts to an exact requests/sec.
+    Work the host cannot take right now waits in ``parked`` so it does not
+    hold one of the scanner's shared workers.
+    """
+    
+    def __init__(self, maximum: int, adaptive: bool = True, rate: Optional[float] = None):
+        self.maximum = max(1, maximum)
+        self.adaptive = adaptive
+        self.limit = float(min(self.maximum, ADAPTIVE_INITIAL_LIMIT) if adaptive else self.maximum)
+        self.interval = 1.0 / rate if rate else 0.0
+        self.in_flight = 0
+        self._slow_start = True
+        self._smoothed: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        self._next_send = 0.0
+        self._waiters: collections.deque = collections.deque()
+        self.parked: collections.deque = collections.deque()
+    
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now, without waiting.
+        
+        Fails while the host is paused, saturated, between pacing ticks or
+        has earlier work parked, so the caller can set the item aside.
+        """
+        now = asyncio.get_running_loop().time()
+        if self.parked or self._waiters or self._paused_until > now or self.in_flight >= int(self.limit):
+            return False
+        if self.interval:
+            if self._next_send > now:
+                return False
+            self._next_send = now + self.interval
+        self.in_flight += 1
+        return True
+    
+    async def acquire(self):
+        """Wait for a free slot (and the next pacing tick) on this host"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pause = self._paused_until - loop.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self.in_flight < int(self.limit):
+                break
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter may already have consumed
+                self._wake()
+                raise
+        self.in_flight += 1
+        
+        if self.interval:
+            now = loop.time()
+            send_at = max(now, self._next_send)
+            self._next_send = send_at + self.interval
+            if send_at > now:
+                await asyncio.sleep(send_at - now)
+    
+    def release(self):
+        """Return a slot taken by acquire()"""
+        self.in_flight -= 1
+        self._wake()
+    
+    def _wake(self):
+        """Wake as many waiters as there are free slots"""
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+    
+    def record_response(self, latency: float, status: int, retry_after: Optional[str] = None):
+        """Feed back the outcome of a request that got a response"""
+        if status in OVERLOAD_STATUSES:
+            self._decrease(ADAPTIVE_BACKOFF)
+            pause = _parse_retry_after(retry_after)
+            if pause:
+                loop = asyncio.get_running_loop()
+                self._paused_until = max(self._paused_until, loop.time() + pause)
+            return
+        
+        self._smoothed = latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+        # The baseline creeps up slowly so a permanently slower host is not punished forever
+        self._baseline = (self._smoothed if self._baseline is None
+                          else min(self._smoothed, self._baseline * 1.01))
+        
+        if self._smoothed > self._baseline * LATENCY_TOLERANCE:
+            self._decrease(ADAPTIVE_LATENCY_BACKOFF)
+        elif self.adaptive and self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + (1.0 if self._slow_start else 1.0 / self.limit))
+            self._wake()
+    
+    def record_failure(self, overload: bool):
+        """Feed back a request that failed; overload marks timeouts and resets"""
+        if overload:
+            self._decrease(ADAPTIVE_BACKOFF)
+    
+    def _decrease(self, factor: float):
+        """Shrink the limit, at most once per smoothed round trip"""
+        if not self.adaptive:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed or 0.0):
+            return
+        self._last_decrease = now
+        self._slow_start = False
+        self.limit = max(1.0, self.limit * factor)
+
+# Statuses worth retrying after a backoff
+RETRY_STATUSES = (429, 502, 503, 504)
+# Consecutive connection failures or overload answers after which a host is given up
+DEFAULT_BREAKER_THRESHOLD = 5
+
+class RetryableStatusError(Exception):
+    """Raised for responses whose status suggests the request should be retried"""
+    
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+class RetryLater(Exception):
+    """Raised by a probe attempt that should be retried after ``delay`` seconds"""
+    
+    def __init__(self, delay: float):
+        super().__init__(f"retry in {delay:.2f}s")
+        self.delay = delay
+
+class HostCircuitBreaker:
+    """Opens after a run of consecutive connection failures or overload answers from one host"""
+    
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.failures = 0
+        self.open = False
+        self._last_overload = 0.0
+    
+    def record_success(self):
+        """Any response other than 429/503 resets the failure run"""
+        self.failures = 0
+    
+    def record_failure(self) -> bool:
+        """Count a connection failure or overload answer; return True if this one opened the breaker"""
+        self.failures += 1
+        if not self.open and self.threshold > 0 and self.failures >= self.threshold:
+            self.open = True
+            return True
+        return False
+    
+    def record_overload(self, started: float) -> bool:
+        """Count a 429/503 answer to a request sent at ``started`` (perf_counter).
+        
+        Requests already in flight when the previous one arrived belong to
+        the same burst and are not counted again.
+        """
+        if started < self._last_overload:
+            return False
+        self._last_overload = time.perf_counter()
+        return self.record_failure()
+
+def _add_missing_column(db: sqlite3.Connection, table: str, column: str):
+    """Add a TEXT column that databases written by older versions lack"""
+    if column not in {row[1] for row in db.execute(f'PRAGMA table_info({table})')}:
+        db.execute(f'ALTER TABLE {table} ADD COLUMN {column} TEXT')
+
+def _digest_json(digest: Optional[BodyDigest]) -> Optional[str]:
+    return json.dumps(asdict(digest)) if digest is not None else None
+
+def _digest_from_json(value: Optional[str]) -> Optional[BodyDigest]:
+    return BodyDigest(**json.loads(value)) if value else None
+
+def _work_key(target: str, path: str) -> int:
+    """Compact 64-bit key identifying a (target, path) work item"""
+    digest = hashlib.blake2b(f'{target}\0{path}'.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+class CheckpointJournal:
+    """Append-only SQLite (WAL) journal of completed (target, path) probes.
+    
+    Rows are buffered and committed in batches, one transaction per batch.
+    Probes that ended in an error are journaled but not treated as finished,
+    so a resumed scan retries them.  Findings and aliases keep their body
+    digest, so a resumed scan goes on merging duplicates into them.
+    """
+    
+    BATCH_SIZE = 200
+    
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self._pending: List[Tuple[str, str, str, Optional[str], Optional[str]]] = []
+        # Shard workers share the journal; wait for each other's commits like ScanHistory
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS journal ('
+            'target TEXT NOT NULL, path TEXT NOT NULL, outcome TEXT NOT NULL, result TEXT, digest TEXT, '
+            'PRIMARY KEY (target, path)) WITHOUT ROWID'
+        )
+        _add_missing_column(self._db, 'journal', 'digest')
+        if not resume:
+            self._db.execute('DELETE FROM journal')
+        self._db.commit()
+    
+    def load(self) -> Tuple[set, List[ScanResult], Dict[str, Tuple[Optional[str], Optional[BodyDigest]]]]:
+        """Return (keys of finished work items, results found so far, and the
+        redirect target and digest of every finding and alias URL)"""
+        finished = set()
+        found: Dict[str, ScanResult] = {}
+        members: Dict[str, Tuple[Optional[str], Optional[BodyDigest]]] = {}
+        aliases: List[Tuple[str, str]] = []
+        rows = self._db.execute(
+            "SELECT target, path, outcome, result, digest FROM journal WHERE outcome != 'error'")
+        for target, path, outcome, result, digest in rows:
+            finished.add(_work_key(target, path))
+            if outcome == 'found' and result:
+                restored = ScanResult(**json.loads(result))
+                found[restored.url] = restored
+                members[restored.url] = (restored.redirect_url, _digest_from_json(digest))
+            elif outcome == 'alias' and result:
+                # Alias rows hold the URL of the finding they duplicate
+                alias_of = json.loads(result)
+                url = urljoin(target + '/', path)
+                aliases.append((alias_of['url'], url))
+                members[url] = (alias_of.get('redirect_url'), _digest_from_json(digest))
+        for url, alias in aliases:
+            if url in found and alias not in found[url].aliases:
+                found[url].aliases.append(alias)
+        return finished, list(found.values()), members
+    
+    def record(self, target: str, path: str, outcome: str, result: Optional[ScanResult] = None,
+               digest: Optional[BodyDigest] = None, alias_of: Optional[ScanResult] = None):
+        """Queue a completed probe, committing once a batch is full"""
+        if alias_of is not None:
+            payload = json.dumps({'url': alias_of.url, 'redirect_url': result.redirect_url}, ensure_ascii=False)
+        else:
+            payload = json.dumps(asdict(result), ensure_ascii=False) if result is not None else None
+        self._pending.append((target, path, outcome, payload, _digest_json(digest)))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Commit all queued records in a single transaction"""
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO journal (target, path, outcome, result, digest) '
+                                 'VALUES (?, ?, ?, ?, ?)', self._pending)
+        self._pending.clear()
+    
+    def close(self):
+        """Flush outstanding records and close the database"""
+        self.flush()
+        self._db.close()
+
+# Consecutive scans a path must be dead in before rescans skip it
+DEFAULT_DEAD_AFTER = 3
+# Share of skippable dead paths still probed on a rescan
+DEFAULT_EXPLORE_RATE = 0.1
+# Result fields compared to decide whether a panel changed between scans
+DIFF_FIELDS = ('status_code', 'redirect_url', 'title', 'classification')
+
+class ScanHistory:
+    """Persistent per-(target, path) outcomes across scans for incremental rescans.
+    
+    Keeps the last result, body digest and validators (ETag/Last-Modified)
+    of every panel and a dead streak for every miss.  Rows touched by the current
+    scan are stamped with its id, so the diff against the state before the
+    scan can be computed from the database alone, even when several worker
+    processes write to it.
+    """
+    
+    BATCH_SIZE = 200
+    
+    def __init__(self, path: str, dead_after: int = DEFAULT_DEAD_AFTER, scan_id: Optional[int] = None):
+        self.path = path
+        self.dead_after = dead_after
+        self._pending: List[Tuple] = []
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS scans (id INTEGER PRIMARY KEY, started TEXT NOT NULL)')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS paths ('
+            'target TEXT NOT NULL, path TEXT NOT NULL, outcome TEXT NOT NULL, '
+            'dead_streak INTEGER NOT NULL DEFAULT 0, etag TEXT, last_modified TEXT, result TEXT, '
+            'scan INTEGER NOT NULL, digest TEXT, PRIMARY KEY (target, path)) WITHOUT ROWID'
+        )
+        _add_missing_column(self._db, 'paths', 'digest')
+        if scan_id is None:
+            with self._db:
+                scan_id = self._db.execute('INSERT INTO scans (started) VALUES (?)',
+                                           (datetime.now().isoformat(),)).lastrowid
+        self.scan_id = scan_id
+        self.previous_scans = self._db.execute('SELECT COUNT(*) FROM scans WHERE id < ?',
+                                               (scan_id,)).fetchone()[0]
+        
+        # Rows written by the current scan (other shards) are not "previous"
+        self.dead = set()
+        self.panels: Dict[int, Tuple[str, str, str, Optional[str], Optional[str], Optional[str],
+                                     Optional[str]]] = {}
+        rows = self._db.execute('SELECT target, path, outcome, dead_streak, etag, last_modified, result, digest '
+                                'FROM paths WHERE scan != ?', (scan_id,))
+        for target, path, outcome, dead_streak, etag, last_modified, result, digest in rows:
+            if outcome == 'miss':
+                if dead_streak >= dead_after:
+                    self.dead.add(_work_key(target, path))
+            else:
+                self.panels[_work_key(target, path)] = (target, path, outcome, etag, last_modified, result,
+                                                        digest)
+    
+    def conditional_headers(self, target: str, path: str) -> Dict[str, str]:
+        """If-None-Match/If-Modified-Since for a previously found panel"""
+        panel = self.panels.get(_work_key(target, path))
+        if panel is None or panel[2] != 'found' or not panel[5]:
+            return {}
+        headers = {}
+        if panel[3]:
+            headers['If-None-Match'] = panel[3]
+        if panel[4]:
+            headers['If-Modified-Since'] = panel[4]
+        return headers
+    
+    def previous_result(self, target: str, path: str) -> Optional[Tuple[ScanResult, Optional[BodyDigest]]]:
+        """Result and body digest stored for a panel by an earlier scan"""
+        panel = self.panels.get(_work_key(target, path))
+        if panel is None or not panel[5]:
+            return None
+        return ScanResult(**json.loads(panel[5])), _digest_from_json(panel[6])
+    
+    def record(self, target: str, path: str, outcome: str, result: Optional[ScanResult] = None,
+               digest: Optional[BodyDigest] = None):
+        """Queue a probe outcome ('found', 'alias' or 'miss'), committing in batches"""
+        payload = json.dumps(asdict(result), ensure_ascii=False) if result is not None else None
+        self._pending.append((target, path, outcome, result.etag if result else None,
+                              result.last_modified if result else None, payload, self.scan_id,
+                              _digest_json(digest)))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Upsert all queued outcomes in one transaction"""
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO paths (target, path, outcome, dead_streak, etag, last_modified, result, scan, digest) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (target, path) DO UPDATE SET "
+                "outcome = excluded.outcome, etag = excluded.etag, last_modified = excluded.last_modified, "
+                "result = excluded.result, scan = excluded.scan, digest = excluded.digest, "
+                "dead_streak = CASE WHEN excluded.outcome = 'miss' THEN dead_streak + 1 ELSE 0 END",
+                [(target, path, outcome, int(outcome == 'miss'), etag, last_modified, result, scan, digest)
+                 for target, path, outcome, etag, last_modified, result, scan, digest in self._pending]
+            )
+        self._pending.clear()
+    
+    def diff(self) -> Dict[str, List[Dict]]:
+        """New, changed and disappeared panels of this scan versus the previous state"""
+        self.flush()
+        diff: Dict[str, List[Dict]] = {'new': [], 'changed': [], 'disappeared': []}
+        rows = self._db.execute('SELECT target, path, outcome, result FROM paths WHERE scan = ?',
+                                (self.scan_id,))
+        for target, path, outcome, result in rows:
+            before = self.panels.get(_work_key(target, path))
+            url = urljoin(target + '/', path)
+            if outcome == 'found':
+                current = json.loads(result)
+                if before is None:
+                    diff['new'].append(current)
+                elif before[2] == 'found' and before[5]:
+                    previous = json.loads(before[5])
+                    changes = {name: [previous.get(name), current.get(name)] for name in DIFF_FIELDS
+                               if previous.get(name) != current.get(name)}
+                    if changes:
+                        diff['changed'].append({'url': url, 'changes': changes})
+            elif outcome == 'miss' and before is not None:
+                diff['disappeared'].append({'url': url, 'target': target})
+        return diff
+    
+    def close(self):
+        self.flush()
+        self._db.close()
+
+def load_targets(source: str) -> List[str]:
+    """Read targets from a file (or stdin when source is '-'), one per line"""
+    handle = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8')
+    try:
+        targets = []
+        for line in handle:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                targets.append(line)
+        return targets
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+# Seconds a failed (NXDOMAIN) lookup stays cached
+NEGATIVE_DNS_TTL = 60
+# getaddrinfo error codes meaning the name does not exist
+NXDOMAIN_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+class NXDomainError(Exception):
+    """Raised by resolvers when a host name does not exist"""
+
+class SystemResolver:
+    """Resolve host names through the event loop's getaddrinfo"""
+    
+    async def resolve_host(self, host: str) -> List[str]:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, None, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if e.errno in NXDOMAIN_ERRORS:
+                raise NXDomainError(host) from e
+            raise
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+class StaticResolver:
+    """Stub resolver answering from a fixed host -> addresses mapping.
+    
+    Hosts missing from the mapping are NXDOMAIN unless a fallback resolver
+    is given, which makes it usable both for tests and for --resolve pins.
+    """
+    
+    def __init__(self, mapping: Dict[str, Sequence[str]], fallback=None):
+        self.mapping = {host.lower(): list(addresses) for host, addresses in mapping.items()}
+        self.fallback = fallback
+    
+    def is_pinned(self, host: str) -> bool:
+        """Whether host is answered from the mapping rather than the fallback"""
+        return host.lower() in self.mapping
+    
+    async def resolve_host(self, host: str) -> List[str]:
+        addresses = self.mapping.get(host.lower())
+        if addresses is not None:
+            return addresses
+        if self.fallback is not None:
+            return await self.fallback.resolve_host(host)
+        raise NXDomainError(host)
+
+class DNSCache:
+    """Host -> addresses cache with per-entry expiry, optionally persisted
+    to SQLite.  An empty address list records a negative (NXDOMAIN) answer."""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, Tuple[List[str], float]] = {}
+        self._dirty: set = set()
+        if path:
+            with contextlib.closing(sqlite3.connect(path)) as db:
+                db.execute('CREATE TABLE IF NOT EXISTS dns ('
+                           'host TEXT PRIMARY KEY, addresses TEXT NOT NULL, expires REAL NOT NULL)')
+                now = time.time()
+                for host, addresses, expires in db.execute(
+                        'SELECT host, addresses, expires FROM dns WHERE expires > ?', (now,)):
+                    self._entries[host] = (json.loads(addresses), expires)
+    
+    def get(self, host: str) -> Optional[List[str]]:
+        """Cached addresses ([] for NXDOMAIN), or None on a miss or expired entry"""
+        entry = self._entries.get(host)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+    
+    def put(self, host: str, addresses: List[str], ttl: float, persist: bool = True):
+        self._entries[host] = (list(addresses), time.time() + ttl)
+        if persist:
+            self._dirty.add(host)
+    
+    def export(self) -> Dict[str, Tuple[List[str], float]]:
+        """Unexpired entries, e.g. to seed the cache of a worker process"""
+        now = time.time()
+        return {host: entry for host, entry in self._entries.items() if entry[1] > now}
+    
+    def seed(self, entries: Dict[str, Tuple[List[str], float]]):
+        """Add entries exported from another cache, without marking them for saving"""
+        self._entries.update(entries)
+    
+    def save(self):
+        """Write entries changed since loading back to disk"""
+        if not self.path or not self._dirty:
+            return
+        with contextlib.closing(sqlite3.connect(self.path)) as db, db:
+            db.executemany('INSERT OR REPLACE INTO dns VALUES (?, ?, ?)', [
+                (host, json.dumps(self._entries[host][0]), self._entries[host][1])
+                for host in self._dirty
+            ])
+            db.execute('DELETE FROM dns WHERE expires <= ?', (time.time(),))
+        self._dirty.clear()
+
+class CachedResolver:
+    """aiohttp connector resolver (the AbstractResolver interface) backed by
+    a DNSCache and a pluggable upstream resolver (any object with an async
+    resolve_host(host) method)"""
+    
+    def __init__(self, cache: DNSCache, upstream=None, ttl: float = 300):
+        self.cache = cache
+        self.upstream = upstream or SystemResolver()
+        self.ttl = ttl
+    
+    async def lookup(self, host: str) -> List[str]:
+        """Addresses for host, consulting the cache first; [] means NXDOMAIN"""
+        addresses = self.cache.get(host)
+        if addresses is not None:
+            return addresses
+        try:
+            addresses = await self.upstream.resolve_host(host)
+        except NXDomainError:
+            self.cache.put(host, [], NEGATIVE_DNS_TTL)
+            return []
+        if addresses:
+            # Pinned answers must not leak into later runs through the disk cache
+            is_pinned = getattr(self.upstream, 'is_pinned', None)
+            self.cache.put(host, addresses, self.ttl, persist=not (is_pinned and is_pinned(host)))
+        return addresses
+    
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict]:
+        addresses = await self.lookup(host)
+        if not addresses:
+            raise OSError(f"Could not resolve host {host}")
+        results = []
+        for address in addresses:
+            address_family = socket.AF_INET6 if ipaddress.ip_address(address).version == 6 else socket.AF_INET
+            if family not in (socket.AF_UNSPEC, address_family):
+                continue
+            results.append({
+                'hostname': host, 'host': address, 'port': port,
+                'family': address_family, 'proto': 0, 'flags': socket.AI_NUMERICHOST,
+            })
+        if not results:
+            raise OSError(f"No addresses of the requested family for {host}")
+        return results
+    
+    async def close(self):
+        pass
+
+def _is_ip_literal(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+# Suffixes appended to file-like paths when backup expansion is enabled
+BACKUP_SUFFIXES = ('.bak', '.old', '.orig', '.save', '~')
+# Default sizing of the Bloom filter used for wordlist deduplication
+DEFAULT_BLOOM_CAPACITY = 2_000_000
+DEFAULT_BLOOM_ERROR_RATE = 1e-6
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing"""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def add(self, item: str) -> bool:
+        """Add an item; return True if it was (probably) already present"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        present = True
+        for i in range(self.hashes):
+            bit = (h1 + i * h2) % self.size
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self._bits[byte] & mask:
+                present = False
+                self._bits[byte] |= mask
+        return present
+    
+    def __contains__(self, item: str) -> bool:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return all(self._bits[bit >> 3] & (1 << (bit & 7))
+                   for bit in ((h1 + i * h2) % self.size for i in range(self.hashes)))
+
+class _HashSet:
+    """Exact dedup set storing 64-bit digests instead of the strings themselves"""
+    
+    def __init__(self):
+        self._seen = set()
+    
+    def add(self, item: str) -> bool:
+        """Add an item; return True if it was already present"""
+        key = hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest()
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        return False
+    
+    def __contains__(self, item: str) -> bool:
+        return hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest() in self._seen
+
+class Wordlist:
+    """Lazily streamed, deduplicated and expanded path wordlist.
+    
+    Paths come from files (plain or gzip, "-" for stdin) or an in-memory
+    sequence.  Expansions (extensions, trailing slash, case and backup
+    variants) are generated per entry and filtered through a compact dedup
+    structure, so an expanded list never has to be held in memory.
+    """
+    
+    def __init__(self, sources: Sequence[str] = (), paths: Optional[Iterable[str]] = None,
+                 extensions: Sequence[str] = (), trailing_slash: bool = False,
+                 case_variants: bool = False, backup_suffixes: bool = False,
+                 bloom: bool = False, bloom_capacity: int = DEFAULT_BLOOM_CAPACITY):
+        if not sources and paths is None:
+            raise ValueError("Wordlist needs at least one source file or a list of paths")
+        self.sources = list(sources)
+        self.paths = paths
+        self.extensions = [ext.strip().lstrip('.') for ext in extensions if ext.strip()]
+        self.trailing_slash = trailing_slash
+        self.case_variants = case_variants
+        self.backup_suffixes = backup_suffixes
+        self.bloom = bloom
+        self.bloom_capacity = bloom_capacity
+    
+    @property
+    def reusable(self) -> bool:
+        """Whether the wordlist can be iterated more than once (not stdin or a one-shot iterator)"""
+        if '-' in self.sources:
+            return False
+        return self.paths is None or iter(self.paths) is not self.paths
+    
+    def describe(self) -> str:
+        """Short description for banners and reports"""
+        if self.sources:
+            label = f"{len(self.sources)} wordlist file(s)"
+        else:
+            label = f"{len(self.paths)}" if hasattr(self.paths, '__len__') else "custom list"
+        if self.extensions or self.trailing_slash or self.case_variants or self.backup_suffixes:
+            label += " + expansions"
+        return label
+    
+    @contextlib.contextmanager
+    def _open(self, source: str) -> Iterator[Iterable[str]]:
+        """Open a wordlist file as text, transparently decompressing gzip.
+        
+        The file is opened once and the gzip magic peeked from its buffer,
+        so pipes and process substitutions are read only once.
+        """
+        if source == '-':
+            yield sys.stdin
+            return
+        with open(source, 'rb') as raw:
+            stream = gzip.GzipFile(fileobj=raw) if raw.peek(2)[:2] == b'\x1f\x8b' else raw
+            with io.TextIOWrapper(stream, encoding='utf-8', errors='replace') as handle:
+                yield handle
+    
+    def _raw(self) -> Iterator[str]:
+        """Yield base entries from every source"""
+        if self.paths is not None:
+            yield from self.paths
+        for source in self.sources:
+            with self._open(source) as handle:
+                for line in handle:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        yield line
+    
+    def _expand(self, path: str) -> Iterator[str]:
+        """Yield a base entry followed by its configured expansions"""
+        yield path
+        stem = path.rstrip('/')
+        is_dir = path.endswith('/')
+        has_ext = '.' in stem.rsplit('/', 1)[-1]
+        
+        if self.case_variants:
+            for variant in (stem.lower(), stem.upper(), stem.capitalize()):
+                yield variant + '/' if is_dir else variant
+        if not has_ext and not is_dir:
+            for ext in self.extensions:
+                yield f"{stem}.{ext}"
+            if self.trailing_slash:
+                yield stem + '/'
+        if self.backup_suffixes and has_ext:
+            for suffix in BACKUP_SUFFIXES:
+                yield stem + suffix
+    
+    def dedup_set(self):
+        """Fresh dedup structure of the kind this wordlist is configured for"""
+        return BloomFilter(self.bloom_capacity, DEFAULT_BLOOM_ERROR_RATE) if self.bloom else _HashSet()
+    
+    def __iter__(self) -> Iterator[str]:
+        return self.stream(self.dedup_set())
+    
+    def stream(self, seen) -> Iterator[str]:
+        """Iterate the wordlist, recording every yielded path in ``seen``"""
+        for base in self._raw():
+            base = base.lstrip('/')
+            if not base:
+                continue
+            for path in self._expand(base):
+                if not seen.add(path):
+                    yield path
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """Fixed-bucket latency histogram (Prometheus-style, cumulative on export)"""
+    
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile"""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+    
+    def snapshot(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'buckets': dict(zip([str(b) for b in self.buckets] + ['+Inf'], self.counts)),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+class ScanMetrics:
+    """Per-phase timers, status/error counters and in-flight gauge for a scan.
+    
+    DNS, connect and time-to-first-byte come from aiohttp trace hooks (other
+    transports report requests through request_started/finished/failed);
+    body read and analysis are timed by the scanner.  aiohttp reports TCP connect
+    and TLS handshake as one connection-create event, so "connect" covers both.
+    """
+    
+    PHASES = ('dns', 'connect', 'ttfb', 'body', 'analysis')
+    
+    def __init__(self):
+        self.started = time.time()
+        self.phases = {phase: Histogram() for phase in self.PHASES}
+        self.requests = 0
+        self.in_flight = 0
+        self.statuses: collections.Counter = collections.Counter()
+        self.errors: collections.Counter = collections.Counter()
+        self.counters: collections.Counter = collections.Counter()
+    
+    def observe(self, phase: str, seconds: float):
+        self.phases[phase].observe(seconds)
+    
+    def request_started(self):
+        self.requests += 1
+        self.in_flight += 1
+    
+    def request_finished(self, status: int, elapsed: float):
+        self.in_flight -= 1
+        self.observe('ttfb', elapsed)
+        self.statuses[status] += 1
+    
+    def request_failed(self, error: BaseException):
+        self.in_flight -= 1
+        self.errors[type(error).__name__] += 1
+    
+    def trace_config(self) -> 'aiohttp.TraceConfig':
+        """aiohttp TraceConfig feeding this collector"""
+        trace = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, ctx, params):
+            ctx.request_started = time.perf_counter()
+            self.request_started()
+        
+        async def on_request_end(session, ctx, params):
+            self.request_finished(params.response.status, time.perf_counter() - ctx.request_started)
+        
+        async def on_request_exception(session, ctx, params):
+            self.request_failed(params.exception)
+        
+        async def on_dns_start(session, ctx, params):
+            ctx.dns_started = time.perf_counter()
+        
+        async def on_dns_end(session, ctx, params):
+            self.observe('dns', time.perf_counter() - ctx.dns_started)
+        
+        async def on_connect_start(session, ctx, params):
+            ctx.connect_started = time.perf_counter()
+        
+        async def on_connect_end(session, ctx, params):
+            self.observe('connect', time.perf_counter() - ctx.connect_started)
+        
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        return trace
+    
+    @classmethod
+    def combine(cls, snapshots: Iterable[Dict], started: Optional[float] = None) -> 'ScanMetrics':
+        """Sum snapshots taken in several processes into one collector"""
+        merged = cls()
+        if started is not None:
+            merged.started = started
+        for snapshot in snapshots:
+            merged.requests += snapshot['requests']
+            merged.in_flight += snapshot['in_flight']
+            merged.statuses.update({int(status): count for status, count in snapshot['statuses'].items()})
+            merged.errors.update(snapshot['errors'])
+            merged.counters.update(snapshot['counters'])
+            for phase, data in snapshot['phases'].items():
+                histogram = merged.phases[phase]
+                histogram.counts = [a + b for a, b in zip(histogram.counts, data['buckets'].values())]
+                histogram.sum += data['sum']
+                histogram.count += data['count']
+        return merged
+    
+    def snapshot(self) -> Dict:
+        """Point-in-time view of every metric as plain JSON-able data"""
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'uptime': round(time.time() - self.started, 3),
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'errors': dict(self.errors),
+            'counters': dict(self.counters),
+            'phases': {phase: histogram.snapshot() for phase, histogram in self.phases.items()},
+        }
+    
+    def prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format"""
+        lines = [
+            '# TYPE admin_finder_requests_total counter',
+            f'admin_finder_requests_total {self.requests}',
+            '# TYPE admin_finder_in_flight gauge',
+            f'admin_finder_in_flight {self.in_flight}',
+            '# TYPE admin_finder_responses_total counter',
+        ]
+        lines += [f'admin_finder_responses_total{{status="{status}"}} {count}'
+                  for status, count in sorted(self.statuses.items())]
+        lines.append('# TYPE admin_finder_errors_total counter')
+        lines += [f'admin_finder_errors_total{{type="{error}"}} {count}'
+                  for error, count in sorted(self.errors.items())]
+        lines.append('# TYPE admin_finder_events_total counter')
+        lines += [f'admin_finder_events_total{{event="{event}"}} {count}'
+                  for event, count in sorted(self.counters.items())]
+        lines.append('# TYPE admin_finder_phase_seconds histogram')
+        for phase, histogram in self.phases.items():
+            cumulative = 0
+            for bound, count in zip(list(histogram.buckets) + ['+Inf'], histogram.counts):
+                cumulative += count
+                lines.append(f'admin_finder_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+            lines.append(f'admin_finder_phase_seconds_sum{{phase="{phase}"}} {histogram.sum:.6f}')
+            lines.append(f'admin_finder_phase_seconds_count{{phase="{phase}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+class MetricsExporter:
+    """Periodic JSON snapshots to a file and/or a local Prometheus endpoint"""
+    
+    def __init__(self, metrics: ScanMetrics, path: Optional[str] = None,
+                 interval: float = 10.0, port: Optional[int] = None):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.port = port
+        self._task: Optional[asyncio.Task] = None
+        self._runner = None
+    
+    async def start(self):
+        if self.path:
+            self._task = asyncio.ensure_future(self._write_periodically())
+        if self.port:
+            from aiohttp import web
+            app = web.Application()
+            app.router.add_get('/metrics', self._serve_prometheus)
+            self._runner = web.AppRunner(app, access_log=None)
+            await self._runner.setup()
+            await web.TCPSite(self._runner, '127.0.0.1', self.port).start()
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._write_snapshot()
+        if self._runner is not None:
+            await self._runner.cleanup()
+    
+    async def _serve_prometheus(self, request):
+        from aiohttp import web
+        return web.Response(text=self.metrics.prometheus(), content_type='text/plain')
+    
+    async def _write_periodically(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self._write_snapshot()
+    
+    def _write_snapshot(self):
+        """Append one snapshot as a JSON line"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.metrics.snapshot()) + '\n')
+
+# Column order shared by the CSV and SQLite sinks
+RESULT_FIELDS = ('url', 'status_code', 'response_time', 'redirect_url', 'content_length',
+                 'server', 'title', 'admin_indicators', 'score', 'classification', 'target', 'aliases')
+
+def _result_row(result: ScanResult) -> Tuple:
+    """Flatten a result into RESULT_FIELDS order"""
+    return (result.url, result.status_code, round(result.response_time, 4), result.redirect_url,
+            result.content_length, result.server, result.title, ', '.join(result.admin_indicators),
+            result.score, result.classification, result.target, ', '.join(result.aliases))
+
+class ResultSink:
+    """Receives each result as soon as it is found.
+    
+    Sinks are opened before the scan starts, get write() per result and are
+    closed with a scan_info dict (targets, timing, counts) once it ends.
+    alias() reports a later path found to serve an already written result.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+    
+    def open(self):
+        pass
+    
+    def write(self, result: ScanResult):
+        raise NotImplementedError
+    
+    def alias(self, result: ScanResult, url: str):
+        pass
+    
+    def close(self, scan_info: Dict):
+        pass
+
+class CallbackSink(ResultSink):
+    """Adapts a plain callable to the sink interface"""
+    
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+    
+    def write(self, result: ScanResult):
+        self.callback(result)
+
+class NDJSONSink(ResultSink):
+    """One JSON object per line, flushed immediately so the file can be tailed"""
+    
+    def open(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+    
+    def write(self, result: ScanResult):
+        self._file.write(json.dumps(asdict(result), ensure_ascii=False) + '\n')
+        self._file.flush()
+    
+    def alias(self, result: ScanResult, url: str):
+        self._file.write(json.dumps({'url': url, 'alias_of': result.url}, ensure_ascii=False) + '\n')
+        self._file.flush()
+    
+    def close(self, scan_info: Dict):
+        self._file.close()
+
+class JSONSink(ResultSink):
+    """JSON report whose results array is streamed, with scan_info appended at the end"""
+    
+    def open(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('{\n  "results": [')
+        self._count = 0
+    
+    def write(self, result: ScanResult):
+        separator = ',' if self._count else ''
+        self._file.write(f"{separator}\n    {json.dumps(asdict(result), ensure_ascii=False)}")
+        self._file.flush()
+        self._count += 1
+    
+    def close(self, scan_info: Dict):
+        info = json.dumps(scan_info, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        self._file.write(f"\n  ],\n  \"scan_info\": {info}\n}}\n")
+        self._file.close()
+
+class CSVSink(ResultSink):
+    """CSV with one flushed row per result"""
+    
+    HEADER = ['URL', 'Status Code', 'Response Time (s)', 'Redirect URL', 'Content Length',
+              'Server', 'Title', 'Admin Indicators', 'Score', 'Type', 'Target', 'Aliases']
+    
+    def open(self):
+        import csv
+        self._file = open(self.path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.HEADER)
+        self._file.flush()
+    
+    def write(self, result: ScanResult):
+        row = list(_result_row(result))
+        row[2] = f"{result.response_time:.2f}"
+        self._writer.writerow(['' if value is None else value for value in row])
+        self._file.flush()
+    
+    def close(self, scan_info: Dict):
+        self._file.close()
+
+class TextSink(ResultSink):
+    """Plain text report written entry by entry"""
+    
+    def open(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write("Admin Panel Discovery Report\n")
+        self._file.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._file.write("=" * 60 + "\n\n")
+        self._count = 0
+    
+    def write(self, result: ScanResult):
+        self._count += 1
+        f = self._file
+        f.write(f"{self._count}. {result.url}\n")
+        f.write(f"   Status: {result.status_code}\n")
+        f.write(f"   Response Time: {result.response_time:.2f}s\n")
+        if result.title:
+            f.write(f"   Title: {result.title}\n")
+        if result.server:
+            f.write(f"   Server: {result.server}\n")
+        if result.redirect_url:
+            f.write(f"   Redirect: {result.redirect_url}\n")
+        f.write("\n")
+        f.flush()
+    
+    def close(self, scan_info: Dict):
+        aliases = scan_info.get('aliases') or {}
+        if aliases:
+            self._file.write("Same page also served at:\n")
+            for url, others in aliases.items():
+                self._file.write(f"   {url}\n")
+                for other in others:
+                    self._file.write(f"      = {other}\n")
+            self._file.write("\n")
+        self._file.write("=" * 60 + "\n")
+        self._file.write(f"Target: {scan_info['target_label']}\n")
+        self._file.write(f"Panels Found: {scan_info['found_panels']}\n")
+        self._file.close()
+
+class SQLiteSink(ResultSink):
+    """SQLite results table filled in batched transactions"""
+    
+    BATCH_SIZE = 100
+    
+    def open(self):
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        # Replace an earlier run's results, like the file sinks do
+        self._db.execute('DROP TABLE IF EXISTS results')
+        self._db.execute('DROP TABLE IF EXISTS scan_info')
+        self._db.execute(f"CREATE TABLE results ({', '.join(RESULT_FIELDS)})")
+        self._db.execute('CREATE TABLE scan_info (key TEXT PRIMARY KEY, value TEXT)')
+        self._db.commit()
+        self._pending: List[Tuple] = []
+    
+    def write(self, result: ScanResult):
+        self._pending.append(_result_row(result))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+    
+    def alias(self, result: ScanResult, url: str):
+        self.flush()
+        with self._db:
+            self._db.execute('UPDATE results SET aliases = ? WHERE url = ? AND target IS ?',
+                             (', '.join(result.aliases), result.url, result.target))
+    
+    def flush(self):
+        """Insert all queued rows in one transaction"""
+        if not self._pending:
+            return
+        placeholders = ', '.join('?' * len(RESULT_FIELDS))
+        with self._db:
+            self._db.executemany(f'INSERT INTO results VALUES ({placeholders})', self._pending)
+        self._pending.clear()
+    
+    def rows(self) -> Iterator[Dict]:
+        """Iterate stored results as dicts, in insertion order"""
+        self.flush()
+        cursor = self._db.execute(f"SELECT {', '.join(RESULT_FIELDS)} FROM results ORDER BY rowid")
+        for row in cursor:
+            yield dict(zip(RESULT_FIELDS, row))
+    
+    def close(self, scan_info: Dict):
+        self.flush()
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO scan_info VALUES (?, ?)',
+                                 [(key, json.dumps(value)) for key, value in scan_info.items()])
+        self._db.close()
+
+class HTMLSink(ResultSink):
+    """HTML report rendered at the end from a temporary SQLite result store"""
+    
+    def open(self):
+        handle, self._store_path = tempfile.mkstemp(suffix='.sqlite', prefix='admin_finder_')
+        os.close(handle)
+        self._store = SQLiteSink(self._store_path)
+        self._store.open()
+    
+    def write(self, result: ScanResult):
+        self._store.write(result)
+    
+    def alias(self, result: ScanResult, url: str):
+        self._store.alias(result, url)
+    
+    def close(self, scan_info: Dict):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                self._render(f, scan_info)
+            self._store.close(scan_info)
+        finally:
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(self._store_path + suffix):
+                    os.remove(self._store_path + suffix)
+    
+    def _render(self, f, scan_info: Dict):
+        e = html.escape
+        f.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                "<title>Admin Panel Discovery Report</title><style>"
+                "body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;width:100%}"
+                "th,td{border:1px solid #ccc;padding:4px 8px;text-align:left;font-size:14px}"
+                "th{background:#222;color:#fff}tr:nth-child(even){background:#f4f4f4}"
+                "</style></head><body>\n")
+        f.write("<h1>Admin Panel Discovery Report</h1>\n<ul>\n")
+        f.write(f"<li>Target: {e(scan_info['target_label'])}</li>\n")
+        f.write(f"<li>Scan Date: {e(scan_info['timestamp'])}</li>\n")
+        f.write(f"<li>Panels Found: {scan_info['found_panels']}</li>\n")
+        f.write(f"<li>Duration: {scan_info['scan_duration']:.2f}s</li>\n</ul>\n")
+        f.write("<table><tr><th>#</th><th>URL</th><th>Status</th><th>Type</th><th>Title</th>"
+                "<th>Server</th><th>Indicators</th><th>Redirect</th><th>Aliases</th></tr>\n")
+        for i, row in enumerate(self._store.rows(), 1):
+            url = e(row['url'])
+            f.write(f"<tr><td>{i}</td><td><a href=\"{url}\">{url}</a></td><td>{row['status_code']}</td>"
+                    f"<td>{e(row['classification'] or '')}</td><td>{e(row['title'] or '')}</td>"
+                    f"<td>{e(row['server'] or '')}</td><td>{e(row['admin_indicators'] or '')}</td>"
+                    f"<td>{e(row['redirect_url'] or '')}</td><td>{e(row['aliases'] or '')}</td></tr>\n")
+        f.write("</table>\n</body></html>\n")
+
+class QueueSink(ResultSink):
+    """Forwards results and aliases over a multiprocessing queue to the parent scan.
+    
+    Body digests and redirect targets from the worker's clusterer travel
+    along, for findings and aliases alike, so the parent can merge
+    duplicates found by different workers.
+    """
+    
+    def __init__(self, channel):
+        super().__init__()
+        self.channel = channel
+        self.clusters: Optional['ResponseClusterer'] = None
+    
+    def _member(self, url: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """Redirect target and digest (as a dict) the worker's clusterer holds for url"""
+        if self.clusters is None:
+            return None, None
+        digest = self.clusters.digests.get(url)
+        return self.clusters.redirects.get(url), asdict(digest) if digest else None
+    
+    def write(self, result: ScanResult):
+        # Restored results arrive with their aliases already attached
+        aliases = [(alias, *self._member(alias)) for alias in result.aliases]
+        self.channel.put(('result', asdict(result), self._member(result.url)[1], aliases))
+    
+    def alias(self, result: ScanResult, url: str):
+        self.channel.put(('alias', result.url, url, *self._member(url)))
+
+class Transport:
+    """HTTP client backend shared by every probe of a scan.
+    
+    get() and head() take (url, headers=..., allow_redirects=...) and return
+    an async context manager yielding an aiohttp-style response (status,
+    headers, url, history, cookies, charset, content_length, content.read).
+    Network failures surface as asyncio.TimeoutError or
+    aiohttp.ClientConnectionError so retry handling is backend-agnostic.
+    """
+    
+    # Connections per host when no cap is given; None follows --per-host
+    default_connections: Optional[int] = None
+    
+    def __init__(self, limit: int, connections_per_host: int, timeout: float,
+                 ssl_context: ssl.SSLContext, metrics: ScanMetrics,
+                 resolver: Optional[CachedResolver] = None, trace_configs: Sequence = ()):
+        self.limit = limit
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.metrics = metrics
+        self.resolver = resolver
+        self.trace_configs = list(trace_configs)
+    
+    @classmethod
+    def check(cls):
+        """Raise ValueError when the backend's dependencies are missing"""
+    
+    async def open(self):
+        raise NotImplementedError
+    
+    async def close(self):
+        pass
+    
+    def get(self, url, headers: Dict[str, str], allow_redirects: bool = True):
+        raise NotImplementedError
+    
+    def head(self, url, headers: Dict[str, str], allow_redirects: bool = True):
+        raise NotImplementedError
+
+class AiohttpTransport(Transport):
+    """HTTP/1.1 keep-alive pool: one connection per in-flight request"""
+    
+    async def open(self):
+        # One connector (DNS cache, TLS context and keep-alive pool) is shared
+        # by every target; probes rely on its SSL context and the session timeout
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.connections_per_host,
+            resolver=self.resolver,
+            use_dns_cache=False,
+            ssl=self.ssl_context,
+            enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=self.trace_configs
+        )
+        # Hand out the session's own methods so probes pay no extra call
+        self.get = self._session.get
+        self.head = self._session.head
+    
+    async def close(self):
+        await self._session.close()
+
+class HTTP2Transport(Transport):
+    """httpx client multiplexing concurrent requests as HTTP/2 streams.
+    
+    httpx keeps a single HTTP/2 connection per origin, so a cap of N
+    connections per host is N clients used round-robin.  HTTP/2 is
+    negotiated via ALPN, so plain http:// targets and servers without h2
+    fall back to HTTP/1.1, bounded only by --per-host.  Requests bypass the
+    aiohttp resolver, so --resolve pins and the DNS cache do not apply.
+    """
+    
+    default_connections = 1
+    
+    @classmethod
+    def check(cls):
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+        except ImportError:
+            raise ValueError("The h2 transport requires httpx with HTTP/2 support: pip install 'httpx[http2]'")
+    
+    async def open(self):
+        import httpx
+        self._httpx = httpx
+        clients = max(1, self.connections_per_host)
+        limits = httpx.Limits(max_connections=max(1, self.limit // clients),
+                              max_keepalive_connections=max(1, self.limit // clients))
+        self._clients = [
+            httpx.AsyncClient(http2=True, verify=self.ssl_context, timeout=self.timeout,
+                              limits=limits, trust_env=False)
+            for _ in range(clients)
+        ]
+        self._next_client = itertools.cycle(self._clients)
+    
+    async def close(self):
+        await asyncio.gather(*(client.aclose() for client in self._clients), return_exceptions=True)
+    
+    def get(self, url, headers: Dict[str, str], allow_redirects: bool = True):
+        return _HTTPXRequest(self, next(self._next_client), 'GET', str(url), headers, allow_redirects)
+    
+    def head(self, url, headers: Dict[str, str], allow_redirects: bool = True):
+        return _HTTPXRequest(self, next(self._next_client), 'HEAD', str(url), headers, allow_redirects)
+    
+    def translate(self, error: Exception) -> Exception:
+        """Map an httpx error onto the aiohttp exception the scanner handles"""
+        if isinstance(error, self._httpx.TimeoutException):
+            return asyncio.TimeoutError(str(error))
+        if isinstance(error, self._httpx.TransportError):
+            return aiohttp.ClientConnectionError(str(error))
+        if isinstance(error, self._httpx.HTTPError):
+            return aiohttp.ClientError(str(error))
+        return error
+
+class _HTTPXRequest:
+    """Async context manager sending one streamed httpx request"""
+    
+    __slots__ = ('transport', 'client', 'method', 'url', 'headers', 'allow_redirects',
+                 'response', 'connect_started')
+    
+    def __init__(self, transport: HTTP2Transport, client, method: str, url: str,
+                 headers: Dict[str, str], allow_redirects: bool):
+        self.transport = transport
+        self.client = client
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.allow_redirects = allow_redirects
+        self.response = None
+        self.connect_started = None
+    
+    async def _trace(self, event: str, info: Dict):
+        # httpcore events mirror aiohttp's connection-create hooks
+        if event == 'connection.connect_tcp.started':
+            self.connect_started = time.perf_counter()
+        elif self.connect_started is not None and (
+                event == 'connection.start_tls.complete'
+                or (event == 'connection.connect_tcp.complete' and not self.url.startswith('https:'))):
+            self.transport.metrics.observe('connect', time.perf_counter() - self.connect_started)
+            self.connect_started = None
+    
+    async def __aenter__(self) -> '_HTTPXResponse':
+        metrics = self.transport.metrics
+        request = self.client.build_request(self.method, self.url, headers=self.headers,
+                                            extensions={'trace': self._trace})
+        metrics.request_started()
+        started = time.perf_counter()
+        try:
+            self.response = await self.client.send(request, stream=True,
+                                                   follow_redirects=self.allow_redirects)
+        except Exception as e:
+            metrics.request_failed(e)
+            raise self.transport.translate(e) from e
+        metrics.request_finished(self.response.status_code, time.perf_counter() - started)
+        return _HTTPXResponse(self.response, self.transport)
+    
+    async def __aexit__(self, *exc_info):
+        await self.response.aclose()
+
+class _HTTPXResponse:
+    """aiohttp-style view of an httpx response"""
+    
+    def __init__(self, response, transport: HTTP2Transport):
+        from yarl import URL
+        self.status = response.status_code
+        self.headers = response.headers
+        self.url = URL(str(response.url))
+        self.history = [_HTTPXResponse(previous, transport) for previous in response.history]
+        self.charset = response.charset_encoding
+        length = response.headers.get('Content-Length', '')
+        self.content_length = int(length) if length.isdigit() else None
+        self.content = _HTTPXContent(response, transport)
+        self._response = response
+    
+    @property
+    def cookies(self) -> SimpleCookie:
+        cookies = SimpleCookie()
+        for header in self._response.headers.get_list('set-cookie'):
+            with contextlib.suppress(CookieError):
+                cookies.load(header)
+        return cookies
+
+class _HTTPXContent:
+    """aiohttp StreamReader.read() over httpx's decoded byte iterator"""
+    
+    def __init__(self, response, transport: HTTP2Transport):
+        self._response = response
+        self._transport = transport
+        self._chunks = None
+        self._buffer = b''
+        self._done = False
+    
+    async def _fill(self):
+        if self._chunks is None:
+            self._chunks = self._response.aiter_bytes()
+        try:
+            self._buffer = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._buffer = b''
+            self._done = True
+        except Exception as e:
+            raise self._transport.translate(e) from e
+    
+    async def read(self, n: int = -1) -> bytes:
+        """Up to n buffered bytes (everything left when n < 0), b'' at EOF"""
+        if n < 0:
+            chunks = [self._buffer]
+            while not self._done:
+                await self._fill()
+                chunks.append(self._buffer)
+            self._buffer = b''
+            return b''.join(chunks)
+        while not self._buffer and not self._done:
+            await self._fill()
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
+
+# Client backends selectable with --transport
+TRANSPORTS = {
+    'aiohttp': AiohttpTransport,
+    'h2': HTTP2Transport,
+}
+
+# Characters a wordlist path may contain to be appended to the target verbatim
+PLAIN_PATH_PATTERN = re.compile(r"[A-Za-z0-9_~!$&'()*+,;=@%/.?-]*")
+
+def _is_plain_path(path: str) -> bool:
+    """Whether target + '/' + path equals urljoin(target + '/', path)"""
+    if not PLAIN_PATH_PATTERN.fullmatch(path) or path.startswith('/') or '//' in path:
+        return False
+    # Dot segments are resolved by urljoin
+    segments = path.split('?', 1)[0].split('/')
+    return '.' not in segments and '..' not in segments
+
+class RequestTemplate:
+    """Request pieces for one target, built once and shared by every probe.
+    
+    Header dicts are handed to aiohttp as-is, so they must not be mutated;
+    copy before adding per-request headers.
+    """
+    
+    __slots__ = ('target', 'prefix', 'base', 'headers', 'get_headers')
+    
+    def __init__(self, target: str, headers: Dict[str, str], get_headers: Dict[str, str]):
+        from yarl import URL
+        self.target = target
+        self.prefix = target + '/'
+        self.base = URL(self.prefix)
+        self.headers = headers
+        self.get_headers = get_headers
+    
+    def url(self, path: str) -> str:
+        """Absolute URL of a path, skipping urljoin for the common plain case"""
+        if _is_plain_path(path):
+            return self.prefix + path
+        return urljoin(self.prefix, path)
+
+# Recursion defaults: levels below a wordlist hit and discovered requests per target
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_RECURSION_BUDGET = 1000
+# Harvested links to these file types are never worth probing
+STATIC_EXTENSIONS = ('.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp',
+                     '.woff', '.woff2', '.ttf', '.eot', '.map', '.pdf', '.zip', '.mp4', '.mp3')
+LINK_PATTERN = re.compile(rb'<a\b[^>]*?\shref\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+FORM_ACTION_PATTERN = re.compile(rb'<form\b[^>]*?\saction\s*=\s*["\']?([^"\'\s>]*)', re.IGNORECASE)
+
+def harvest_links(body: bytes, base_url: str) -> Iterator[Tuple[str, bool]]:
+    """Yield (absolute URL, is_form_action) for links and form targets in a page"""
+    for pattern, is_form in ((FORM_ACTION_PATTERN, True), (LINK_PATTERN, False)):
+        for match in pattern.finditer(body):
+            reference = html.unescape(match.group(1).decode('utf-8', 'replace'))
+            if reference.startswith(('javascript:', 'mailto:', 'tel:', 'data:', '#')):
+                continue
+            yield urljoin(base_url, reference).split('#', 1)[0], is_form
+
+class URLFrontier:
+    """Priority frontier for paths discovered while scanning.
+    
+    Form actions come before links, and links before directory expansions,
+    shallower depths first.  A directory expansion is a cursor into one
+    deduplicated copy of the wordlist shared by every expansion and read
+    only as far as the furthest cursor, so a queued expansion costs an
+    index rather than a child list or dedup set.  Only discovered items
+    are recorded, as exact 64-bit digests; the budget of discovered
+    requests per target bounds that set.  Paths the base wordlist stream
+    has already yielded (``base``, set by the scanner) are not queued
+    again, and the stream skips paths the frontier got to first.  In a
+    path-sharded worker ``owns`` restricts expansions to the worker's slice.
+    """
+    
+    FORM, LINK, CHILD = 0, 1, 2
+    
+    def __init__(self, wordlist: 'Wordlist', max_depth: int = DEFAULT_MAX_DEPTH,
+                 budget: int = DEFAULT_RECURSION_BUDGET):
+        self.wordlist = wordlist
+        self.max_depth = max_depth
+        self.budget = budget
+        self.base = _HashSet()
+        self._visited = _HashSet()
+        self._heap: List[Tuple] = []
+        self._sequence = itertools.count()
+        self._spent: Dict[str, int] = {}
+        self._depths: Dict[int, int] = {}
+        self._entries: List[str] = []
+        self._source: Optional[Iterator[str]] = None
+        self.owns: Optional[Callable[[str, str], bool]] = None
+        self.discovered = 0
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def visit(self, target: str, path: str) -> bool:
+        """Mark a (target, path) as scheduled; return True if it was new"""
+        return not self._visited.add(f'{target}\0{path}')
+    
+    def visited(self, target: str, path: str) -> bool:
+        """Whether the frontier already scheduled a (target, path), without marking it"""
+        return f'{target}\0{path}' in self._visited
+    
+    def depth(self, target: str, path: str) -> int:
+        """Depth a path was discovered at (0 for wordlist entries)"""
+        return self._depths.get(_work_key(target, path), 0)
+    
+    def _exhausted(self, target: str) -> bool:
+        return self._spent.get(target, 0) >= self.budget
+    
+    def push(self, target: str, path: str, depth: int, kind: int):
+        """Queue one discovered path unless too deep, over budget or already seen"""
+        if depth > self.max_depth or self._exhausted(target) or path in self.base:
+            return
+        if not self.visit(target, path):
+            return
+        heapq.heappush(self._heap, (depth, kind, next(self._sequence), target, path, None))
+    
+    def visit_directory(self, target: str, base: str) -> bool:
+        """Mark a directory expansion as scheduled; return True if it was new"""
+        return self.visit(target, base + '\0dir')
+    
+    def push_directory(self, target: str, base: str, depth: int):
+        """Queue a lazy wordlist expansion under a confirmed directory"""
+        if depth > self.max_depth or self._exhausted(target) or not self.visit_directory(target, base):
+            return
+        heapq.heappush(self._heap, (depth, self.CHILD, next(self._sequence), target, base, [0]))
+    
+    def add(self, target: str, path: str, depth: int, kind: int):
+        """Queue a discovered path, or a directory expansion when kind is CHILD"""
+        if kind == self.CHILD:
+            self.push_directory(target, path, depth)
+        else:
+            self.push(target, path, depth, kind)
+    
+    def _entry(self, index: int) -> Optional[str]:
+        """Entry ``index`` of the shared deduplicated wordlist, read on demand"""
+        while index >= len(self._entries):
+            if self._source is None:
+                self._source = iter(self.wordlist)
+            entry = next(self._source, None)
+            if entry is None:
+                return None
+            self._entries.append(entry.lstrip('/'))
+        return self._entries[index]
+    
+    def _next_child(self, target: str, base: str, cursor: List[int]) -> Optional[str]:
+        """Advance an expansion's cursor to its next unseen child"""
+        while True:
+            entry = self._entry(cursor[0])
+            if entry is None:
+                return None
+            cursor[0] += 1
+            child = base + entry
+            if (child not in self.base and (self.owns is None or self.owns(target, child))
+                    and self.visit(target, child)):
+                return child
+    
+    def pop(self) -> Optional[Tuple[str, str]]:
+        """Next (target, path) to probe, or None when nothing is queued"""
+        while self._heap:
+            depth, kind, sequence, target, path, cursor = self._heap[0]
+            if self._exhausted(target):
+                heapq.heappop(self._heap)
+                continue
+            if cursor is None:
+                heapq.heappop(self._heap)
+            else:
+                # Directory expansions stay queued until their wordlist runs out
+                path = self._next_child(target, path, cursor)
+                if path is None:
+                    heapq.heappop(self._heap)
+                    continue
+            self._spent[target] = self._spent.get(target, 0) + 1
+            self._depths[_work_key(target, path)] = depth
+            self.discovered += 1
+            return target, path
+        return None
+
+# Output file extension -> sink type
+SINK_TYPES = {
+    '.json': JSONSink,
+    '.ndjson': NDJSONSink,
+    '.jsonl': NDJSONSink,
+    '.csv': CSVSink,
+    '.db': SQLiteSink,
+    '.sqlite': SQLiteSink,
+    '.sqlite3': SQLiteSink,
+    '.html': HTMLSink,
+    '.htm': HTMLSink,
+}
+
+def create_sink(path: str) -> ResultSink:
+    """Pick a sink for an output file based on its extension (plain text otherwise)"""
+    extension = os.path.splitext(path)[1].lower()
+    return SINK_TYPES.get(extension, TextSink)(path)
+
+# Technology markers: family -> header substrings, cookie names and body markers
+TECH_SIGNATURES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    'wordpress': {'headers': ('wp-json', 'wordpress'), 'cookies': ('wordpress_', 'wp-settings'),
+                  'body': ('/wp-content/', '/wp-includes/', 'wordpress')},
+    'joomla': {'headers': ('joomla',), 'cookies': (), 'body': ('/media/jui/', 'joomla', '/components/com_')},
+    'drupal': {'headers': ('drupal',), 'cookies': (), 'body': ('drupal.settings', '/sites/default/files', 'drupal')},
+    'aspnet': {'headers': ('asp.net', 'microsoft-iis'), 'cookies': ('asp.net_sessionid', '.aspxauth'),
+               'body': ('__viewstate', '.aspx')},
+    'java': {'headers': ('tomcat', 'jboss', 'wildfly', 'jetty', 'servlet', 'glassfish'),
+             'cookies': ('jsessionid',), 'body': ('.jsp', '.do"', 'apache tomcat')},
+    'php': {'headers': ('php',), 'cookies': ('phpsessid',), 'body': ('.php',)},
+    'hosting': {'headers': ('cpanel', 'plesk', 'directadmin'), 'cookies': ('cprelogin', 'plesk'),
+                'body': ('cpanel', 'plesk', 'directadmin')},
+}
+
+# Paths worth probing first when a family is detected
+FAMILY_PATHS: Dict[str, Tuple[str, ...]] = {
+    'wordpress': ('wp-admin/', 'wp-login.php', 'wp-admin', 'wp-admin/admin-ajax.php'),
+    'joomla': ('administrator/', 'administrator/index.php', 'administrator'),
+    'drupal': ('user/login', 'admin/', 'user', 'admin/config'),
+    'aspnet': ('admin.aspx', 'admin/login.aspx', 'admin/', 'umbraco', 'login.aspx'),
+    'java': ('manager/html', 'tomcat/manager', 'jmx-console', 'web-console', 'admin-console', 'console'),
+    'php': ('admin.php', 'admin/index.php', 'login.php', 'phpmyadmin', 'pma', 'adminer.php'),
+    'hosting': ('cpanel', 'plesk', 'directadmin', 'webmin', 'usermin'),
+}
+
+# Which paths belong to a family, used for pruning
+FAMILY_PATTERNS: Dict[str, 're.Pattern'] = {
+    'wordpress': re.compile(r'(^|/)(wp-|bb-admin)', re.IGNORECASE),
+    'joomla': re.compile(r'^administrator(/|$)', re.IGNORECASE),
+    'aspnet': re.compile(r'\.(aspx?|ashx|asmx)$', re.IGNORECASE),
+    'java': re.compile(r'(\.(jsp|do|action)$|^(manager/html|tomcat|jmx-console|web-console))', re.IGNORECASE),
+    'php': re.compile(r'\.php$', re.IGNORECASE),
+}
+
+# Families that rule each other out: detecting one prunes the others' paths
+EXCLUSIVE_FAMILIES = (('wordpress', 'joomla', 'drupal'), ('aspnet', 'java', 'php'))
+
+# Score at or above which a hit counts as confident for early exit
+CONFIDENT_SCORE = 3.0
+
+META_GENERATOR_PATTERN = re.compile(
+    rb'<meta[^>]+name\s*=\s*["\']generator["\'][^>]+content\s*=\s*["\']([^"\']+)', re.IGNORECASE)
+
+def detect_technologies(headers: Dict[str, str], cookies: Iterable[str], body: bytes) -> List[str]:
+    """Return the technology families suggested by a root page response"""
+    header_text = ' '.join(f"{name}: {value}" for name, value in headers.items()).lower()
+    cookie_text = ' '.join(cookies).lower()
+    body_lower = body.lower()
+    generator = META_GENERATOR_PATTERN.search(body)
+    generator_text = generator.group(1).decode('utf-8', 'replace').lower() if generator else ''
     
-    @staticmethod
-    def disable():
-        """Disable colors for non-terminal output"""
-        Colors.HEADER = Colors.BLUE = Colors.CYAN = ''
-        Colors.GREEN = Colors.YELLOW = Colors.RED = ''
-        Colors.BOLD = Colors.UNDERLINE = Colors.RESET = ''
+    families = []
+    for family, markers in TECH_SIGNATURES.items():
+        if (any(marker in header_text for marker in markers['headers']) or
+                any(marker in cookie_text for marker in markers['cookies']) or
+                any(marker.encode() in body_lower for marker in markers['body']) or
+                family in generator_text):
+            families.append(family)
+    return families
+
+def _pruned_families(families: Sequence[str]) -> set:
+    """Families whose paths can be skipped given the detected ones"""
+    pruned = set()
+    for group in EXCLUSIVE_FAMILIES:
+        detected = [family for family in group if family in families]
+        if len(detected) == 1:
+            pruned.update(family for family in group if family != detected[0])
+    return {family for family in pruned if family in FAMILY_PATTERNS}
 
 @dataclass
-class ScanResult:
-    url: str
-    status_code: int
-    response_time: float
-    redirect_url: Optional[str]
-    content_length: int
-    server: Optional[str]
-    title: Optional[str]
-    admin_indicators: List[str]
+class ScanConfig:
+    """Every AdminPanelFinder option, with the CLI defaults.
+    
+    Build one directly for library use or let the CLI fill it from its
+    arguments; dataclasses.replace() derives variants, e.g. per shard.
+    """
+    targets: Sequence[str] = ()
+    wordlist: Optional[Wordlist] = None
+    threads: int = 20
+    per_host: Optional[int] = None
+    transport: object = 'aiohttp'
+    connections_per_host: Optional[int] = None
+    rate: Optional[float] = None
+    delay: float = 0
+    timeout: float = 10
+    follow_redirects: bool = True
+    verify_ssl: bool = False
+    adaptive: bool = True
+    retries: int = 2
+    retry_backoff: float = 0.5
+    breaker_threshold: int = DEFAULT_BREAKER_THRESHOLD
+    fingerprint: bool = True
+    prune: bool = False
+    early_exit: int = 0
+    calibrate: bool = True
+    dedup: bool = True
+    probe: str = 'get'
+    max_body: int = DEFAULT_MAX_BODY
+    indicators: Optional[Dict[str, float]] = None
+    analysis_workers: int = 0
+    analysis_mode: str = 'process'
+    recursive: bool = False
+    max_depth: int = DEFAULT_MAX_DEPTH
+    recursion_budget: int = DEFAULT_RECURSION_BUDGET
+    dns_cache: Optional[str] = None
+    dns_cache_ttl: float = 300
+    dns_concurrency: int = 100
+    resolver: Optional[object] = None
+    output: object = None
+    sinks: Sequence = ()
+    keep_results: bool = True
+    verbose: bool = False
+    trace_configs: Sequence = ()
+    metrics_file: Optional[str] = None
+    metrics_interval: float = 10.0
+    metrics_port: Optional[int] = None
+    checkpoint: Optional[str] = None
+    resume: bool = False
+    history: Optional[str] = None
+    history_scan: Optional[int] = None
+    dead_after: int = DEFAULT_DEAD_AFTER
+    explore: float = DEFAULT_EXPLORE_RATE
+    shard: Optional[Tuple[int, int]] = None
+
+# Console label colour for each reporter event kind
+EVENT_COLORS = {
+    'INFO': 'BLUE', 'SUCCESS': 'GREEN', 'TECH': 'CYAN', 'ALIAS': 'CYAN',
+    'WARNING': 'YELLOW', 'INTERRUPTED': 'YELLOW', 'WILDCARD': 'YELLOW', 'TIMEOUT': 'YELLOW', 'DNS': 'YELLOW',
+    'ERROR': 'RED', 'CRITICAL ERROR': 'RED', 'UNREACHABLE': 'RED', 'NXDOMAIN': 'RED',
+}
+
+class Reporter:
+    """Presentation hooks called by AdminPanelFinder; this base is silent.
+    
+    The scanner never prints itself: banner, progress events, findings and
+    the summary all go through its reporter, so library callers get a quiet
+    scan and the CLI plugs in ConsoleReporter.
+    """
+    
+    def banner(self, finder: 'AdminPanelFinder'):
+        pass
+    
+    def event(self, kind: str, message: str):
+        """A progress or diagnostic line; kind is e.g. INFO, ERROR, TIMEOUT"""
+    
+    def found(self, result: ScanResult):
+        """A new finding, reported as soon as it is confirmed"""
+    
+    def summary(self, finder: 'AdminPanelFinder'):
+        pass
+
+class ConsoleReporter(Reporter):
+    """Coloured terminal output: banner, events and the end-of-scan summary.
+    
+    Colours default to on only when stdout is a terminal; nothing global is
+    touched.  With live=True every finding is also printed as it arrives.
+    """
+    
+    def __init__(self, color: Optional[bool] = None, live: bool = False):
+        if color is None:
+            color = sys.stdout.isatty()
+        self.colors = Colors if color else NoColors
+        self.live = live
+    
+    def event(self, kind: str, message: str):
+        color = getattr(self.colors, EVENT_COLORS.get(kind, 'BLUE'))
+        print(f"{color}[{kind}]{self.colors.RESET} {message}")
+    
+    def banner(self, finder: 'AdminPanelFinder'):
+        """Display professional banner"""
+        c = self.colors
+        banner = f"""
+{c.CYAN}╔══════════════════════════════════════════════════════════════╗
+║              {c.BOLD}ADMIN PANEL DISCOVERY TOOL{c.RESET}{c.CYAN}                 ║
+║                     {c.YELLOW}Professional Edition{c.RESET}{c.CYAN}                    ║
+╚══════════════════════════════════════════════════════════════╝{c.RESET}
+
+{c.BLUE}Target:{c.RESET}     {c.BOLD}{finder.target_label()}{c.RESET}
+{c.BLUE}Threads:{c.RESET}    {c.BOLD}{finder.threads} ({finder.per_host} per host){c.RESET}
+{c.BLUE}Timeout:{c.RESET}    {c.BOLD}{finder.timeout}s{c.RESET}
+{c.BLUE}Paths:{c.RESET}      {c.BOLD}{finder.wordlist.describe()}{c.RESET}
+{c.BLUE}SSL Verify:{c.RESET} {c.BOLD}{'Yes' if finder.verify_ssl else 'No'}{c.RESET}
+
+{c.YELLOW}{'='*64}{c.RESET}
+"""
+        print(banner)
+
+    def found(self, result: ScanResult):
+        """Print a discovered admin panel as soon as it is confirmed"""
+        if not self.live:
+            return
+        c = self.colors
+        status_color = c.GREEN if result.status_code == 200 else c.YELLOW
+        print(f"{c.GREEN}[FOUND]{c.RESET} {result.url}")
+        print(f"  └─ Status: {status_color}{result.status_code}{c.RESET} | "
+              f"Time: {result.response_time:.2f}s | "
+              f"Size: {result.content_length} bytes")
+        
+        if result.title:
+            print(f"  └─ Title: {c.CYAN}{result.title}{c.RESET}")
+        
+        if result.redirect_url:
+            print(f"  └─ Redirect: {c.BLUE}{result.redirect_url}{c.RESET}")
+
+    def summary(self, finder: 'AdminPanelFinder'):
+        """Print comprehensive scan summary"""
+        c = self.colors
+        elapsed_time = time.time() - finder.start_time
+        
+        print(f"\n{c.CYAN}{'='*64}{c.RESET}")
+        print(f"{c.BOLD}SCAN SUMMARY{c.RESET}")
+        print(f"{c.CYAN}{'='*64}{c.RESET}")
+        
+        print(f"{c.BLUE}Target URL:{c.RESET}        {finder.target_label()}")
+        print(f"{c.BLUE}Total Requests:{c.RESET}    {finder.metrics.requests}")
+        failed = sum(finder.metrics.errors.values())
+        if failed:
+            errors = ', '.join(f"{name} {count}" for name, count in finder.metrics.errors.most_common(3))
+            print(f"{c.BLUE}Failed Requests:{c.RESET}   {c.RED}{failed}{c.RESET} ({errors})")
+        print(f"{c.BLUE}Admin Panels Found:{c.RESET} {c.GREEN}{finder.found_count}{c.RESET}")
+        if finder.wildcard_filtered:
+            print(f"{c.BLUE}Wildcard Filtered:{c.RESET} {finder.wildcard_filtered}")
+        if finder.duplicates_merged:
+            print(f"{c.BLUE}Duplicates Merged:{c.RESET} {finder.duplicates_merged}")
+        if finder.discovered:
+            print(f"{c.BLUE}Discovered Paths:{c.RESET}  {finder.discovered} probed by recursion")
+        if finder.history_skipped or finder.not_modified:
+            print(f"{c.BLUE}Rescan Savings:{c.RESET}    {finder.history_skipped} dead paths skipped, "
+                  f"{finder.not_modified} unchanged (304)")
+        if finder.unresolved:
+            print(f"{c.BLUE}Unresolved Hosts:{c.RESET}  {c.RED}{len(finder.unresolved)}{c.RESET}")
+        if finder.unreachable:
+            print(f"{c.BLUE}Unreachable Hosts:{c.RESET} {c.RED}{len(finder.unreachable)}{c.RESET}")
+        print(f"{c.BLUE}Success Rate:{c.RESET}      {(finder.found_count/max(finder.metrics.requests, 1)*100):.1f}%")
+        print(f"{c.BLUE}Elapsed Time:{c.RESET}      {elapsed_time:.2f} seconds")
+        print(f"{c.BLUE}Request Rate:{c.RESET}      {(finder.metrics.requests/elapsed_time):.1f} req/sec")
+        
+        timings = []
+        for phase, histogram in finder.metrics.phases.items():
+            if histogram.count:
+                timings.append(f"{phase} {histogram.sum / histogram.count * 1000:.1f}ms")
+        if timings:
+            print(f"{c.BLUE}Avg Phase Time:{c.RESET}    {' | '.join(timings)}")
+        
+        if finder.results:
+            print(f"\n{c.GREEN}[DISCOVERED ADMIN PANELS]{c.RESET}")
+            print(f"{c.GREEN}{'─'*50}{c.RESET}")
+            
+            for i, result in enumerate(finder.results, 1):
+                status_color = c.GREEN if result.status_code == 200 else c.YELLOW
+                print(f"{c.BOLD}{i:2d}.{c.RESET} {result.url}")
+                print(f"     Status: {status_color}{result.status_code}{c.RESET} | "
+                      f"Time: {result.response_time:.2f}s | "
+                      f"Size: {result.content_length:,} bytes")
+                
+                if result.title:
+                    print(f"     Title: {c.CYAN}{result.title[:60]}{'...' if len(result.title) > 60 else ''}{c.RESET}")
+                
+                if result.server:
+                    print(f"     Server: {c.BLUE}{result.server}{c.RESET}")
+                
+                if result.classification:
+                    print(f"     Type: {c.BLUE}{result.classification}{c.RESET}")
+                
+                if result.admin_indicators:
+                    indicators = ', '.join(result.admin_indicators[:5])
+                    print(f"     Indicators: {c.YELLOW}{indicators}{c.RESET} (score {result.score:g})")
+                
+                if result.aliases:
+                    more = f" (+{len(result.aliases) - 3} more)" if len(result.aliases) > 3 else ''
+                    print(f"     Also at: {', '.join(result.aliases[:3])}{more}")
+                
+                if result.redirect_url:
+                    print(f"     Redirect: {c.BLUE}{result.redirect_url}{c.RESET}")
+                
+                print()
+        elif not finder.found_count:
+            print(f"\n{c.YELLOW}[NO ADMIN PANELS FOUND]{c.RESET}")
+            print("Consider trying:")
+            print("• Different wordlists or custom paths")
+            print("• Subdomain enumeration")
+            print("• Directory bruteforcing")
+            print("• Port scanning for alternative services")
+        
+        if finder.diff is not None:
+            self._print_diff(finder.diff)
+
+    def _print_diff(self, diff: Dict[str, List[Dict]]):
+        """Print what changed since the previous scan recorded in --history"""
+        c = self.colors
+        print(f"\n{c.CYAN}[CHANGES SINCE LAST SCAN]{c.RESET}")
+        print(f"{c.CYAN}{'─'*50}{c.RESET}")
+        if not any(diff.values()):
+            print("No changes")
+            return
+        for result in diff['new']:
+            print(f"{c.GREEN}+ NEW{c.RESET}         {result['url']} ({result['status_code']})")
+        for change in diff['changed']:
+            details = ', '.join(f"{name}: {old} -> {new}" for name, (old, new) in change['changes'].items())
+            print(f"{c.YELLOW}~ CHANGED{c.RESET}     {change['url']} ({details})")
+        for gone in diff['disappeared']:
+            print(f"{c.RED}- DISAPPEARED{c.RESET} {gone['url']}")
+
+def use_uvloop() -> bool:
+    """Switch asyncio to uvloop when it is installed; return whether it was"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+# Seconds between metrics snapshots sent from shard workers to the parent
+SHARD_METRICS_INTERVAL = 1.0
+# Seconds the parent waits for workers to finish after a stop request
+SHARD_SHUTDOWN_TIMEOUT = 10.0
+# Seconds between polls of the parent's feed (target setup, routed discoveries) in path-sharded workers
+FEED_POLL_INTERVAL = 0.05
+
+def _run_shard(config: ScanConfig, shard: Tuple[int, int], channel, stop, uvloop: bool,
+               reporter: Optional[Reporter] = None, dns: Optional[Dict] = None, feed=None):
+    """Worker process entry point: scan one shard and report over channel.
+    
+    Path-sharded workers get the parent's DNS answers in ``dns`` and each
+    target's fingerprint and calibration over ``feed`` (see
+    AdminPanelFinder._feed_setup) instead of repeating them.  With
+    recursion they send discoveries to the parent, which passes each on
+    over ``feed`` to the worker owning it.
+    """
+    # Ctrl-C is handled by the parent, which asks workers to stop via the event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if uvloop:
+        use_uvloop()
+    sink = QueueSink(channel)
+    finder = AdminPanelFinder(config=replace(config, shard=shard, sinks=[sink]), reporter=reporter)
+    sink.clusters = finder._clusters
+    if dns is not None:
+        finder.resolver.cache.seed(dns)
+    finder._feed = feed
+    if feed is not None and finder._frontier is not None:
+        finder._channel = channel
+    
+    async def run():
+        task = asyncio.ensure_future(finder.scan())
+        reported = time.monotonic()
+        while not task.done():
+            if stop.is_set():
+                task.cancel()
+            await asyncio.wait([task], timeout=0.2)
+            if time.monotonic() - reported >= SHARD_METRICS_INTERVAL:
+                channel.put(('metrics', shard[0], finder.metrics.snapshot()))
+                reported = time.monotonic()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    
+    error = None
+    try:
+        asyncio.run(run())
+    except Exception as e:
+        error = str(e)
+    channel.put(('done', shard[0], {
+        'metrics': finder.metrics.snapshot(),
+        'paths_scheduled': finder.paths_scheduled,
+        'total_requests': finder.total_requests,
+        'wildcard_filtered': finder.wildcard_filtered,
+        'history_skipped': finder.history_skipped,
+        'not_modified': finder.not_modified,
+        'discovered': finder.discovered,
+        'unreachable': finder.unreachable,
+        'unresolved': finder.unresolved,
+        'error': error,
+    }))
 
 class AdminPanelFinder:
     """Professional Admin Panel Discovery Tool"""
@@ -68,18 +2396,18 @@ class AdminPanelFinder:
         "admin/account", "admin/home", "admin/controlpanel", "admin/cp",
         
         # CMS specific
-        "wp-admin/", "wp-login.php", "administrator/", "admin.php", "login.php",
+        "wp-admin/", "administrator/", "admin.php", "login.php",
         "admin/admin.php", "admin_area/admin.php", "admin_area/login.php",
         "admin_area/index.php", "bb-admin/", "admin/login.aspx", "admin.aspx",
         
         # Application specific
         "phpmyadmin", "pma", "mysql", "sql", "database", "db", "phpMyAdmin",
         "adminer", "adminer.php", "manager/html", "tomcat/manager", "jmx-console",
-        "web-console", "admin-console", "management", "monitoring",
+        "web-console", "management", "monitoring",
         
         # Directory variations
         "admin/", "admin/index.php", "admin/index.html", "admin/login/",
-        "administrator/", "administrator/index.php", "cpanel", "cPanel",
+        "administrator/index.php", "cpanel", "cPanel",
         "plesk", "directadmin", "webmin", "usermin",
         
         # Security appliances
@@ -106,25 +2434,153 @@ class AdminPanelFinder:
         "user name", "pass word", "submit", "enter", "access denied", "unauthorized"
     ]
 
-    def __init__(self, target: str, **kwargs):
-        self.target = self._normalize_target(target)
-        self.threads = kwargs.get('threads', 20)
-        self.timeout = kwargs.get('timeout', 10)
-        self.delay = kwargs.get('delay', 0)
-        self.output = kwargs.get('output')
-        self.verbose = kwargs.get('verbose', False)
-        self.follow_redirects = kwargs.get('follow_redirects', True)
-        self.verify_ssl = kwargs.get('verify_ssl', False)
+    def __init__(self, target: Optional[str] = None, config: Optional[ScanConfig] = None,
+                 reporter: Optional[Reporter] = None, **kwargs):
+        # Keyword options are still accepted and override the config object
+        config = replace(config or ScanConfig(), **kwargs)
+        targets = ([target] if target else []) + list(config.targets)
+        if not targets:
+            raise ValueError("No targets specified")
+        
+        self.config = replace(config, targets=tuple(targets))
+        self.reporter = reporter or Reporter()
+        
+        # Normalize and drop duplicate targets while keeping input order
+        self.targets = list(dict.fromkeys(self._normalize_target(t) for t in targets))
+        self.threads = config.threads
+        self.per_host = config.per_host or self.threads
+        self.connections_per_host = config.connections_per_host
+        self.rate = config.rate or (1.0 / config.delay if config.delay > 0 else None)
+        
+        # In a sharded scan this process owns one slice of the (target, path) space
+        self.shard: Optional[Tuple[int, int]] = config.shard
+        self._shard_by_path = False
+        if self.shard is not None:
+            index, count = self.shard
+            self.threads = max(1, self.threads // count)
+            if len(self.targets) >= count:
+                self.targets = self.targets[index::count]
+                self.per_host = min(self.per_host, self.threads)
+            else:
+                # Every shard talks to every host, so split the per-host budgets
+                self._shard_by_path = True
+                self.per_host = max(1, self.per_host // count)
+                if self.connections_per_host:
+                    self.connections_per_host = max(1, self.connections_per_host // count)
+                if self.rate:
+                    self.rate /= count
+        self.target = self.targets[0]
+        self.dns_cache_ttl = config.dns_cache_ttl
+        self.dns_concurrency = config.dns_concurrency
+        self.resolver = CachedResolver(DNSCache(config.dns_cache),
+                                       upstream=config.resolver, ttl=self.dns_cache_ttl)
+        self.unresolved: List[str] = []
+        self.timeout = config.timeout
+        self.delay = config.delay
+        self.output = config.output
+        self.keep_results = config.keep_results
+        self.found_count = 0
+        self.verbose = config.verbose
+        self.follow_redirects = config.follow_redirects
+        self.verify_ssl = config.verify_ssl
         
         self.results: List[ScanResult] = []
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.sinks: List[ResultSink] = [
+            sink if isinstance(sink, ResultSink) else CallbackSink(sink)
+            for sink in config.sinks
+        ]
+        outputs = [self.output] if isinstance(self.output, str) else list(self.output or [])
+        self.sinks.extend(create_sink(path) for path in outputs)
+        self.metrics = ScanMetrics()
+        self.trace_configs = list(config.trace_configs) + [self.metrics.trace_config()]
+        self._exporter = MetricsExporter(
+            self.metrics,
+            path=config.metrics_file,
+            interval=config.metrics_interval,
+            port=config.metrics_port
+        )
+        self.wordlist: Wordlist = config.wordlist or Wordlist(paths=self.ADMIN_PATHS)
+        self.paths_scheduled = 0
+        self.fingerprint = config.fingerprint
+        self.prune = config.prune
+        self.early_exit = config.early_exit
+        self.technologies: Dict[str, List[str]] = {}
+        self._prioritized: Dict[str, set] = {}
+        self._pruned: Dict[str, set] = {}
+        self._confident_hits: Dict[str, int] = {}
+        self._exited: set = set()
+        transport = config.transport
+        if isinstance(transport, str):
+            if transport not in TRANSPORTS:
+                raise ValueError(f"Unknown transport: {transport}")
+            transport = TRANSPORTS[transport]
+        transport.check()
+        self.transport_class = transport
+        self.transport: Optional[Transport] = None
         self.start_time = 0
         self.total_requests = 0
         self.successful_requests = 0
-        
-        # Disable colors if output is redirected
-        if not sys.stdout.isatty():
-            Colors.disable()
+        self.adaptive = config.adaptive
+        self._controllers: Dict[str, HostController] = {}
+        self._unparkers: Dict[str, asyncio.Task] = {}
+        self.retries = config.retries
+        self.retry_backoff = config.retry_backoff
+        self.breaker_threshold = config.breaker_threshold
+        self._breakers: Dict[str, HostCircuitBreaker] = {}
+        self.unreachable: List[str] = []
+        self.calibrate = config.calibrate
+        self.probe = config.probe
+        self.max_body = config.max_body
+        if self.probe not in PROBE_STRATEGIES:
+            raise ValueError(f"Unknown probe strategy: {self.probe}")
+        self._head_unsupported = set()
+        self.matcher = IndicatorMatcher(config.indicators or self.ADMIN_INDICATORS)
+        self.analysis_workers = config.analysis_workers
+        self.analysis_mode = config.analysis_mode
+        if self.analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {self.analysis_mode}")
+        self._analysis_executor = None
+        self._analysis_slots: Optional[asyncio.Semaphore] = None
+        self.checkpoint = config.checkpoint
+        self.resume = config.resume
+        self.history = config.history
+        self.history_scan = config.history_scan
+        self.dead_after = config.dead_after
+        self.explore = config.explore
+        self._history: Optional[ScanHistory] = None
+        self.history_skipped = 0
+        self.not_modified = 0
+        self.recursive = config.recursive
+        self._frontier: Optional[URLFrontier] = None
+        if self.recursive:
+            # Directory expansions iterate the wordlist again
+            if not self.wordlist.reusable:
+                raise ValueError("Recursive discovery needs a wordlist that can be read more than once")
+            self._frontier = URLFrontier(
+                self.wordlist,
+                max_depth=config.max_depth,
+                budget=config.recursion_budget
+            )
+            if self._shard_by_path:
+                # Discoveries reach the worker owning them, so share the budget out
+                self._frontier.budget = max(1, self._frontier.budget // self.shard[1])
+                self._frontier.owns = self._owns
+        self.diff: Optional[Dict[str, List[Dict]]] = None
+        self._journal: Optional[CheckpointJournal] = None
+        self._finished: set = set()
+        self._wildcards: Dict[str, List[WildcardFingerprint]] = {}
+        self._preparations: Dict[str, asyncio.Future] = {}
+        self._on_prepared: Optional[Callable[[str], None]] = None
+        self._feed = None
+        self._channel = None
+        self._received = 0
+        self._feed_finished = False
+        self._on_discovered: Optional[Callable[[], None]] = None
+        self._templates: Dict[str, RequestTemplate] = {}
+        self.wildcard_filtered = 0
+        self.dedup = config.dedup
+        self._clusters: Optional[ResponseClusterer] = ResponseClusterer() if self.dedup else None
+        self._emitted: set = set()
 
     def _normalize_target(self, target: str) -> str:
         """Normalize and validate target URL"""
@@ -144,323 +2600,1337 @@ class AdminPanelFinder:
         
         return target
 
-    def _print_banner(self):
-        """Display professional banner"""
-        banner = f"""
-{Colors.CYAN}╔══════════════════════════════════════════════════════════════╗
-║              {Colors.BOLD}ADMIN PANEL DISCOVERY TOOL{Colors.RESET}{Colors.CYAN}                 ║
-║                     {Colors.YELLOW}Professional Edition{Colors.RESET}{Colors.CYAN}                    ║
-╚══════════════════════════════════════════════════════════════╝{Colors.RESET}
-
-{Colors.BLUE}Target:{Colors.RESET}     {Colors.BOLD}{self.target}{Colors.RESET}
-{Colors.BLUE}Threads:{Colors.RESET}    {Colors.BOLD}{self.threads}{Colors.RESET}
-{Colors.BLUE}Timeout:{Colors.RESET}    {Colors.BOLD}{self.timeout}s{Colors.RESET}
-{Colors.BLUE}Paths:{Colors.RESET}      {Colors.BOLD}{len(self.ADMIN_PATHS)}{Colors.RESET}
-{Colors.BLUE}SSL Verify:{Colors.RESET} {Colors.BOLD}{'Yes' if self.verify_ssl else 'No'}{Colors.RESET}
-
-{Colors.YELLOW}{'='*64}{Colors.RESET}
-"""
-        print(banner)
+    def target_label(self) -> str:
+        """Describe the scanned target(s) for banner and summary output"""
+        if len(self.targets) == 1:
+            return self.target
+        return f"{len(self.targets)} targets"
+
+    @property
+    def duplicates_merged(self) -> int:
+        """Paths folded into another finding as aliases"""
+        return self._clusters.merged if self._clusters is not None else 0
+
+    @property
+    def discovered(self) -> int:
+        """Requests scheduled by recursive discovery"""
+        return self._frontier.discovered if self._frontier is not None else 0
+
+    async def _work_items(self):
+        """Yield (target, path) pairs interleaved across targets.
+        
+        The wordlist is streamed once, with consecutive items hitting
+        different hosts so the global concurrency budget is spread over the
+        whole target list instead of hammering one host at a time.  Each
+        target's fingerprint-derived priority paths are queued by the
+        pipeline once that target has been prepared.
+        """
+        frontier = self._frontier
+        seen = self.wordlist.dedup_set()
+        if frontier is not None:
+            frontier.base = seen
+        for path in self.wordlist.stream(seen):
+            self.paths_scheduled += 1
+            for target in self.targets:
+                if path in self._prioritized.get(target, ()):
+                    continue
+                if self._wants(target, path) and (frontier is None or not frontier.visited(target, path)):
+                    yield target, path
+
+    def _is_active(self, target: str) -> bool:
+        """Whether a target still needs probing (not unreachable or exited early)"""
+        if target in self._exited:
+            return False
+        breaker = self._breakers.get(target)
+        return breaker is None or not breaker.open
+
+    def _owns(self, target: str, path: str, key: Optional[int] = None) -> bool:
+        """Whether a (target, path) item belongs to this process's shard"""
+        if not self._shard_by_path:
+            return True
+        index, count = self.shard
+        return (key if key is not None else _work_key(target, path)) % count == index
+
+    def _wants(self, target: str, path: str, owned_only: bool = True) -> bool:
+        """Whether a (target, path) item should be scheduled.
+        
+        Paths discovered by recursion skip the shard check: a path-sharded
+        worker's frontier only ever holds paths it owns.
+        """
+        if not self._is_active(target):
+            return False
+        key = None
+        if self._shard_by_path or self._finished or self._history is not None:
+            key = _work_key(target, path)
+        if owned_only and not self._owns(target, path, key):
+            return False
+        if self._finished and key in self._finished:
+            return False
+        # Paths dead for the last --dead-after scans only get an exploration sample
+        if self._history is not None and key in self._history.dead and random.random() >= self.explore:
+            self.history_skipped += 1
+            return False
+        return not self._is_pruned(target, path)
 
-    async def _check_admin_path(self, path: str) -> Optional[ScanResult]:
-        """Check a single admin path with enhanced detection"""
-        url = urljoin(self.target, path)
-        start_time = time.time()
+    def _is_pruned(self, target: str, path: str) -> bool:
+        """Whether a path belongs to a family the target's fingerprint ruled out"""
+        pruned = self._pruned.get(target)
+        return bool(pruned) and any(FAMILY_PATTERNS[family].search(path) for family in pruned)
+
+    def _prepared(self, target: str) -> bool:
+        """Whether a target has been fingerprinted and calibrated.
         
+        The first call starts that preparation in the background, or in a
+        path-sharded worker waits for the parent to send it.
+        """
+        if not (self.fingerprint or self.calibrate):
+            return True
+        return self._preparation(target).done()
+
+    def _preparation(self, target: str) -> asyncio.Future:
+        """Future resolved once a target is prepared, created on first use"""
+        future = self._preparations.get(target)
+        if future is None:
+            if self._feed is not None:
+                future = asyncio.get_running_loop().create_future()
+            else:
+                future = asyncio.ensure_future(self._prepare(target))
+            future.add_done_callback(functools.partial(self._prepare_done, target))
+            self._preparations[target] = future
+        return future
+
+    def _prepare_done(self, target: str, future: asyncio.Future):
+        """Hand a freshly prepared target to the running pipeline"""
+        if not future.cancelled() and self._on_prepared is not None:
+            self._on_prepared(target)
+
+    async def _prepare(self, target: str):
+        """Fingerprint a target, then calibrate its wildcard detection"""
+        if self.fingerprint and self._is_active(target):
+            await self._fingerprint_target(target)
+        if self.calibrate and self._is_active(target):
+            self._wildcards[target] = await self._calibrate(target)
+
+    @contextlib.asynccontextmanager
+    async def _setup_slot(self, target: str):
+        """Hold a host slot, then one of the global setup slots, for one
+        fingerprint or calibration request; yields the request's start time
+        """
+        controller = self._host_controller(target)
+        await controller.acquire()
         try:
-            headers = {
-                'User-Agent': random.choice(self.USER_AGENTS),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            async with self.session.get(
-                url, 
-                headers=headers, 
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=self.follow_redirects,
-                ssl=self.verify_ssl
+            async with self._setup_slots:
+                yield time.perf_counter()
+        finally:
+            controller.release()
+
+    async def _fingerprint_target(self, target: str):
+        """Fetch the root page once and derive priority and pruned path families"""
+        families: List[str] = []
+        template = self._template(target)
+        try:
+            async with self._setup_slot(target) as started, self.transport.get(
+                template.base,
+                headers=template.headers,
+                allow_redirects=True
             ) as response:
-                
                 self.total_requests += 1
-                response_time = time.time() - start_time
-                
-                # Check if response indicates potential admin panel
-                if self._is_potential_admin_panel(response):
-                    self.successful_requests += 1
-                    
-                    content = await response.text()
-                    admin_indicators = self._extract_admin_indicators(content)
-                    title = self._extract_title(content)
-                    
-                    result = ScanResult(
-                        url=url,
-                        status_code=response.status,
-                        response_time=response_time,
-                        redirect_url=str(response.url) if str(response.url) != url else None,
-                        content_length=len(content),
-                        server=response.headers.get('Server'),
-                        title=title,
-                        admin_indicators=admin_indicators
-                    )
-                    
-                    if self.verbose:
-                        self._print_found_panel(result)
-                    
-                    return result
-                    
-        except asyncio.TimeoutError:
+                self._record_response(target, response, started)
+                body = await self._read_capped(response, self.max_body)
+                cookies = [cookie.key for cookie in response.cookies.values()]
+                for historic in response.history:
+                    cookies.extend(cookie.key for cookie in historic.cookies.values())
+                families = detect_technologies(dict(response.headers), cookies, body)
+        except Exception as e:
+            if isinstance(e, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+                self._record_failure(target, e)
+            if self.verbose:
+                self.reporter.event('ERROR', f"Fingerprinting failed for {target} - {str(e)}")
+        
+        self._apply_fingerprint(target, families)
+        if families and self.verbose:
+            self.reporter.event('TECH', f"{target} - {', '.join(families)}")
+
+    def _apply_fingerprint(self, target: str, families: List[str]):
+        """Derive a target's priority paths and pruned families from its technologies"""
+        self.technologies[target] = families
+        self._prioritized[target] = list(dict.fromkeys(
+            path for family in families for path in FAMILY_PATHS.get(family, ())))
+        if self.prune:
+            self._pruned[target] = _pruned_families(families)
+
+    async def _feed_setup(self, feeds: List):
+        """Prepare every target once, concurrently, and send each result to all
+        path-sharded workers as soon as it is ready
+        """
+        self._setup_slots = asyncio.Semaphore(max(1, self.threads))
+        
+        async def prepare(target):
+            await self._prepare(target)
+            message = ('setup', target, self.technologies.get(target), self._wildcards.get(target, []),
+                       self._is_active(target))
+            for feed in feeds:
+                feed.put(message)
+        
+        await asyncio.gather(*(prepare(target) for target in self.targets))
+
+    async def _receive_feed(self):
+        """Apply the target setup and discoveries a path-sharded worker's parent sends"""
+        while True:
+            try:
+                message = self._feed.get_nowait()
+            except queue.Empty:
+                await asyncio.sleep(FEED_POLL_INTERVAL)
+                continue
+            if message[0] != 'setup':
+                if message[0] == 'discover':
+                    self._received += 1
+                    self._frontier.add(*message[1:])
+                else:
+                    # Every worker is idle: recursion is over
+                    self._feed_finished = True
+                if self._on_discovered is not None:
+                    self._on_discovered()
+                continue
+            target, families, wildcards, active = message[1:]
+            if families is not None:
+                self._apply_fingerprint(target, families)
+            self._wildcards[target] = wildcards
+            if not active:
+                # The parent gave up on this host while preparing it
+                self._host_breaker(target).open = True
+            future = self._preparation(target)
+            if not future.done():
+                future.set_result(None)
+
+    def _note_hit(self, result: ScanResult):
+        """Track confident hits per target and stop targets that reached --early-exit"""
+        if not self.early_exit:
+            return
+        if result.score < CONFIDENT_SCORE and result.classification not in ('login-form', 'http-auth'):
+            return
+        target = result.target
+        self._confident_hits[target] = self._confident_hits.get(target, 0) + 1
+        if self._confident_hits[target] >= self.early_exit and target not in self._exited:
+            self._exited.add(target)
+            unparker = self._unparkers.get(target)
+            if unparker is not None:
+                unparker.cancel()
             if self.verbose:
-                print(f"{Colors.YELLOW}[TIMEOUT]{Colors.RESET} {url}")
+                self.reporter.event('INFO', f"{target} - early exit after "
+                                            f"{self._confident_hits[target]} confident hit(s)")
+
+    def _host_controller(self, target: str) -> HostController:
+        """Return the per-host concurrency/rate controller for a target"""
+        controller = self._controllers.get(target)
+        if controller is None:
+            controller = HostController(self.per_host, adaptive=self.adaptive, rate=self.rate)
+            self._controllers[target] = controller
+        return controller
+
+    def _host_breaker(self, target: str) -> HostCircuitBreaker:
+        """Return the circuit breaker for a target host"""
+        breaker = self._breakers.get(target)
+        if breaker is None:
+            breaker = HostCircuitBreaker(self.breaker_threshold)
+            self._breakers[target] = breaker
+        return breaker
+
+    def _record_response(self, target: str, response, started: float):
+        """Feed a response's latency and status back to the host controller
+        and circuit breaker; a host that keeps answering 429/503 is given up
+        like one that keeps dropping connections.
+        """
+        breaker = self._host_breaker(target)
+        if response.status in OVERLOAD_STATUSES:
+            if breaker.record_overload(started):
+                self._give_up(target)
+        else:
+            breaker.record_success()
+        self._host_controller(target).record_response(
+            time.perf_counter() - started, response.status, response.headers.get('Retry-After'))
+
+    def _record_failure(self, target: str, error: BaseException):
+        """Feed a failed request back to the host controller and circuit breaker"""
+        transport_failure = isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+        self._host_controller(target).record_failure(overload=transport_failure)
+        if transport_failure and self._host_breaker(target).record_failure():
+            self._give_up(target)
+
+    def _give_up(self, target: str):
+        """Declare a target unreachable and drop the work parked for it"""
+        self.unreachable.append(target)
+        self.reporter.event('UNREACHABLE', f"{target} - giving up after "
+                                           f"{self.breaker_threshold} consecutive failures")
+        unparker = self._unparkers.get(target)
+        if unparker is not None:
+            unparker.cancel()
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with full jitter for the given retry attempt,
+        never shorter than the server's Retry-After
+        """
+        return max(random.uniform(0, self.retry_backoff * (2 ** attempt)), retry_after or 0.0)
+
+    def _request_headers(self, user_agent: Optional[str] = None) -> Dict[str, str]:
+        """Build browser-like request headers with a rotated User-Agent"""
+        return {
+            'User-Agent': user_agent or random.choice(self.USER_AGENTS),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        }
+
+    def _get_headers(self, user_agent: Optional[str] = None) -> Dict[str, str]:
+        """Headers for a GET probe, limited to the body cap in range mode"""
+        headers = self._request_headers(user_agent)
+        if self.probe == 'range':
+            headers['Range'] = f'bytes=0-{self.max_body - 1}'
+        return headers
+
+    def _template(self, target: str) -> RequestTemplate:
+        """Return the request template for a target, with one User-Agent per host"""
+        template = self._templates.get(target)
+        if template is None:
+            user_agent = random.choice(self.USER_AGENTS)
+            template = RequestTemplate(target, self._request_headers(user_agent), self._get_headers(user_agent))
+            self._templates[target] = template
+        return template
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        """One client TLS context for the whole session, verifying against certifi when asked"""
+        if self.verify_ssl:
+            import certifi
+            return ssl.create_default_context(cafile=certifi.where())
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+    @staticmethod
+    async def _read_capped(response, limit: int, prefix: bytes = b'') -> bytes:
+        """Stream the body until limit bytes, or until the title plus enough
+        text for indicator matching has been seen, whichever comes first"""
+        body = bytearray(prefix)
+        title_end = body.lower().find(b'</title')
+        while len(body) < limit:
+            if title_end != -1 and len(body) >= title_end + INDICATOR_WINDOW:
+                break
+            chunk = await response.content.read(min(8192, limit - len(body)))
+            if not chunk:
+                break
+            if title_end == -1:
+                # Rescan a small overlap so a tag split across chunks is found
+                start = max(0, len(body) - 8)
+                body.extend(chunk)
+                found = body[start:].lower().find(b'</title')
+                if found != -1:
+                    title_end = start + found
+            else:
+                body.extend(chunk)
+        return bytes(body[:limit])
+
+    @staticmethod
+    async def _read_prefix(response, size: int) -> bytes:
+        """Read at most size bytes of the (decoded) response body"""
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = await response.content.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+
+    @staticmethod
+    def _response_location(response, target: str, path: str) -> Optional[str]:
+        """Return the redirect target of a response with the probed path masked out"""
+        location = response.headers.get('Location')
+        if location is None and response.history:
+            location = str(response.url)
+        if location is None:
+            return None
+        parsed = urlparse(urljoin(target + '/', location))
+        path = path.strip('/')
+        if path:
+            parsed = parsed._replace(path=parsed.path.replace(path, '{path}'),
+                                     query=parsed.query.replace(path, '{path}'))
+        return parsed.geturl()
+
+    async def _calibrate(self, target: str) -> List[WildcardFingerprint]:
+        """Fingerprint how a target answers requests for nonexistent paths"""
+        fingerprints: List[WildcardFingerprint] = []
+        template = self._template(target)
+        for probe in WILDCARD_PROBES:
+            if not self._is_active(target):
+                break
+            path = probe.format(token=uuid.uuid4().hex[:12])
+            try:
+                async with self._setup_slot(target) as started, self.transport.get(
+                    template.url(path),
+                    headers=template.get_headers,
+                    allow_redirects=self.follow_redirects
+                ) as response:
+                    self.total_requests += 1
+                    self._record_response(target, response, started)
+                    if not self._is_potential_admin_panel(response):
+                        continue
+                    prefix = await self._read_prefix(response, WILDCARD_PREFIX_BYTES)
+                    echoed = path.strip('/')
+                    fingerprint = WildcardFingerprint(
+                        status=response.status,
+                        length=response.content_length,
+                        location=self._response_location(response, target, path),
+                        prefix_hash=hashlib.sha1(_strip_reflection(prefix, path)).hexdigest(),
+                        simhash=body_digest(prefix, path).simhash,
+                        path_length=len(echoed),
+                        reflections=prefix.count(echoed.encode('utf-8'))
+                    )
+            except Exception as e:
+                self._record_failure(target, e)
+                if self.verbose:
+                    self.reporter.event('ERROR', f"Calibration failed for {target} - {str(e)}")
+                continue
+            if fingerprint not in fingerprints:
+                fingerprints.append(fingerprint)
+        
+        if fingerprints and self.verbose:
+            statuses = ', '.join(sorted({str(f.status) for f in fingerprints}))
+            self.reporter.event('WILDCARD', f"{target} answers unknown paths with {statuses}")
+        return fingerprints
+
+    async def _head_probe(self, target: str, path: str, url: str,
+                          wildcards: List[WildcardFingerprint]) -> bool:
+        """Send a HEAD request and report whether a full GET is warranted"""
+        started = time.perf_counter()
+        async with self.transport.head(
+            url,
+            headers=self._template(target).headers,
+            allow_redirects=self.follow_redirects
+        ) as response:
+            self.total_requests += 1
+            self._record_response(target, response, started)
+            if response.status in HEAD_UNSUPPORTED:
+                self._head_unsupported.add(target)
+                return True
+            if response.status in RETRY_STATUSES:
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                raise RetryableStatusError(response.status, retry_after)
+            if not self._is_potential_admin_panel(response):
+                return False
+            # Content-Length of a HEAD answer describes the GET body
+            location = self._response_location(response, target, path)
+            if any(w.matches_headers(response.status, location, response.content_length, path)
+                   for w in wildcards):
+                self.wildcard_filtered += 1
+                return False
+            return True
+
+    async def _check_admin_path(self, target: str, path: str, attempt: int = 0) -> Optional[ScanResult]:
+        """Check a single admin path with enhanced detection.
+        
+        Makes one attempt.  A retryable failure with retries left raises
+        RetryLater, so the caller can send the retry back through the
+        host's controller instead of sleeping on a worker.
+        """
+        url = self._template(target).url(path)
+        breaker = self._host_breaker(target)
+        result = None
+        digest = None
+        outcome = 'error'
+        error: Optional[BaseException] = None
+        retry_after = None
+        
+        if breaker.open:
+            return None
+        if attempt:
+            self.metrics.counters['retries'] += 1
+        try:
+            result, digest = await self._probe_path(target, path, url)
+            outcome = 'found' if result is not None else 'miss'
+        except RetryableStatusError as e:
+            error = e
+            retry_after = e.retry_after
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+            self._record_failure(target, e)
+            error = e
         except Exception as e:
+            # Anything else (bad URL, protocol violation) will not improve on retry
+            error = e
+        else:
+            error = None
+        
+        retryable = isinstance(error, (RetryableStatusError, asyncio.TimeoutError, aiohttp.ClientConnectionError))
+        if retryable and attempt < self.retries and not breaker.open:
+            raise RetryLater(self._retry_delay(attempt, retry_after))
+        
+        if isinstance(error, asyncio.TimeoutError):
             if self.verbose:
-                print(f"{Colors.RED}[ERROR]{Colors.RESET} {url} - {str(e)}")
+                self.reporter.event('TIMEOUT', url)
+        elif error is not None:
+            if self.verbose:
+                self.reporter.event('ERROR', f"{url} - {str(error)}")
         
-        if self.delay > 0:
-            await asyncio.sleep(self.delay)
+        primary = None
+        if result is not None and self._clusters is not None:
+            primary = self._clusters.assign(result, digest)
+            if primary is not None:
+                outcome = 'alias'
         
-        return None
+        if self._journal is not None:
+            self._journal.record(target, path, outcome, result, digest, alias_of=primary)
+        if self._history is not None and outcome != 'error':
+            self._history.record(target, path, outcome, result, digest)
+        
+        if primary is not None:
+            self._note_alias(primary, result.url)
+            return None
+        
+        if result is not None:
+            self.reporter.found(result)
+        
+        return result
+
+    async def _probe_path(self, target: str, path: str,
+                          url: str) -> Tuple[Optional[ScanResult], Optional[BodyDigest]]:
+        """Probe one URL and return a result for admin panel candidates,
+        with a digest of its body for deduplication.
+        
+        Network errors propagate to the caller.
+        """
+        result = None
+        digest = None
+        
+        wildcards = self._wildcards.get(target, [])
+        start_time = time.perf_counter()
+        
+        if self.probe == 'head' and target not in self._head_unsupported:
+            if not await self._head_probe(target, path, url, wildcards):
+                return None, None
+        
+        headers = self._template(target).get_headers
+        if self._history is not None:
+            conditional = self._history.conditional_headers(target, path)
+            if conditional:
+                headers = {**headers, **conditional}
+        
+        started = time.perf_counter()
+        async with self.transport.get(
+            url, 
+            headers=headers, 
+            allow_redirects=self.follow_redirects
+        ) as response:
+            
+            self.total_requests += 1
+            response_time = time.perf_counter() - start_time
+            self._record_response(target, response, started)
+            if response.status in RETRY_STATUSES:
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                raise RetryableStatusError(response.status, retry_after)
+            
+            # Unchanged since the last scan: reuse the stored result
+            if response.status == 304 and self._history is not None:
+                stored = self._history.previous_result(target, path)
+                if stored is not None:
+                    previous, digest = stored
+                    self.not_modified += 1
+                    self.metrics.counters['not_modified'] += 1
+                    previous.response_time = response_time
+                    previous.aliases = []
+                    # The stored digest lets this scan's aliases merge into it again
+                    return previous, digest
+            
+            # Check if response indicates potential admin panel
+            if self._is_potential_admin_panel(response):
+                location = self._response_location(response, target, path)
+                
+                # Discard catch-all responses from headers alone when possible...
+                if any(w.matches_headers(response.status, location, response.content_length, path)
+                       for w in wildcards):
+                    self.wildcard_filtered += 1
+                    self.metrics.counters['wildcard_filtered'] += 1
+                    return None, None
+                
+                redirect_url = str(response.url) if str(response.url) != url else None
+                status = 200 if response.status == 206 else response.status
+                
+                # A redirect to an already reported page needs no body
+                if self._clusters is not None and self._clusters.known_redirect(target, status, redirect_url):
+                    self.metrics.counters['body_skipped'] += 1
+                    return ScanResult(
+                        url=url, status_code=status, response_time=response_time,
+                        redirect_url=redirect_url, content_length=response.content_length or 0,
+                        server=response.headers.get('Server'), title=None,
+                        admin_indicators=[], target=target
+                    ), None
+                
+                # ...otherwise from a small normalized prefix of the body
+                body_started = time.perf_counter()
+                prefix = await self._read_prefix(response, min(WILDCARD_PREFIX_BYTES, self.max_body))
+                # Only pages sharing a wildcard's status and redirect are worth hashing
+                if any(w.status == response.status and w.location == location for w in wildcards):
+                    prefix_hash = hashlib.sha1(_strip_reflection(prefix, path)).hexdigest()
+                    simhash = body_digest(prefix, path).simhash
+                    if any(w.matches_prefix(response.status, location, prefix_hash, simhash)
+                           for w in wildcards):
+                        self.metrics.observe('body', time.perf_counter() - body_started)
+                        self.wildcard_filtered += 1
+                        self.metrics.counters['wildcard_filtered'] += 1
+                        return None, None
+                
+                self.successful_requests += 1
+                
+                body = await self._read_capped(response, self.max_body, prefix)
+                self.metrics.observe('body', time.perf_counter() - body_started)
+                charset = response.charset
+                analysis_headers = {name: response.headers[name]
+                                    for name in ANALYSIS_HEADERS if name in response.headers}
+                
+                result = ScanResult(
+                    url=url,
+                    status_code=status,
+                    response_time=response_time,
+                    redirect_url=redirect_url,
+                    content_length=response.content_length or len(body),
+                    server=response.headers.get('Server'),
+                    title=None,
+                    admin_indicators=[],
+                    target=target,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+        
+        # Analyze after the connection has been handed back to the pool
+        if result is not None:
+            analysis_started = time.perf_counter()
+            reflections = None
+            if self._clusters is not None:
+                # The page may echo the path it was finally served from as well as the probed one
+                reflections = (path, urlparse(result.redirect_url or url).path)
+            analysis, digest = await self._analyze(body, result.status_code, analysis_headers, charset,
+                                                   reflections)
+            result.admin_indicators, result.title, result.score, result.classification = analysis
+            if self._frontier is not None:
+                self._discover(target, path, url, result, body)
+            self.metrics.observe('analysis', time.perf_counter() - analysis_started)
+        
+        return result, digest
+
+    def _discover(self, target: str, path: str, url: str, result: ScanResult, body: bytes):
+        """Feed the frontier with links, form actions and directory expansions of a hit"""
+        frontier = self._frontier
+        depth = frontier.depth(target, path) + 1
+        if depth > frontier.max_depth:
+            return
+        prefix = target + '/'
+        final = result.redirect_url or url
+        
+        # A trailing slash (possibly after a redirect) or a 403 on an
+        # extensionless name marks a directory worth expanding
+        name = path.rstrip('/').rsplit('/', 1)[-1]
+        if final.startswith(prefix) and (final.endswith('/') or (result.status_code == 403 and '.' not in name)):
+            base = final[len(prefix):].split('?', 1)[0]
+            self._queue_discovery(target, base.rstrip('/') + '/', depth, URLFrontier.CHILD)
+        
+        for link, is_form in harvest_links(body, final):
+            if not link.startswith(prefix):
+                continue
+            child = link[len(prefix):]
+            if not child or child.split('?', 1)[0].lower().endswith(STATIC_EXTENSIONS):
+                continue
+            if child in self._prioritized.get(target, ()):
+                continue
+            self._queue_discovery(target, child, depth, URLFrontier.FORM if is_form else URLFrontier.LINK)
+
+    def _queue_discovery(self, target: str, path: str, depth: int, kind: int):
+        """Queue a discovered path or directory (kind CHILD) in the frontier.
+        
+        A path-sharded worker sends it to the parent instead, which drops
+        repeats and passes it on to the worker owning the path, or to every
+        worker for a directory expansion.
+        """
+        if self._channel is not None:
+            self._channel.put(('discover', target, path, depth, kind))
+        else:
+            self._frontier.add(target, path, depth, kind)
+
+    def _start_analysis_executor(self):
+        """Create the optional analysis pool and its back-pressure limit"""
+        if self.analysis_workers <= 0:
+            return
+        if self.analysis_mode == 'process':
+            self._analysis_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.analysis_workers,
+                initializer=_init_analysis_worker,
+                initargs=(self.matcher.weights,)
+            )
+        else:
+            self._analysis_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.analysis_workers,
+                thread_name_prefix='analysis'
+            )
+        # Fetchers block once this many bodies are queued for analysis
+        self._analysis_slots = asyncio.Semaphore(self.analysis_workers * 2)
+
+    def _stop_analysis_executor(self):
+        """Shut down the analysis pool, if one was started"""
+        if self._analysis_executor is not None:
+            self._analysis_executor.shutdown(wait=True)
+            self._analysis_executor = None
+
+    async def _analyze(self, body: bytes, status: int, headers: Dict[str, str], encoding: Optional[str],
+                       paths: Optional[Tuple[str, ...]] = None) -> Tuple[Tuple, Optional[BodyDigest]]:
+        """Analyze a body inline or on the analysis executor.
+        
+        Returns the analyze_body tuple and, when ``paths`` is given, the
+        body's dedup digest with those paths stripped, computed in the same job.
+        """
+        if self._analysis_executor is None:
+            return _analyze_job(self.matcher, body, status, headers, encoding, paths)
+        
+        if self.analysis_mode == 'process':
+            job = functools.partial(_analyze_in_worker, body, status, headers, encoding, paths)
+        else:
+            job = functools.partial(_analyze_job, self.matcher, body, status, headers, encoding, paths)
+        
+        async with self._analysis_slots:
+            return await asyncio.get_running_loop().run_in_executor(self._analysis_executor, job)
+
+    def _is_potential_admin_panel(self, response) -> bool:
+        """Determine if response indicates potential admin panel"""
+        status = response.status
+        
+        # Check status codes that might indicate admin panels
+        if status in [200, 206, 401, 403, 302, 301]:
+            return True
+        
+        # Check for specific headers
+        auth_header = response.headers.get('WWW-Authenticate', '')
+        if 'basic' in auth_header.lower() or 'digest' in auth_header.lower():
+            return True
+            
+        return False
+
+    async def _iter_results(self):
+        """Run the scan as a bounded producer/consumer pipeline.
+        
+        A producer feeds (target, path) items from the lazy work generator
+        into a bounded queue, a fixed pool of workers drains it, and every
+        hit is yielded as soon as it is ready.  Queue sizes are tied to the
+        worker count, so memory stays flat regardless of wordlist size.
+        
+        Workers never wait on a single host: an item whose host is paused,
+        saturated or between pacing ticks is parked on its controller, and
+        a per-host task hands it back once the host can take it.  Retries
+        are parked the same way, after their backoff, and so is everything
+        for a target until it has been fingerprinted and calibrated.  Only
+        the producer waits, once PARKED_LIMIT items are parked across all
+        hosts.
+        """
+        workers = max(1, self.threads)
+        work_queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+        done = object()
+        
+        outstanding = 0
+        parked = 0
+        progress = asyncio.Event()
+        self._unparkers = {}
+        self._preparations = {}
+        self._setup_slots = asyncio.Semaphore(workers)
+        
+        async def stop_workers():
+            for _ in range(workers):
+                await work_queue.put(None)
+        
+        async def submit(item):
+            nonlocal outstanding
+            while parked >= PARKED_LIMIT:
+                progress.clear()
+                await progress.wait()
+            outstanding += 1
+            await work_queue.put((*item, 0, False))
+        
+        def park(target, path, attempt, delay=0.0):
+            """Set an item aside until its host can take it, not before ``delay`` seconds"""
+            nonlocal parked
+            parked += 1
+            not_before = asyncio.get_running_loop().time() + delay
+            self._host_controller(target).parked.append((path, attempt, not_before))
+            if target not in self._unparkers:
+                self._unparkers[target] = asyncio.create_task(unpark(target))
+        
+        def prioritize(target):
+            """Put a freshly prepared target's priority paths ahead of its parked
+            items, dropping parked paths its fingerprint pruned
+            """
+            nonlocal outstanding, parked
+            controller = self._host_controller(target)
+            priority = self._prioritized.get(target, ())
+            kept = [entry for entry in controller.parked
+                    if entry[0] not in priority and not self._is_pruned(target, entry[0])]
+            dropped = len(controller.parked) - len(kept)
+            now = asyncio.get_running_loop().time()
+            first = [(path, 0, now) for path in priority
+                     if self._wants(target, path)
+                     and (self._frontier is None or not self._frontier.visited(target, path))]
+            controller.parked = collections.deque(first + kept)
+            outstanding += len(first) - dropped
+            parked += len(first) - dropped
+            progress.set()
+            if controller.parked and target not in self._unparkers:
+                self._unparkers[target] = asyncio.create_task(unpark(target))
+        
+        async def unpark(target):
+            """Hand parked items back to the workers, each with a host slot already taken"""
+            nonlocal outstanding, parked
+            controller = self._host_controller(target)
+            try:
+                preparation = self._preparations.get(target)
+                if preparation is not None and not preparation.done():
+                    await asyncio.wait([preparation])
+                loop = asyncio.get_running_loop()
+                while controller.parked and self._is_active(target):
+                    delay = controller.parked[0][2] - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await controller.acquire()
+                    parked -= 1
+                    path, attempt, _ = controller.parked.popleft()
+                    await work_queue.put((target, path, attempt, True))
+            finally:
+                del self._unparkers[target]
+                # Work for a host that was given up will never run
+                if controller.parked and not self._is_active(target):
+                    outstanding -= len(controller.parked)
+                    parked -= len(controller.parked)
+                    controller.parked.clear()
+                    progress.set()
+        
+        async def explore():
+            """Keep feeding frontier items until it is empty and nothing is in flight.
+            
+            A worker whose discoveries are routed through the parent reports
+            each time it runs dry and stops only once the parent says every
+            worker has.
+            """
+            reported = None
+            while True:
+                progress.clear()
+                item = self._frontier.pop()
+                if item is not None:
+                    if self._wants(*item, owned_only=False):
+                        await submit(item)
+                    continue
+                if not outstanding:
+                    if self._channel is None or self._feed_finished:
+                        return
+                    if reported != self._received:
+                        reported = self._received
+                        self._channel.put(('idle', self.shard[0], reported))
+                await progress.wait()
+        
+        async def produce():
+            try:
+                async for item in self._work_items():
+                    await submit(item)
+                if self._frontier is not None:
+                    await explore()
+                # Parked items are still outstanding
+                while outstanding:
+                    progress.clear()
+                    await progress.wait()
+            except Exception:
+                await stop_workers()
+                raise
+            await stop_workers()
+        
+        async def work():
+            nonlocal outstanding
+            try:
+                while True:
+                    item = await work_queue.get()
+                    if item is None:
+                        break
+                    target, path, attempt, reserved = item
+                    controller = self._host_controller(target)
+                    finished = True
+                    try:
+                        if not self._is_active(target):
+                            if reserved:
+                                controller.release()
+                            continue
+                        if not reserved and not (self._prepared(target) and controller.try_acquire()):
+                            park(target, path, attempt)
+                            finished = False
+                            continue
+                        try:
+                            result = await self._check_admin_path(target, path, attempt)
+                        except RetryLater as retry:
+                            park(target, path, attempt + 1, retry.delay)
+                            finished = False
+                            continue
+                        finally:
+                            controller.release()
+                        if result is not None:
+                            self._note_hit(result)
+                            await result_queue.put(result)
+                    finally:
+                        if finished:
+                            outstanding -= 1
+                            progress.set()
+            finally:
+                await result_queue.put(done)
+        
+        self._on_prepared = prioritize
+        self._on_discovered = progress.set
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(work()) for _ in range(workers))
+        # Runs until cancelled, so it stays out of the gather below
+        helpers = []
+        if self._feed is not None:
+            helpers.append(asyncio.create_task(self._receive_feed()))
+        
+        try:
+            finished = 0
+            while finished < workers:
+                result = await result_queue.get()
+                if result is done:
+                    finished += 1
+                else:
+                    yield result
+            # Surface producer/worker failures instead of silently truncating the scan
+            await asyncio.gather(*tasks)
+        finally:
+            self._on_prepared = None
+            self._on_discovered = None
+            tasks.extend(helpers)
+            tasks.extend(self._unparkers.values())
+            tasks.extend(self._preparations.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _note_alias(self, primary: ScanResult, url: str):
+        """Report a path that serves an already found page.
+        
+        The alias is already on primary.aliases; sinks only need telling
+        when the primary was written before the alias turned up.
+        """
+        self.metrics.counters['aliases'] += 1
+        if self.verbose:
+            self.reporter.event('ALIAS', f"{url} = {primary.url}")
+        if id(primary) in self._emitted:
+            for sink in self.sinks:
+                sink.alias(primary, url)
+
+    def _emit(self, result: ScanResult):
+        """Record a finished result and hand it to every registered sink"""
+        self._emitted.add(id(result))
+        self.found_count += 1
+        self.metrics.counters['found'] += 1
+        if self.keep_results:
+            self.results.append(result)
+        for sink in self.sinks:
+            sink.write(result)
+
+    def _scan_info(self) -> Dict:
+        """Scan metadata handed to sinks when they are closed"""
+        return {
+            'target': self.target,
+            'targets': self.targets,
+            'target_label': self.target_label(),
+            'timestamp': datetime.now().isoformat(),
+            'total_paths': self.paths_scheduled * len(self.targets),
+            'total_requests': self.total_requests,
+            'found_panels': self.found_count,
+            'duplicates_merged': self.duplicates_merged,
+            'aliases': {result.url: result.aliases
+                        for result in (self._clusters.primaries if self._clusters else ()) if result.aliases},
+            'diff': self.diff,
+            'scan_duration': time.time() - self.start_time
+        }
+
+    def _open_sinks(self):
+        """Open every result sink before the first result arrives"""
+        for sink in self.sinks:
+            sink.open()
+
+    def _close_sinks(self):
+        """Close all sinks, reporting where file outputs were written"""
+        scan_info = self._scan_info()
+        for sink in self.sinks:
+            try:
+                sink.close(scan_info)
+            except Exception as e:
+                self.reporter.event('ERROR', f"Failed to save results: {str(e)}")
+                continue
+            if sink.path:
+                self.reporter.event('SUCCESS', f"Results saved to {sink.path}")
+
+    def _open_journal(self) -> List[ScanResult]:
+        """Open the checkpoint journal and, when resuming, load finished work;
+        returns the panels found before the interruption
+        """
+        if not self.checkpoint:
+            return []
+        self._journal = CheckpointJournal(self.checkpoint, resume=self.resume)
+        if self.resume:
+            self._finished, found, members = self._journal.load()
+            # Shards share one journal; each restores only the results it owns
+            found = [result for result in found if result.target in self.targets and
+                     self._owns(result.target, result.url[len(result.target) + 1:])]
+            if self._clusters is not None:
+                # Later duplicates of a restored finding still merge into it
+                for result in found:
+                    self._clusters.assign(result, members[result.url][1])
+                    for alias in result.aliases:
+                        self._clusters.link(result, alias, *members.get(alias, (None, None)))
+            if self.shard is None:
+                self.reporter.event('INFO', f"Resuming: {len(self._finished)} probes already done, "
+                                            f"{len(found)} panels restored from {self.checkpoint}")
+            return found
+        return []
+
+    def _open_history(self):
+        """Open the rescan history store, starting a new scan in it"""
+        if self.history:
+            self._history = ScanHistory(self.history, dead_after=self.dead_after, scan_id=self.history_scan)
+
+    def _close_history(self):
+        """Compute this scan's diff against the previous state and close the store"""
+        if self._history is None:
+            return
+        if self._history.previous_scans and self.shard is None:
+            self.diff = self._history.diff()
+        self._history.close()
+        self._history = None
 
-    def _is_potential_admin_panel(self, response) -> bool:
-        """Determine if response indicates potential admin panel"""
-        status = response.status
-        
-        # Check status codes that might indicate admin panels
-        if status in [200, 401, 403, 302, 301]:
-            return True
+    async def _preresolve(self):
+        """Resolve every target host concurrently and drop NXDOMAIN targets
+        before any HTTP work is scheduled"""
+        hosts = {urlparse(target).hostname for target in self.targets}
+        hosts = [host for host in hosts if host and not _is_ip_literal(host)]
+        if not hosts:
+            return
+        semaphore = asyncio.Semaphore(self.dns_concurrency)
+        dead = set()
         
-        # Check for specific headers
-        auth_header = response.headers.get('WWW-Authenticate', '')
-        if 'basic' in auth_header.lower() or 'digest' in auth_header.lower():
-            return True
-            
-        return False
-
-    def _extract_admin_indicators(self, content: str) -> List[str]:
-        """Extract admin-related keywords from content"""
-        content_lower = content.lower()
-        found_indicators = []
+        async def resolve(host):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    if not await self.resolver.lookup(host):
+                        dead.add(host)
+                except Exception as e:
+                    # Transient failures are left for the HTTP layer to report
+                    if self.verbose:
+                        self.reporter.event('DNS', f"{host} - {str(e)}")
+                self.metrics.observe('dns', time.perf_counter() - started)
         
-        for indicator in self.ADMIN_INDICATORS:
-            if indicator in content_lower:
-                found_indicators.append(indicator)
+        await asyncio.gather(*(resolve(host) for host in hosts))
+        self.resolver.cache.save()
+        if not dead:
+            return
         
-        return found_indicators
+        self.unresolved = [t for t in self.targets if urlparse(t).hostname in dead]
+        self.targets = [t for t in self.targets if urlparse(t).hostname not in dead]
+        for target in self.unresolved:
+            self.reporter.event('NXDOMAIN', f"{target} - host does not resolve, skipping")
 
-    def _extract_title(self, content: str) -> Optional[str]:
-        """Extract page title from HTML content"""
-        try:
-            import re
-            title_match = re.search(r'<title[^>]*>([^<]+)</title>', content, re.IGNORECASE)
-            if title_match:
-                return title_match.group(1).strip()
-        except:
+    def _close_journal(self):
+        """Flush and close the checkpoint journal"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    async def scan(self) -> List[ScanResult]:
+        """Execute the admin panel discovery scan and return the kept results"""
+        async for _ in self.scan_iter():
             pass
-        return None
+        return self.results
 
-    def _print_found_panel(self, result: ScanResult):
-        """Print discovered admin panel with formatting"""
-        status_color = Colors.GREEN if result.status_code == 200 else Colors.YELLOW
-        print(f"{Colors.GREEN}[FOUND]{Colors.RESET} {result.url}")
-        print(f"  └─ Status: {status_color}{result.status_code}{Colors.RESET} | "
-              f"Time: {result.response_time:.2f}s | "
-              f"Size: {result.content_length} bytes")
+    def _new_transport(self) -> Transport:
+        """One transport (TLS context and connection pool) shared by every target"""
+        cap = self.connections_per_host or self.transport_class.default_connections
+        return self.transport_class(
+            limit=self.threads,
+            connections_per_host=min(self.per_host, cap) if cap else self.per_host,
+            timeout=self.timeout,
+            ssl_context=self._ssl_context(),
+            metrics=self.metrics,
+            resolver=self.resolver,
+            trace_configs=self.trace_configs
+        )
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """Run the scan, yielding each finding as soon as it is confirmed.
         
-        if result.title:
-            print(f"  └─ Title: {Colors.CYAN}{result.title}{Colors.RESET}")
+        Sinks, checkpoint and history are maintained as in scan(); all
+        output goes through the reporter, which is silent by default.
+        Leaving the loop early stops the scan and releases its resources.
+        """
+        # Shard workers stay quiet; the parent reports banner and summary
+        if self.shard is None:
+            self.reporter.banner(self)
+        self.start_time = time.time()
         
-        if result.redirect_url:
-            print(f"  └─ Redirect: {Colors.BLUE}{result.redirect_url}{Colors.RESET}")
+        self.transport = self._new_transport()
+        await self.transport.open()
+        try:
+            await self._preresolve()
+            
+            if self.shard is None:
+                self.reporter.event('INFO', f"Starting scan with {self.threads} concurrent threads...")
+                self.reporter.event('INFO', f"Scanning {self.wordlist.describe()} potential admin paths "
+                                            f"across {len(self.targets)} target(s)...\n")
+            
+            self._open_sinks()
+            try:
+                await self._exporter.start()
+                restored = self._open_journal()
+                self._open_history()
+                self._start_analysis_executor()
+                results = self._iter_results()
+                try:
+                    # Panels restored on --resume come first, as if just found
+                    for result in restored:
+                        self._emit(result)
+                        yield result
+                    async for result in results:
+                        self._emit(result)
+                        yield result
+                finally:
+                    await results.aclose()
+                    self._stop_analysis_executor()
+                    self._close_journal()
+                    self._close_history()
+            finally:
+                await self._exporter.stop()
+                self.resolver.cache.save()
+                if self.shard is None:
+                    self.reporter.summary(self)
+                self._close_sinks()
+        finally:
+            await self.transport.close()
 
-    async def scan(self):
-        """Execute the admin panel discovery scan"""
-        self._print_banner()
+    async def scan_sharded(self, workers: int, uvloop: bool = False) -> List[ScanResult]:
+        """Split the scan across worker processes and merge what they find.
+        
+        With at least as many targets as workers each worker takes a slice of
+        the target list; otherwise every (target, path) item is assigned by
+        hash and per-host limits are divided between the workers.  Each
+        worker runs its own event loop and connection pool and streams
+        results, aliases and metrics snapshots back over a queue.
+        """
+        self.reporter.banner(self)
         self.start_time = time.time()
         
-        # Create SSL context
-        ssl_context = ssl.create_default_context(cafile=certifi.where()) if self.verify_ssl else False
+        if self.checkpoint:
+            # Prepare the shared journal once; workers always open it for resuming
+            journal = CheckpointJournal(self.checkpoint, resume=self.resume)
+            if self.resume:
+                finished, found, _ = journal.load()
+                self.reporter.event('INFO', f"Resuming: {len(finished)} probes already done, "
+                                            f"{len(found)} panels restored from {self.checkpoint}")
+            journal.close()
         
-        # Configure session
-        connector = aiohttp.TCPConnector(
-            limit=self.threads,
-            ssl=ssl_context,
-            enable_cleanup_closed=True
-        )
+        # The parent opens the history first so every worker shares its scan id
+        self._open_history()
         
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # Sinks, tracing and metrics export stay with the parent
+        config = replace(self.config, sinks=(), trace_configs=(), output=None, metrics_file=None,
+                         metrics_port=None, keep_results=False, resume=bool(self.checkpoint))
+        if self._history is not None:
+            config = replace(config, history_scan=self._history.scan_id)
         
-        async with aiohttp.ClientSession(
-            connector=connector, 
-            timeout=timeout,
-            headers={'User-Agent': random.choice(self.USER_AGENTS)}
-        ) as session:
-            self.session = session
-            
-            print(f"{Colors.BLUE}[INFO]{Colors.RESET} Starting scan with {self.threads} concurrent threads...")
-            print(f"{Colors.BLUE}[INFO]{Colors.RESET} Scanning {len(self.ADMIN_PATHS)} potential admin paths...\n")
-            
-            # Create semaphore to limit concurrent requests
-            semaphore = asyncio.Semaphore(self.threads)
-            
-            async def bounded_check(path):
-                async with semaphore:
-                    return await self._check_admin_path(path)
-            
-            # Execute scan
-            tasks = [bounded_check(path) for path in self.ADMIN_PATHS]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter valid results
-            self.results = [r for r in results if isinstance(r, ScanResult)]
+        context = multiprocessing.get_context('spawn')
+        channel, stop = context.Queue(), context.Event()
+        mode = 'target' if len(self.targets) >= workers else 'path hash'
+        dns, feeds = None, [None] * workers
+        if mode == 'path hash':
+            # Every worker talks to every target: resolve and prepare them once, here
+            self.transport = self._new_transport()
+            await self.transport.open()
+            await self._preresolve()
+            config = replace(config, targets=tuple(self.targets))
+            dns = self.resolver.cache.export()
+            if self.fingerprint or self.calibrate or self._frontier is not None:
+                feeds = [context.Queue() for _ in range(workers)]
         
-        self._print_summary()
+        # Resolution may have dropped every target
+        processes = [context.Process(target=_run_shard,
+                                     args=(config, (index, workers), channel, stop, uvloop, self.reporter,
+                                           dns, feeds[index]))
+                     for index in range(workers if self.targets else 0)]
+        # The parent's own setup requests count toward the combined metrics
+        self._shard_state = {'running': len(processes), 'snapshots': {}, 'by_url': {},
+                             'parent': self.metrics if mode == 'path hash' else None,
+                             'feeds': feeds, 'forwarded': [0] * workers, 'idle': {}}
         
-        if self.output:
-            self._save_results()
-
-    def _print_summary(self):
-        """Print comprehensive scan summary"""
-        elapsed_time = time.time() - self.start_time
-        
-        print(f"\n{Colors.CYAN}{'='*64}{Colors.RESET}")
-        print(f"{Colors.BOLD}SCAN SUMMARY{Colors.RESET}")
-        print(f"{Colors.CYAN}{'='*64}{Colors.RESET}")
-        
-        print(f"{Colors.BLUE}Target URL:{Colors.RESET}        {self.target}")
-        print(f"{Colors.BLUE}Total Requests:{Colors.RESET}    {self.total_requests}")
-        print(f"{Colors.BLUE}Admin Panels Found:{Colors.RESET} {Colors.GREEN}{len(self.results)}{Colors.RESET}")
-        print(f"{Colors.BLUE}Success Rate:{Colors.RESET}      {(len(self.results)/max(self.total_requests, 1)*100):.1f}%")
-        print(f"{Colors.BLUE}Elapsed Time:{Colors.RESET}      {elapsed_time:.2f} seconds")
-        print(f"{Colors.BLUE}Request Rate:{Colors.RESET}      {(self.total_requests/elapsed_time):.1f} req/sec")
-        
-        if self.results:
-            print(f"\n{Colors.GREEN}[DISCOVERED ADMIN PANELS]{Colors.RESET}")
-            print(f"{Colors.GREEN}{'─'*50}{Colors.RESET}")
-            
-            for i, result in enumerate(self.results, 1):
-                status_color = Colors.GREEN if result.status_code == 200 else Colors.YELLOW
-                print(f"{Colors.BOLD}{i:2d}.{Colors.RESET} {result.url}")
-                print(f"     Status: {status_color}{result.status_code}{Colors.RESET} | "
-                      f"Time: {result.response_time:.2f}s | "
-                      f"Size: {result.content_length:,} bytes")
-                
-                if result.title:
-                    print(f"     Title: {Colors.CYAN}{result.title[:60]}{'...' if len(result.title) > 60 else ''}{Colors.RESET}")
-                
-                if result.server:
-                    print(f"     Server: {Colors.BLUE}{result.server}{Colors.RESET}")
-                
-                if result.admin_indicators:
-                    indicators = ', '.join(result.admin_indicators[:5])
-                    print(f"     Indicators: {Colors.YELLOW}{indicators}{Colors.RESET}")
-                
-                if result.redirect_url:
-                    print(f"     Redirect: {Colors.BLUE}{result.redirect_url}{Colors.RESET}")
-                
-                print()
-        else:
-            print(f"\n{Colors.YELLOW}[NO ADMIN PANELS FOUND]{Colors.RESET}")
-            print("Consider trying:")
-            print("• Different wordlists or custom paths")
-            print("• Subdomain enumeration")
-            print("• Directory bruteforcing")
-            print("• Port scanning for alternative services")
-
-    def _save_results(self):
-        """Save results to specified output format"""
-        if not self.results:
-            print(f"{Colors.YELLOW}[WARNING]{Colors.RESET} No results to save")
-            return
+        self.reporter.event('INFO', f"Starting {workers} worker processes "
+                                    f"({max(1, self.threads // workers)} concurrent requests each, sharded by {mode})...")
+        self.reporter.event('INFO', f"Scanning {self.wordlist.describe()} potential admin paths "
+                                    f"across {len(self.targets)} target(s)...\n")
         
+        self._open_sinks()
+        setup = None
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            if self.output.endswith('.json'):
-                self._save_json()
-            elif self.output.endswith('.csv'):
-                self._save_csv()
-            elif self.output.endswith('.html'):
-                self._save_html()
+            await self._exporter.start()
+            for process in processes:
+                process.start()
+            if processes and feeds[0] is not None and (self.fingerprint or self.calibrate):
+                setup = asyncio.ensure_future(self._feed_setup(feeds))
+            while self._shard_state['running']:
+                if not self._drain_shards(channel):
+                    if not any(process.is_alive() for process in processes):
+                        break
+                    await asyncio.sleep(0.05)
+        finally:
+            if setup is not None:
+                setup.cancel()
+                await asyncio.gather(setup, return_exceptions=True)
+            if mode == 'path hash':
+                await self.transport.close()
+                self.resolver.cache.save()
+            # Also reached on Ctrl-C: ask workers to stop and collect what they found
+            stop.set()
+            # Waits yield to the loop so the metrics endpoint keeps answering
+            deadline = time.monotonic() + SHARD_SHUTDOWN_TIMEOUT
+            while time.monotonic() < deadline:
+                if not self._drain_shards(channel):
+                    if not any(process.is_alive() for process in processes):
+                        break
+                    await asyncio.sleep(0.05)
+            loop = asyncio.get_running_loop()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                await loop.run_in_executor(None, process.join)
+            await self._exporter.stop()
+            self._close_history()
+            self.reporter.summary(self)
+            self._close_sinks()
+        return self.results
+
+    def _drain_shards(self, channel) -> bool:
+        """Handle every queued worker message; return whether there were any"""
+        handled = False
+        while True:
+            try:
+                message = channel.get_nowait()
+            except queue.Empty:
+                return handled
+            handled = True
+            self._handle_shard_message(message)
+
+    def _handle_shard_message(self, message: Tuple):
+        """Merge one worker message into the parent's results and metrics"""
+        state = self._shard_state
+        kind = message[0]
+        if kind == 'result':
+            result = ScanResult(**message[1])
+            digest = BodyDigest(**message[2]) if message[2] else None
+            # Workers deduplicate within their shard; the parent catches repeats across shards
+            primary = self._clusters.assign(result, digest) if self._clusters is not None else None
+            state['by_url'][result.url] = primary or result
+            if primary is None:
+                self._emit(result)
             else:
-                self._save_txt()
-            
-            print(f"{Colors.GREEN}[SUCCESS]{Colors.RESET} Results saved to {Colors.BOLD}{self.output}{Colors.RESET}")
-            
-        except Exception as e:
-            print(f"{Colors.RED}[ERROR]{Colors.RESET} Failed to save results: {str(e)}")
-
-    def _save_json(self):
-        """Save results as JSON"""
-        data = {
-            'scan_info': {
-                'target': self.target,
-                'timestamp': datetime.now().isoformat(),
-                'total_paths': len(self.ADMIN_PATHS),
-                'found_panels': len(self.results),
-                'scan_duration': time.time() - self.start_time
-            },
-            'results': [
-                {
-                    'url': r.url,
-                    'status_code': r.status_code,
-                    'response_time': r.response_time,
-                    'redirect_url': r.redirect_url,
-                    'content_length': r.content_length,
-                    'server': r.server,
-                    'title': r.title,
-                    'admin_indicators': r.admin_indicators
-                }
-                for r in self.results
-            ]
-        }
+                self._note_alias(primary, result.url)
+            for alias, redirect_url, alias_digest in message[3]:
+                self._link_alias(primary or result, alias, redirect_url, alias_digest)
+                if primary is not None:
+                    self._add_alias(primary, alias)
+        elif kind == 'alias':
+            primary = state['by_url'].get(message[1])
+            if primary is not None:
+                self._link_alias(primary, message[2], message[3], message[4])
+                self._add_alias(primary, message[2])
+        elif kind == 'discover':
+            self._route_discovery(*message[1:])
+        elif kind == 'idle':
+            state['idle'][message[1]] = message[2]
+            self._finish_if_idle()
+        elif kind in ('metrics', 'done'):
+            index = message[1]
+            if kind == 'metrics':
+                state['snapshots'][index] = message[2]
+            else:
+                stats = message[2]
+                state['snapshots'][index] = stats['metrics']
+                state['running'] -= 1
+                self.paths_scheduled = max(self.paths_scheduled, stats['paths_scheduled'])
+                self.history_skipped += stats['history_skipped']
+                self.not_modified += stats['not_modified']
+                if self._frontier is not None:
+                    self._frontier.discovered += stats['discovered']
+                self.total_requests += stats['total_requests']
+                self.wildcard_filtered += stats['wildcard_filtered']
+                # Path-hash shards can each give up on the same host
+                self.unreachable.extend(t for t in stats['unreachable'] if t not in self.unreachable)
+                self.unresolved.extend(t for t in stats['unresolved'] if t not in self.unresolved)
+                if stats['error']:
+                    self.reporter.event('ERROR', f"Worker {index} failed - {stats['error']}")
+                state['idle'][index] = None
+                self._finish_if_idle()
+            if state['parent'] is not None:
+                state['snapshots'][-1] = state['parent'].snapshot()
+            self.metrics = ScanMetrics.combine(state['snapshots'].values(), started=self.start_time)
+            self._exporter.metrics = self.metrics
+
+    def _route_discovery(self, target: str, path: str, depth: int, kind: int):
+        """Pass a worker's discovery on to the worker owning it, once.
         
-        with open(self.output, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Every worker expands a directory, each keeping the children it owns.
+        """
+        state = self._shard_state
+        if kind == URLFrontier.CHILD:
+            if not self._frontier.visit_directory(target, path):
+                return
+            recipients = range(len(state['feeds']))
+        else:
+            if not self._frontier.visit(target, path):
+                return
+            recipients = [_work_key(target, path) % len(state['feeds'])]
+        for index in recipients:
+            # A finished worker takes no more work
+            if index not in state['idle'] or state['idle'][index] is not None:
+                state['feeds'][index].put(('discover', target, path, depth, kind))
+                state['forwarded'][index] += 1
 
-    def _save_csv(self):
-        """Save results as CSV"""
-        with open(self.output, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'URL', 'Status Code', 'Response Time (s)', 'Redirect URL',
-                'Content Length', 'Server', 'Title', 'Admin Indicators'
-            ])
-            
-            for result in self.results:
-                writer.writerow([
-                    result.url,
-                    result.status_code,
-                    f"{result.response_time:.2f}",
-                    result.redirect_url or '',
-                    result.content_length,
-                    result.server or '',
-                    result.title or '',
-                    ', '.join(result.admin_indicators)
-                ])
-
-    def _save_txt(self):
-        """Save results as plain text"""
-        with open(self.output, 'w', encoding='utf-8') as f:
-            f.write(f"Admin Panel Discovery Report\n")
-            f.write(f"Target: {self.target}\n")
-            f.write(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Panels Found: {len(self.results)}\n")
-            f.write("="*60 + "\n\n")
-            
-            for i, result in enumerate(self.results, 1):
-                f.write(f"{i}. {result.url}\n")
-                f.write(f"   Status: {result.status_code}\n")
-                f.write(f"   Response Time: {result.response_time:.2f}s\n")
-                if result.title:
-                    f.write(f"   Title: {result.title}\n")
-                if result.server:
-                    f.write(f"   Server: {result.server}\n")
-                if result.redirect_url:
-                    f.write(f"   Redirect: {result.redirect_url}\n")
-                f.write("\n")
+    def _finish_if_idle(self):
+        """Tell recursive workers to stop once all of them ran dry with nothing
+        forwarded since; a worker only gets busy again through the parent
+        """
+        state = self._shard_state
+        if self._frontier is None or state['feeds'][0] is None:
+            return
+        idle = state['idle']
+        if len(idle) < len(state['feeds']):
+            return
+        if all(received is None or received == state['forwarded'][index] for index, received in idle.items()):
+            for index, received in idle.items():
+                if received is not None:
+                    state['feeds'][index].put(('finish',))
+                    idle[index] = None
+
+    def _link_alias(self, primary: ScanResult, url: str, redirect_url: Optional[str], digest: Optional[Dict]):
+        """Let a worker-reported alias's redirect target and digest lead to primary"""
+        if self._clusters is not None:
+            self._clusters.link(primary, url, redirect_url, BodyDigest(**digest) if digest else None)
+
+    def _add_alias(self, primary: ScanResult, url: str):
+        """Attach a worker-reported alias to a finding held by the parent"""
+        if url == primary.url or url in primary.aliases:
+            return
+        primary.aliases.append(url)
+        if self._clusters is not None:
+            self._clusters.merged += 1
+        self._note_alias(primary, url)
 
 def main():
     """Main entry point"""
@@ -473,14 +3943,29 @@ Examples:
   %(prog)s https://target.com -t 50 -v
   %(prog)s target.com -o results.json --timeout 15
   %(prog)s https://site.com -o report.html --no-ssl-verify
+  %(prog)s -L targets.txt -t 200 --per-host 10
+  cat targets.txt | %(prog)s -L -
         """
     )
     
     parser.add_argument(
         'target',
+        nargs='?',
         help='Target URL (e.g., example.com or https://example.com)'
     )
     
+    parser.add_argument(
+        '-L', '--target-list',
+        metavar='FILE',
+        help='File with one target per line ("-" reads from stdin)'
+    )
+    
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        help='Maximum concurrent requests per target host (default: same as --threads)'
+    )
+    
     parser.add_argument(
         '-t', '--threads',
         type=int,
@@ -499,12 +3984,54 @@ Examples:
         '-d', '--delay',
         type=float,
         default=0,
-        help='Delay between requests in seconds (default: 0)'
+        help='Minimum delay between requests to the same host in seconds (default: 0)'
+    )
+    
+    parser.add_argument(
+        '--rate',
+        type=float,
+        help='Exact request rate per host in requests/sec (overrides --delay)'
+    )
+    
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=2,
+        help='Retries for timeouts, connection errors and 429/502/503/504 (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--retry-backoff',
+        type=float,
+        default=0.5,
+        help='Base delay in seconds for jittered exponential retry backoff (default: 0.5)'
+    )
+    
+    parser.add_argument(
+        '--breaker-threshold',
+        type=int,
+        default=DEFAULT_BREAKER_THRESHOLD,
+        help=f'Consecutive connection failures or 429/503 answers before a host is skipped as unreachable '
+             f'(default: {DEFAULT_BREAKER_THRESHOLD}, 0 disables)'
+    )
+    
+    parser.add_argument(
+        '--no-adaptive',
+        action='store_true',
+        help='Use a fixed per-host concurrency instead of adapting it to latency and errors'
     )
     
     parser.add_argument(
         '-o', '--output',
-        help='Output file (supports .txt, .json, .csv, .html)'
+        action='append',
+        help='Output file written as results arrive (.txt, .json, .ndjson, .csv, .db, .html); repeatable'
+    )
+    
+    parser.add_argument(
+        '--no-keep-results',
+        action='store_true',
+        help='Do not collect results for the summary, which shows counts only (use with -o); '
+             'deduplication still keeps one record per distinct page'
     )
     
     parser.add_argument(
@@ -525,30 +4052,334 @@ Examples:
         help='Verify SSL certificates (default: disabled)'
     )
     
+    parser.add_argument(
+        '--probe',
+        choices=PROBE_STRATEGIES,
+        default='get',
+        help='Probe strategy: full GET, HEAD first then GET for candidates, '
+             'or a single ranged GET (default: get)'
+    )
+    
+    parser.add_argument(
+        '--max-body',
+        type=int,
+        default=DEFAULT_MAX_BODY,
+        help=f'Maximum body bytes read per candidate (default: {DEFAULT_MAX_BODY})'
+    )
+    
+    parser.add_argument(
+        '-w', '--wordlist',
+        action='append',
+        metavar='FILE',
+        help='Path wordlist, plain or gzip ("-" reads stdin); repeatable (default: built-in list)'
+    )
+    
+    parser.add_argument(
+        '-x', '--extensions',
+        help='Comma-separated extensions appended to extensionless paths (e.g. php,aspx,jsp)'
+    )
+    
+    parser.add_argument(
+        '--trailing-slash',
+        action='store_true',
+        help='Also try extensionless paths with a trailing slash'
+    )
+    
+    parser.add_argument(
+        '--case-variants',
+        action='store_true',
+        help='Also try lower, UPPER and Capitalized variants of each path'
+    )
+    
+    parser.add_argument(
+        '--backup-suffixes',
+        action='store_true',
+        help=f'Also try backup copies of file paths ({", ".join(BACKUP_SUFFIXES)})'
+    )
+    
+    parser.add_argument(
+        '--bloom',
+        action='store_true',
+        help='Deduplicate paths with a Bloom filter (less memory for huge lists, tiny false-drop rate)'
+    )
+    
+    parser.add_argument(
+        '--indicators',
+        metavar='FILE',
+        help='Custom admin indicators, one "keyword[:weight]" per line'
+    )
+    
+    parser.add_argument(
+        '--analysis-workers',
+        type=int,
+        default=0,
+        help='Analyze responses in a pool of N workers instead of on the event loop (default: 0)'
+    )
+    
+    parser.add_argument(
+        '--analysis-mode',
+        choices=ANALYSIS_MODES,
+        default='process',
+        help='Analysis pool type (default: process)'
+    )
+    
+    parser.add_argument(
+        '--no-fingerprint',
+        action='store_true',
+        help='Skip the root-page technology fingerprint used to prioritize paths'
+    )
+    
+    parser.add_argument(
+        '--prune',
+        action='store_true',
+        help='Skip paths of technology families ruled out by the fingerprint'
+    )
+    
+    parser.add_argument(
+        '--early-exit',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Stop probing a target after N confident hits (default: 0, never)'
+    )
+    
+    parser.add_argument(
+        '--dns-cache',
+        metavar='FILE',
+        help='Persist DNS answers (including NXDOMAIN) in a SQLite cache reused across runs'
+    )
+    
+    parser.add_argument(
+        '--dns-ttl',
+        type=int,
+        default=300,
+        help='Seconds a resolved address stays cached (default: 300)'
+    )
+    
+    parser.add_argument(
+        '--dns-concurrency',
+        type=int,
+        default=100,
+        help='Parallel lookups while pre-resolving targets (default: 100)'
+    )
+    
+    parser.add_argument(
+        '--resolve',
+        action='append',
+        metavar='HOST:ADDR',
+        help='Pin HOST to ADDR instead of querying DNS (repeatable)'
+    )
+    
+    parser.add_argument(
+        '--metrics-file',
+        metavar='FILE',
+        help='Append periodic JSON metrics snapshots (one per line) to FILE'
+    )
+    
+    parser.add_argument(
+        '--metrics-interval',
+        type=float,
+        default=10.0,
+        help='Seconds between metrics snapshots (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics during the scan'
+    )
+    
+    parser.add_argument(
+        '--checkpoint',
+        metavar='FILE',
+        help='Journal completed probes to a SQLite file so the scan can be resumed'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip probes already completed in the --checkpoint journal'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes to shard the scan across (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--transport',
+        choices=sorted(TRANSPORTS),
+        default='aiohttp',
+        help='HTTP client backend; h2 multiplexes probes over HTTP/2 and needs httpx[http2] (default: aiohttp)'
+    )
+    
+    parser.add_argument(
+        '--connections-per-host',
+        type=int,
+        help='Cap on open connections per host (default: --per-host for aiohttp, 1 for h2)'
+    )
+    
+    parser.add_argument(
+        '--uvloop',
+        action='store_true',
+        help='Run the event loop(s) on uvloop when it is installed'
+    )
+    
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Report every path separately instead of merging paths that serve the same page'
+    )
+    
+    parser.add_argument(
+        '--recursive',
+        action='store_true',
+        help='Expand found directories with the wordlist and follow same-host links and form actions'
+    )
+    
+    parser.add_argument(
+        '--max-depth',
+        type=int,
+        default=DEFAULT_MAX_DEPTH,
+        help=f'Levels below a wordlist hit to recurse (default: {DEFAULT_MAX_DEPTH})'
+    )
+    
+    parser.add_argument(
+        '--recursion-budget',
+        type=int,
+        default=DEFAULT_RECURSION_BUDGET,
+        help=f'Discovered requests allowed per target (default: {DEFAULT_RECURSION_BUDGET})'
+    )
+    
+    parser.add_argument(
+        '--history',
+        metavar='FILE',
+        help='SQLite store of past scans; rescans send conditional requests, skip long-dead '
+             'paths and report new, changed and disappeared panels'
+    )
+    
+    parser.add_argument(
+        '--dead-after',
+        type=int,
+        default=DEFAULT_DEAD_AFTER,
+        help=f'Skip paths dead in this many consecutive scans (default: {DEFAULT_DEAD_AFTER})'
+    )
+    
+    parser.add_argument(
+        '--explore',
+        type=float,
+        default=DEFAULT_EXPLORE_RATE,
+        help=f'Share of skipped dead paths still probed on a rescan (default: {DEFAULT_EXPLORE_RATE})'
+    )
+    
+    parser.add_argument(
+        '--no-calibration',
+        action='store_true',
+        help='Skip wildcard/soft-404 calibration with random nonexistent paths'
+    )
+    
     args = parser.parse_args()
     
+    if not args.target and not args.target_list:
+        parser.error('a target or --target-list is required')
+    if args.resume and not args.checkpoint:
+        parser.error('--resume requires --checkpoint')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.workers > 1 and '-' in (args.wordlist or ()):
+        parser.error('--workers cannot be combined with a wordlist read from stdin')
+    if args.recursive and '-' in (args.wordlist or ()):
+        parser.error('--recursive cannot be combined with a wordlist read from stdin')
+    if args.connections_per_host is not None and args.connections_per_host < 1:
+        parser.error('--connections-per-host must be at least 1')
+    reporter = ConsoleReporter(live=args.verbose)
+    if args.uvloop and not use_uvloop():
+        reporter.event('WARNING', "uvloop is not installed, using the default event loop")
+    
+    resolver = None
+    if args.resolve:
+        pins: Dict[str, List[str]] = {}
+        for pin in args.resolve:
+            host, _, address = pin.partition(':')
+            if not host or not _is_ip_literal(address):
+                parser.error(f'--resolve expects HOST:ADDR, got {pin!r}')
+            pins.setdefault(host, []).append(address)
+        resolver = StaticResolver(pins, fallback=SystemResolver())
+    
     try:
-        finder = AdminPanelFinder(
-            target=args.target,
+        wordlist = Wordlist(
+            sources=args.wordlist or (),
+            paths=None if args.wordlist else AdminPanelFinder.ADMIN_PATHS,
+            extensions=args.extensions.split(',') if args.extensions else (),
+            trailing_slash=args.trailing_slash,
+            case_variants=args.case_variants,
+            backup_suffixes=args.backup_suffixes,
+            bloom=args.bloom
+        )
+        
+        config = ScanConfig(
+            targets=load_targets(args.target_list) if args.target_list else (),
             threads=args.threads,
+            per_host=args.per_host,
+            transport=args.transport,
+            connections_per_host=args.connections_per_host,
+            wordlist=wordlist,
+            fingerprint=not args.no_fingerprint,
+            prune=args.prune,
+            early_exit=args.early_exit,
+            recursive=args.recursive,
+            max_depth=args.max_depth,
+            recursion_budget=args.recursion_budget,
+            adaptive=not args.no_adaptive,
+            rate=args.rate,
+            retries=args.retries,
+            retry_backoff=args.retry_backoff,
+            breaker_threshold=args.breaker_threshold,
             timeout=args.timeout,
             delay=args.delay,
             output=args.output,
+            keep_results=not args.no_keep_results,
             verbose=args.verbose,
             follow_redirects=not args.no_redirects,
-            verify_ssl=args.verify_ssl
+            verify_ssl=args.verify_ssl,
+            calibrate=not args.no_calibration,
+            dedup=not args.no_dedup,
+            probe=args.probe,
+            max_body=args.max_body,
+            indicators=load_indicators(args.indicators) if args.indicators else None,
+            analysis_workers=args.analysis_workers,
+            analysis_mode=args.analysis_mode,
+            dns_cache=args.dns_cache,
+            dns_cache_ttl=args.dns_ttl,
+            dns_concurrency=args.dns_concurrency,
+            resolver=resolver,
+            metrics_file=args.metrics_file,
+            metrics_interval=args.metrics_interval,
+            metrics_port=args.metrics_port,
+            checkpoint=args.checkpoint,
+            resume=args.resume,
+            history=args.history,
+            dead_after=args.dead_after,
+            explore=args.explore
         )
+        finder = AdminPanelFinder(args.target, config=config, reporter=reporter)
         
-        asyncio.run(finder.scan())
+        if args.workers > 1:
+            asyncio.run(finder.scan_sharded(args.workers, uvloop=args.uvloop))
+        else:
+            asyncio.run(finder.scan())
         
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}[INTERRUPTED]{Colors.RESET} Scan cancelled by user")
+        print()
+        reporter.event('INTERRUPTED', "Scan cancelled by user")
         sys.exit(1)
     except ValueError as e:
-        print(f"{Colors.RED}[ERROR]{Colors.RESET} {str(e)}")
+        reporter.event('ERROR', str(e))
         sys.exit(1)
     except Exception as e:
-        print(f"{Colors.RED}[CRITICAL ERROR]{Colors.RESET} {str(e)}")
+        reporter.event('CRITICAL ERROR', str(e))
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Admin Panel Discovery Tool - Benchmark Suite
+Runs AdminPanelFinder against a local stand-in HTTP server and reports
+throughput, latency percentiles, peak RSS and CPU per request as JSON.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import resource
+import sys
+import time
+import timeit
+from dataclasses import dataclass, asdict, replace
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from aiohttp import web
+import aiohttp
+
+from admin_finder import AdminPanelFinder, Wordlist
+
+@dataclass
+class ServerProfile:
+    """Behaviour of the stand-in server"""
+    latency: str = 'fixed:0.005'     # fixed:S | uniform:LO,HI | exp:MEAN
+    wildcard: bool = False           # answer unknown paths with 200 instead of 404
+    body_size: int = 2048            # bytes of filler in every HTML page
+    auth_ratio: float = 0.0          # share of admin hits answered with 401 + realm
+    error_rate: float = 0.0          # share of requests answered with 500/503 or a reset
+    hit_ratio: float = 0.05          # share of wordlist entries that exist
+
+PROFILES: Dict[str, ServerProfile] = {
+    'baseline': ServerProfile(),
+    'slow': ServerProfile(latency='exp:0.05'),
+    'wildcard': ServerProfile(wildcard=True),
+    'large-bodies': ServerProfile(body_size=2 * 1024 * 1024),
+    'auth': ServerProfile(auth_ratio=0.5),
+    'errors': ServerProfile(latency='uniform:0.001,0.02', error_rate=0.05),
+}
+
+def _latency_sampler(spec: str):
+    """Build a function returning one simulated latency (seconds) per call"""
+    kind, _, args = spec.partition(':')
+    values = [float(v) for v in args.split(',') if v]
+    if kind == 'fixed':
+        return lambda: values[0]
+    if kind == 'uniform':
+        return lambda: random.uniform(values[0], values[1])
+    if kind == 'exp':
+        return lambda: random.expovariate(1.0 / values[0])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+def build_wordlist(size: int, hit_ratio: float, seed: int = 1337) -> List[str]:
+    """Synthetic wordlist mixing real admin paths with random misses"""
+    rng = random.Random(seed)
+    hits = max(1, int(size * hit_ratio))
+    paths = [f"admin-{i}" for i in range(hits)]
+    paths += [f"{rng.getrandbits(48):012x}" for _ in range(size - hits)]
+    rng.shuffle(paths)
+    return paths
+
+def build_app(profile: ServerProfile) -> web.Application:
+    """aiohttp application implementing a server profile"""
+    sample_latency = _latency_sampler(profile.latency)
+    filler = 'x' * profile.body_size
+
+    def login_page(name: str) -> str:
+        """A login page with text of its own, so deduplication keeps every hit apart"""
+        rng = random.Random(name)
+        words = ' '.join(f'{rng.getrandbits(32):08x}' for _ in range(32))
+        return (f'<html><head><title>Admin Login - {name}</title></head><body><p>{words}</p>'
+                f'<form><input name="username"><input type="password" name="password"></form>'
+                f'{filler}</body></html>')
+
+    missing_page = f'<html><head><title>Welcome</title></head><body>{filler}</body></html>'
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        request.app['requests'] += 1
+        await asyncio.sleep(sample_latency())
+
+        if profile.error_rate and random.random() < profile.error_rate:
+            choice = random.random()
+            if choice < 0.4:
+                return web.Response(status=500)
+            if choice < 0.8:
+                return web.Response(status=503, headers={'Retry-After': '1'})
+            request.transport.close()
+            return web.Response(status=500)
+
+        name = request.path.strip('/')
+        if name.startswith('admin-'):
+            if profile.auth_ratio and random.random() < profile.auth_ratio:
+                return web.Response(status=401, headers={'WWW-Authenticate': f'Basic realm="{name}"'})
+            return web.Response(text=login_page(name), content_type='text/html')
+        if profile.wildcard:
+            return web.Response(text=missing_page, content_type='text/html')
+        return web.Response(status=404, text='Not Found')
+
+    app = web.Application()
+    app['requests'] = 0
+    app.router.add_route('*', '/{tail:.*}', handle)
+    return app
+
+def _serve(profile: ServerProfile, ready, stop):
+    """Child process entry point running the stand-in server"""
+    async def run():
+        runner = web.AppRunner(build_app(profile), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0, backlog=4096)
+        await site.start()
+        ready.put(runner.addresses[0][1])
+        while not stop.is_set():
+            await asyncio.sleep(0.1)
+        await runner.cleanup()
+    asyncio.run(run())
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def _latency_trace(latencies: List[float]) -> aiohttp.TraceConfig:
+    """TraceConfig recording the wall time of every request, failed or not"""
+    trace = aiohttp.TraceConfig()
+
+    async def on_start(session, ctx, params):
+        ctx.started = time.perf_counter()
+
+    async def on_end(session, ctx, params):
+        latencies.append(time.perf_counter() - ctx.started)
+
+    trace.on_request_start.append(on_start)
+    trace.on_request_end.append(on_end)
+    trace.on_request_exception.append(on_end)
+    return trace
+
+def _run_trial(url: str, paths: List[str], concurrency: int, finder_options: dict, results):
+    """Child process entry point running one scan and reporting its stats"""
+    latencies: List[float] = []
+    finder = AdminPanelFinder(
+        url,
+        threads=concurrency,
+        wordlist=Wordlist(paths=paths),
+        trace_configs=[_latency_trace(latencies)],
+        **finder_options
+    )
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(finder.scan())
+    elapsed = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    requests = len(latencies)
+    results.put({
+        'requests': requests,
+        'found': len(finder.results),
+        'aliases': finder.metrics.counters['aliases'],
+        'elapsed_s': round(elapsed, 4),
+        'req_per_sec': round(requests / elapsed, 1) if elapsed else None,
+        'latency_ms': {
+            f'p{p}': round(_percentile(latencies, p) * 1000, 3) if latencies else None
+            for p in (50, 95, 99)
+        },
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'cpu_ms_per_request': round(cpu * 1000 / requests, 4) if requests else None,
+        'phase_mean_ms': {
+            phase: round(h.sum / h.count * 1000, 3)
+            for phase, h in finder.metrics.phases.items() if h.count
+        },
+    })
+
+# Seconds between checks that a trial process is still alive
+TRIAL_POLL_INTERVAL = 1.0
+# Seconds a single trial may run before it is killed and reported as failed
+TRIAL_TIMEOUT = 900
+
+def _trial_stats(trial, results, timeout: float = TRIAL_TIMEOUT) -> Optional[dict]:
+    """Wait for a trial's stats; None if the process died or ran past timeout"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return results.get(timeout=TRIAL_POLL_INTERVAL)
+        except queue.Empty:
+            pass
+        if not trial.is_alive():
+            # Stats put just before exiting may still be in flight
+            try:
+                return results.get(timeout=TRIAL_POLL_INTERVAL)
+            except queue.Empty:
+                return None
+        if time.monotonic() > deadline:
+            trial.terminate()
+            return None
+
+def run_benchmark(profile: ServerProfile, concurrency_levels: List[int], sizes: List[int],
+                  finder_options: dict) -> List[dict]:
+    """Start the stand-in server once and run every (concurrency, size) trial"""
+    ctx = multiprocessing.get_context('spawn')
+    ready, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=_serve, args=(profile, ready, stop), daemon=True)
+    server.start()
+
+    trials = []
+    try:
+        url = f'http://127.0.0.1:{ready.get(timeout=30)}'
+        for size in sizes:
+            paths = build_wordlist(size, profile.hit_ratio)
+            for concurrency in concurrency_levels:
+                # A fresh process per trial keeps peak RSS and CPU figures independent
+                results = ctx.Queue()
+                trial = ctx.Process(target=_run_trial,
+                                    args=(url, paths, concurrency, finder_options, results))
+                trial.start()
+                stats = _trial_stats(trial, results)
+                trial.join()
+                if stats is None:
+                    error = f"trial process failed (exit code {trial.exitcode})"
+                    trials.append({'concurrency': concurrency, 'paths': size, 'error': error})
+                    print(f"[BENCH] paths={size} concurrency={concurrency} {error}", file=sys.stderr)
+                    continue
+                trials.append({'concurrency': concurrency, 'paths': size, **stats})
+                print(f"[BENCH] paths={size} concurrency={concurrency} "
+                      f"{stats['req_per_sec']} req/s p95={stats['latency_ms']['p95']}ms",
+                      file=sys.stderr)
+    finally:
+        stop.set()
+        server.join(timeout=5)
+    return trials
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Describe every trial whose throughput regressed beyond tolerance"""
+    previous = {(t['concurrency'], t['paths']): t for t in baseline.get('results', [])}
+    regressions = []
+    for trial in report['results']:
+        old = previous.get((trial['concurrency'], trial['paths']))
+        if not old or not old.get('req_per_sec') or not trial.get('req_per_sec'):
+            continue
+        change = trial['req_per_sec'] / old['req_per_sec'] - 1
+        if change < -tolerance:
+            regressions.append(f"paths={trial['paths']} concurrency={trial['concurrency']}: "
+                               f"{old['req_per_sec']} -> {trial['req_per_sec']} req/s ({change:+.1%})")
+    return regressions
+
+def microbenchmark(paths: List[str], repeat: int = 5) -> dict:
+    """CPU cost of preparing one probe: per-request rebuilding vs request templates"""
+    finder = AdminPanelFinder('http://127.0.0.1:1', wordlist=Wordlist(paths=paths))
+    target = finder.target
+    
+    def rebuilt():
+        # What every probe used to do before request templates
+        for path in paths:
+            urljoin(target + '/', path)
+            finder._get_headers()
+            aiohttp.ClientTimeout(total=finder.timeout)
+            time.time()
+    
+    def templated():
+        for path in paths:
+            template = finder._template(target)
+            template.url(path)
+            template.get_headers
+            time.perf_counter()
+    
+    report = {'paths': len(paths)}
+    for name, job in (('rebuilt', rebuilt), ('templated', templated)):
+        best = min(timeit.repeat(job, number=1, repeat=repeat))
+        report[f'{name}_us_per_request'] = round(best / len(paths) * 1e6, 3)
+    report['saving'] = round(1 - report['templated_us_per_request'] / report['rebuilt_us_per_request'], 3)
+    return report
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(',') if v]
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark AdminPanelFinder against a local stand-in server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --profile wildcard --concurrency 20,100,200 --paths 1000,10000
+  %(prog)s --latency exp:0.05 --error-rate 0.02 -o bench.json
+  %(prog)s --baseline bench.json --tolerance 0.1
+  %(prog)s --micro --paths 100000
+        """
+    )
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='baseline',
+                        help='Server profile preset (default: baseline)')
+    parser.add_argument('--latency', help='Latency distribution: fixed:S, uniform:LO,HI or exp:MEAN')
+    parser.add_argument('--wildcard', action='store_true', help='Answer unknown paths with 200')
+    parser.add_argument('--body-size', type=int, help='Filler bytes in every HTML page')
+    parser.add_argument('--auth-ratio', type=float, help='Share of hits answered with 401 + realm')
+    parser.add_argument('--error-rate', type=float, help='Share of requests failing with 500/503/reset')
+    parser.add_argument('--concurrency', type=_int_list, default=[10, 50, 200],
+                        help='Comma-separated concurrency levels (default: 10,50,200)')
+    parser.add_argument('--paths', type=_int_list, default=[1000],
+                        help='Comma-separated wordlist sizes (default: 1000)')
+    parser.add_argument('--probe', default='get', help='Probe strategy passed to the scanner')
+    parser.add_argument('--micro', action='store_true',
+                        help='Only run the request-preparation microbenchmark (no server)')
+    parser.add_argument('-o', '--output', help='Write the JSON report to a file instead of stdout')
+    parser.add_argument('--baseline', help='Previous JSON report to compare throughput against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Allowed req/s drop versus --baseline before failing (default: 0.1)')
+    args = parser.parse_args()
+
+    overrides = {
+        'latency': args.latency,
+        'wildcard': args.wildcard or None,
+        'body_size': args.body_size,
+        'auth_ratio': args.auth_ratio,
+        'error_rate': args.error_rate,
+    }
+    profile = replace(PROFILES[args.profile], **{k: v for k, v in overrides.items() if v is not None})
+    _latency_sampler(profile.latency)
+
+    if args.micro:
+        print(json.dumps([microbenchmark(build_wordlist(size, profile.hit_ratio)) for size in args.paths], indent=2))
+        return
+    
+    finder_options = {'probe': args.probe, 'per_host': max(args.concurrency)}
+    report = {
+        'profile': {'name': args.profile, **asdict(profile)},
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': run_benchmark(profile, args.concurrency, args.paths, finder_options),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"[REGRESSION] {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+    if any('error' in trial for trial in report['results']):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+from aiohttp import web
+
+# admin_finder.py is a single module at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from admin_finder import AdminPanelFinder, ScanConfig, Wordlist  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """Start local HTTP servers answering every path with an aiohttp handler;
+    each call returns the base URL of a new server"""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    runners = []
+    
+    async def start(handler):
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, '127.0.0.1', 0).start()
+        runners.append(runner)
+        return f'http://127.0.0.1:{runner.addresses[0][1]}'
+    
+    yield lambda handler: asyncio.run_coroutine_threadsafe(start(handler), loop).result()
+    for runner in runners:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def scan(server):
+    """Run a quiet scan of paths against a base URL or a handler (served
+    locally) and return the finder; options are ScanConfig fields"""
+    def run(target, paths, **options):
+        if not isinstance(target, str):
+            target = server(target)
+        wordlist = options.pop('wordlist', None) or Wordlist(paths=list(paths))
+        options.setdefault('threads', 4)
+        options.setdefault('retries', 0)
+        finder = AdminPanelFinder(config=ScanConfig(targets=(target,), wordlist=wordlist, **options))
+        asyncio.run(finder.scan())
+        return finder
+    return run
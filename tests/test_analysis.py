@@ -0,0 +1,31 @@
+from aiohttp import web
+
+from admin_finder import IndicatorMatcher, analyze_body
+
+
+def test_title_uses_the_declared_charset():
+    matcher = IndicatorMatcher(['admin'])
+    
+    assert matcher.title('<title>Café admin</title>'.encode('latin-1'), 'latin-1') == 'Café admin'
+    assert matcher.title('<title>Café admin</title>'.encode('utf-8')) == 'Café admin'
+    assert matcher.title(b'<p>no title</p>') is None
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    matcher = IndicatorMatcher(['admin', 'password'])
+    body = '<title>Admin — login</title><input type="password">'.encode('utf-8')
+    
+    assert matcher.title(body, 'x-bogus') == 'Admin — login'
+    indicators, title, score, classification = analyze_body(matcher, body, 200, {}, 'x-bogus')
+    assert (indicators, title, classification) == (['admin', 'password'], 'Admin — login', 'login-form')
+
+
+def test_page_with_unknown_charset_is_reported(scan):
+    async def handler(request):
+        if request.path == '/admin':
+            return web.Response(body=b'<html><title>Admin login</title>username password</html>',
+                                headers={'Content-Type': 'text/html; charset=x-bogus'})
+        return web.Response(status=404)
+    
+    finder = scan(handler, ['admin', 'nothing'], fingerprint=False)
+    assert [result.title for result in finder.results] == ['Admin login']
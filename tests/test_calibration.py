@@ -0,0 +1,59 @@
+from aiohttp import web
+
+from admin_finder import WildcardFingerprint
+
+
+def paths(finder):
+    return sorted(result.url.split('/', 3)[3] for result in finder.results)
+
+
+def test_header_match_needs_the_exact_length():
+    wildcard = WildcardFingerprint(status=200, length=91, location=None, prefix_hash='', simhash=0)
+    
+    assert wildcard.matches_headers(200, None, 91, 'anything')
+    assert not wildcard.matches_headers(200, None, 79, 'wp-login.php')
+    assert not wildcard.matches_headers(200, None, 92, 'anything')
+    assert not wildcard.matches_headers(404, None, 91, 'anything')
+    assert not wildcard.matches_headers(200, None, None, 'anything')
+
+
+def test_header_match_allows_drift_from_echoed_paths():
+    # Calibrated with a 12-character path echoed twice
+    wildcard = WildcardFingerprint(status=200, length=500, location=None, prefix_hash='', simhash=0,
+                                   path_length=12, reflections=2)
+    
+    assert wildcard.matches_headers(200, None, 500 + 2 * (5 - 12), 'admin')
+    assert not wildcard.matches_headers(200, None, 500, 'admin')
+
+
+CATCH_ALL = b'<html><head><title>Site</title></head><body>' + b'x' * 30 + b' nothing here</body></html>'
+LOGIN = (b'<html><head><title>Site</title></head><body><form method="post"><input name="username">'
+         b'<input type="password" name="password"><button>Sign in to the admin dashboard</button>'
+         b'</form></body></html>')
+
+
+def test_soft_404_keeps_real_pages_with_close_lengths(scan):
+    wordpress = b'<html><title>WordPress</title><form>log in password</form></html>'
+    
+    async def handler(request):
+        if request.path == '/wp-login.php':
+            return web.Response(body=wordpress, content_type='text/html')
+        if request.path == '/admin':
+            return web.Response(body=LOGIN, content_type='text/html')
+        return web.Response(body=CATCH_ALL, content_type='text/html')
+    
+    finder = scan(handler, ['admin', 'wp-login.php', 'backup', 'cpanel', 'manager'], fingerprint=False)
+    assert paths(finder) == ['admin', 'wp-login.php']
+
+
+def test_reflecting_wildcard_pages_are_filtered(scan):
+    async def handler(request):
+        if request.path == '/admin':
+            return web.Response(body=LOGIN, content_type='text/html')
+        page = f'<html><title>Welcome</title>Page {request.path} not here {"x" * 5000}</html>'
+        return web.Response(text=page, content_type='text/html')
+    
+    finder = scan(handler, ['admin', 'administrator', 'login', 'panel/login.php', 'x'], fingerprint=False)
+    assert paths(finder) == ['admin']
+    assert finder.wildcard_filtered == 4
+
@@ -0,0 +1,93 @@
+from aiohttp import web
+
+from admin_finder import BodyDigest, CheckpointJournal, ScanResult, _work_key
+
+LOGIN = b'<html><title>Admin login</title><form>username <input type="password"></form></html>'
+
+
+def result(url, target='http://panel.test'):
+    return ScanResult(url=url, status_code=200, response_time=0.1, redirect_url=None, content_length=10,
+                      server=None, title='Admin login', admin_indicators=['admin'], target=target)
+
+
+def test_journal_restores_finished_work_and_findings(tmp_path):
+    path = str(tmp_path / 'journal.db')
+    page, other = BodyDigest('a' * 40, 1), BodyDigest('b' * 40, 3)
+    primary = result('http://panel.test/admin')
+    alias = result('http://panel.test/login')
+    alias.redirect_url = 'http://panel.test/signin'
+    journal = CheckpointJournal(path)
+    journal.record('http://panel.test', 'admin', 'found', primary, page)
+    journal.record('http://panel.test', 'login', 'alias', alias, other, alias_of=primary)
+    journal.record('http://panel.test', 'backup', 'miss')
+    journal.record('http://panel.test', 'flaky', 'error')
+    journal.close()
+    
+    journal = CheckpointJournal(path, resume=True)
+    finished, found, members = journal.load()
+    journal.close()
+    assert finished == {_work_key('http://panel.test', 'admin'), _work_key('http://panel.test', 'login'),
+                        _work_key('http://panel.test', 'backup')}
+    assert [(r.url, r.aliases) for r in found] == [('http://panel.test/admin', ['http://panel.test/login'])]
+    assert members == {'http://panel.test/admin': (None, page),
+                       'http://panel.test/login': ('http://panel.test/signin', other)}
+
+
+def test_journal_starts_empty_without_resume(tmp_path):
+    path = str(tmp_path / 'journal.db')
+    journal = CheckpointJournal(path)
+    journal.record('http://panel.test', 'admin', 'miss')
+    journal.close()
+    
+    journal = CheckpointJournal(path)
+    assert journal.load() == (set(), [], {})
+    journal.close()
+
+
+def test_resume_skips_finished_probes(server, scan, tmp_path):
+    requested = []
+    
+    async def handler(request):
+        requested.append(request.path)
+        if request.path == '/admin':
+            return web.Response(body=LOGIN, content_type='text/html')
+        return web.Response(status=404)
+    
+    base = server(handler)
+    checkpoint = str(tmp_path / 'scan.db')
+    paths = ['admin', 'backup', 'login', 'panel']
+    # An interrupted scan that got through the first two paths
+    journal = CheckpointJournal(checkpoint)
+    journal.record(base, 'admin', 'found', result(base + '/admin', target=base))
+    journal.record(base, 'backup', 'miss')
+    journal.close()
+    
+    finder = scan(base, paths, checkpoint=checkpoint, resume=True, fingerprint=False, calibrate=False)
+    assert sorted(requested) == ['/login', '/panel']
+    assert [r.url for r in finder.results] == [base + '/admin']
+    
+    requested.clear()
+    finder = scan(base, paths, checkpoint=checkpoint, resume=True, fingerprint=False, calibrate=False)
+    assert requested == []
+    assert [r.url for r in finder.results] == [base + '/admin']
+
+
+def test_resumed_findings_keep_merging_duplicates(scan, server, tmp_path):
+    async def handler(request):
+        # The page echoes its own path; admin and administrator redirect to it
+        if request.path in ('/admin', '/administrator'):
+            raise web.HTTPMovedPermanently('/admin/')
+        if request.path == '/admin/':
+            return web.Response(text=f'<title>Sign in</title><form action="{request.path}">'
+                                     f'<input type="password"></form>', content_type='text/html')
+        return web.Response(status=404)
+    
+    base = server(handler)
+    checkpoint = str(tmp_path / 'scan.db')
+    options = dict(checkpoint=checkpoint, threads=1, fingerprint=False, calibrate=False)
+    # Interrupted after admin/ and admin
+    scan(base, ['admin/', 'admin'], **options)
+    
+    finder = scan(base, ['admin/', 'admin', 'administrator'], resume=True, **options)
+    assert [(r.url, sorted(r.aliases)) for r in finder.results] == [
+        (base + '/admin/', [base + '/admin', base + '/administrator'])]
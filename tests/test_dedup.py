@@ -0,0 +1,69 @@
+import itertools
+
+import pytest
+from aiohttp import web
+
+from admin_finder import BodyDigest, ResponseClusterer, ScanResult, body_digest
+
+PAGE = ('<html><title>Sign in</title><form action="{path}"><input name="username">'
+        '<input type="password" name="password"></form>' + ' lorem ipsum' * 3 + '</html>')
+
+
+async def echoing_handler(request):
+    """/admin/ echoes its own path; admin and administrator redirect there"""
+    if request.path in ('/admin', '/administrator'):
+        raise web.HTTPMovedPermanently('/admin/')
+    if request.path == '/admin/':
+        return web.Response(text=PAGE.format(path=request.path), content_type='text/html')
+    return web.Response(status=404)
+
+
+def result(path, redirect_url=None, status=200):
+    return ScanResult(url=f'http://panel.test/{path}', status_code=status, response_time=0.1,
+                      redirect_url=redirect_url, content_length=10, server=None, title=None,
+                      admin_indicators=[], target='http://panel.test')
+
+
+def test_digest_strips_the_probed_and_final_paths():
+    body = PAGE.format(path='/admin/').encode()
+    
+    assert body_digest(body, 'administrator', 'admin/') == body_digest(body, 'admin/')
+    assert body_digest(body, 'admin') == body_digest(body, 'admin/', 'admin/')
+    assert body_digest(body, 'administrator') != body_digest(body, 'admin')
+
+
+def test_clusterer_merges_by_redirect_hash_and_simhash():
+    clusters = ResponseClusterer()
+    page = BodyDigest('a' * 40, 0b1111)
+    
+    primary = result('admin')
+    assert clusters.assign(primary, page) is None
+    assert clusters.assign(result('admin/'), BodyDigest('a' * 40, 0)) is primary
+    assert clusters.assign(result('panel'), BodyDigest('b' * 40, 0b0111)) is primary
+    assert clusters.assign(result('other'), BodyDigest('c' * 40, 0xFFFF0000)) is None
+    # Same body, different status: a separate finding
+    assert clusters.assign(result('admin', status=403), page) is None
+    assert primary.aliases == ['http://panel.test/admin/', 'http://panel.test/panel']
+    assert clusters.merged == 2
+
+
+def test_aliases_register_their_redirect_and_digest():
+    clusters = ResponseClusterer()
+    page = BodyDigest('a' * 40, 1)
+    
+    primary = result('admin/')
+    clusters.assign(primary, page)
+    # Merged by digest, so its redirect target now leads to the same finding
+    clusters.assign(result('admin', redirect_url='http://panel.test/login'), BodyDigest('b' * 40, 1))
+    assert clusters.known_redirect('http://panel.test', 200, 'http://panel.test/login') is primary
+    assert clusters.assign(result('administrator', redirect_url='http://panel.test/login'), None) is primary
+    # ...and so does its digest
+    assert clusters.assign(result('cp'), BodyDigest('b' * 40, 0xFFFF0000)) is primary
+
+
+@pytest.mark.parametrize('order', list(itertools.permutations(['admin', 'admin/', 'administrator'])))
+def test_one_finding_whatever_the_probe_order(scan, order):
+    finder = scan(echoing_handler, list(order), threads=1, fingerprint=False, calibrate=False)
+    
+    assert len(finder.results) == 1
+    assert len(finder.results[0].aliases) == 2
@@ -0,0 +1,109 @@
+import asyncio
+import socket
+
+import pytest
+
+import admin_finder
+from admin_finder import (CachedResolver, DNSCache, NEGATIVE_DNS_TTL, NXDomainError,
+                          StaticResolver)
+
+
+class CountingResolver(StaticResolver):
+    """StaticResolver that records every upstream lookup"""
+    
+    def __init__(self, mapping, fallback=None):
+        super().__init__(mapping, fallback)
+        self.calls = []
+    
+    async def resolve_host(self, host):
+        self.calls.append(host)
+        return await super().resolve_host(host)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for cache expiry"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(admin_finder.time, 'time', lambda: now[0])
+    return now
+
+
+def test_static_resolver_answers_pins_and_falls_back():
+    fallback = StaticResolver({'other.test': ['192.0.2.2']})
+    resolver = StaticResolver({'Pinned.Test': ['192.0.2.1']}, fallback=fallback)
+    
+    assert asyncio.run(resolver.resolve_host('pinned.test')) == ['192.0.2.1']
+    assert asyncio.run(resolver.resolve_host('other.test')) == ['192.0.2.2']
+    assert resolver.is_pinned('PINNED.test')
+    assert not resolver.is_pinned('other.test')
+    with pytest.raises(NXDomainError):
+        asyncio.run(StaticResolver({}).resolve_host('missing.test'))
+
+
+def test_cached_answers_expire_after_ttl(clock):
+    upstream = CountingResolver({'host.test': ['192.0.2.1']})
+    resolver = CachedResolver(DNSCache(), upstream=upstream, ttl=30)
+    
+    assert asyncio.run(resolver.lookup('host.test')) == ['192.0.2.1']
+    clock[0] += 29
+    assert asyncio.run(resolver.lookup('host.test')) == ['192.0.2.1']
+    assert upstream.calls == ['host.test']
+    
+    clock[0] += 1
+    assert resolver.cache.get('host.test') is None
+    assert asyncio.run(resolver.lookup('host.test')) == ['192.0.2.1']
+    assert upstream.calls == ['host.test', 'host.test']
+
+
+def test_nxdomain_is_cached_negatively(clock):
+    upstream = CountingResolver({})
+    resolver = CachedResolver(DNSCache(), upstream=upstream, ttl=300)
+    
+    assert asyncio.run(resolver.lookup('missing.test')) == []
+    assert asyncio.run(resolver.lookup('missing.test')) == []
+    assert upstream.calls == ['missing.test']
+    with pytest.raises(OSError):
+        asyncio.run(resolver.resolve('missing.test', 80))
+    
+    # Negative answers use their own, shorter TTL
+    clock[0] += NEGATIVE_DNS_TTL
+    assert asyncio.run(resolver.lookup('missing.test')) == []
+    assert upstream.calls == ['missing.test', 'missing.test']
+
+
+def test_resolve_filters_address_family():
+    resolver = CachedResolver(DNSCache(), upstream=StaticResolver({'host.test': ['192.0.2.1', '2001:db8::1']}))
+    
+    answers = asyncio.run(resolver.resolve('host.test', 443, family=socket.AF_UNSPEC))
+    assert [(a['host'], a['family'], a['port']) for a in answers] == [
+        ('192.0.2.1', socket.AF_INET, 443), ('2001:db8::1', socket.AF_INET6, 443)]
+    answers = asyncio.run(resolver.resolve('host.test', 443, family=socket.AF_INET6))
+    assert [a['host'] for a in answers] == ['2001:db8::1']
+
+
+def test_pins_are_not_written_to_the_disk_cache(tmp_path):
+    path = str(tmp_path / 'dns.sqlite')
+    upstream = StaticResolver({'pinned.test': ['192.0.2.1']},
+                              fallback=StaticResolver({'other.test': ['192.0.2.2']}))
+    resolver = CachedResolver(DNSCache(path), upstream=upstream, ttl=300)
+    
+    assert asyncio.run(resolver.lookup('pinned.test')) == ['192.0.2.1']
+    assert asyncio.run(resolver.lookup('other.test')) == ['192.0.2.2']
+    assert asyncio.run(resolver.lookup('missing.test')) == []
+    resolver.cache.save()
+    
+    reloaded = DNSCache(path)
+    assert reloaded.get('pinned.test') is None
+    assert reloaded.get('other.test') == ['192.0.2.2']
+    assert reloaded.get('missing.test') == []
+
+
+def test_preresolve_drops_targets_that_do_not_resolve():
+    config = admin_finder.ScanConfig(
+        targets=('http://pinned.test', 'http://missing.test:8080', 'http://127.0.0.1'),
+        resolver=StaticResolver({'pinned.test': ['192.0.2.1']}))
+    finder = admin_finder.AdminPanelFinder(config=config)
+    
+    asyncio.run(finder._preresolve())
+    assert finder.targets == ['http://pinned.test', 'http://127.0.0.1']
+    assert finder.unresolved == ['http://missing.test:8080']
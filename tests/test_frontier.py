@@ -0,0 +1,120 @@
+import asyncio
+
+from aiohttp import web
+
+from admin_finder import AdminPanelFinder, Reporter, ScanConfig, URLFrontier, Wordlist
+
+
+class CountingPaths:
+    """Reusable path list that counts how often it is iterated"""
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.paths)
+
+
+def drain(frontier):
+    items = []
+    while True:
+        item = frontier.pop()
+        if item is None:
+            return items
+        items.append(item)
+
+
+def test_forms_come_before_links_and_directory_expansions():
+    frontier = URLFrontier(Wordlist(paths=['login']))
+    frontier.push_directory('t', 'admin/', 1)
+    frontier.push('t', 'admin/page', 1, URLFrontier.LINK)
+    frontier.push('t', 'admin/post', 1, URLFrontier.FORM)
+    frontier.push('t', 'shallow', 0, URLFrontier.LINK)
+
+    assert drain(frontier) == [('t', 'shallow'), ('t', 'admin/post'), ('t', 'admin/page'), ('t', 'admin/login')]
+    assert frontier.depth('t', 'admin/login') == 1
+
+
+def test_paths_are_queued_once_and_skip_the_base_wordlist():
+    frontier = URLFrontier(Wordlist(paths=['login', 'panel']))
+    frontier.base.add('admin/panel')
+    frontier.push('t', 'admin/login', 1, URLFrontier.LINK)
+    frontier.push('t', 'admin/login', 1, URLFrontier.FORM)
+    frontier.push('t', 'admin/panel', 1, URLFrontier.LINK)
+    frontier.push_directory('t', 'admin/', 1)
+    frontier.push_directory('t', 'admin/', 1)
+
+    assert drain(frontier) == [('t', 'admin/login')]
+
+
+def test_depth_and_budget_limits():
+    frontier = URLFrontier(Wordlist(paths=['a', 'b', 'c']), max_depth=1, budget=2)
+    frontier.push('t', 'too/deep', 2, URLFrontier.LINK)
+    frontier.push_directory('t', 'dir/', 1)
+    frontier.push_directory('other', 'dir/', 1)
+
+    assert drain(frontier) == [('t', 'dir/a'), ('t', 'dir/b'), ('other', 'dir/a'), ('other', 'dir/b')]
+    assert frontier.discovered == 4
+
+
+def test_queued_expansions_share_one_pass_over_the_wordlist():
+    paths = CountingPaths(['a', 'b', 'a', 'c'])
+    frontier = URLFrontier(Wordlist(paths=paths), budget=10_000)
+    for index in range(100):
+        frontier.push_directory('t', f'dir{index}/', 1)
+
+    items = drain(frontier)
+
+    assert len(items) == 300
+    assert items[:3] == [('t', 'dir0/a'), ('t', 'dir0/b'), ('t', 'dir0/c')]
+    assert paths.iterations == 1
+    assert frontier._entries == ['a', 'b', 'c']
+
+
+def test_recursive_scan_follows_links_forms_and_directories(scan):
+    pages = {
+        '/admin/': '<title>Index</title><a href="/admin/settings.php">settings</a>',
+        '/admin/settings.php': '<form action="/admin/secret-login"><input type=password></form>',
+        '/admin/secret-login': '<title>Secret login</title>username password',
+        '/admin/dashboard': '<title>Dashboard</title>dashboard admin',
+    }
+    hits = {}
+
+    async def handler(request):
+        hits[request.path] = hits.get(request.path, 0) + 1
+        if request.path in pages:
+            return web.Response(text=pages[request.path], content_type='text/html')
+        return web.Response(status=404, text='nope')
+
+    finder = scan(handler, ['admin/', 'dashboard'], recursive=True)
+
+    found = {result.url.split('/', 3)[3] for result in finder.results}
+    assert {'admin/', 'admin/settings.php', 'admin/secret-login', 'admin/dashboard'} <= found
+    assert all(count == 1 for path, count in hits.items() if not path.startswith('/.'))
+
+
+def test_sharded_recursion_fetches_each_url_once(server):
+    hits = {}
+
+    async def handler(request):
+        path = request.path
+        hits[path] = hits.get(path, 0) + 1
+        name = path.strip('/')
+        if name.startswith('dir') and '/' not in name:
+            if not path.endswith('/'):
+                raise web.HTTPFound(path + '/')
+            return web.Response(text=f'<title>{name}</title>admin panel', content_type='text/html')
+        return web.Response(status=404, text='nope')
+
+    directories = [f'dir{index}' for index in range(8)]
+    wordlist = Wordlist(paths=[path for name in directories for path in (name, name + '/')] + ['login'])
+    config = ScanConfig(targets=(server(handler),), wordlist=wordlist, threads=6, retries=0,
+                        recursive=True, fingerprint=False, dedup=False)
+
+    finder = AdminPanelFinder(config=config, reporter=Reporter())
+    asyncio.run(finder.scan_sharded(3))
+
+    assert {f'/{name}/login' for name in directories} <= set(hits)
+    assert all(count == 1 for path, count in hits.items() if path.endswith('login'))
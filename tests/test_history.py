@@ -0,0 +1,90 @@
+from aiohttp import web
+
+from admin_finder import BodyDigest, ScanHistory, ScanResult
+
+
+def site(pages, requests):
+    """Handler serving pages (path -> body) with ETags, answering 304 when
+    the client's validator still matches; admin and administrator redirect
+    to admin/"""
+    async def handler(request):
+        requests.append((request.path, request.headers.get('If-None-Match')))
+        if request.path in ('/admin', '/administrator') and '/admin/' in pages:
+            raise web.HTTPMovedPermanently('/admin/')
+        body = pages.get(request.path)
+        if body is None:
+            return web.Response(status=404)
+        etag = f'"{hash(body) & 0xffffffff:x}"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(text=body, content_type='text/html', headers={'ETag': etag})
+    return handler
+
+
+LOGIN = '<title>Sign in</title><form action="{}"><input type="password"></form>'
+
+
+def test_history_round_trips_results_and_digests(tmp_path):
+    path = str(tmp_path / 'history.db')
+    page = BodyDigest('a' * 40, 7)
+    history = ScanHistory(path)
+    found = ScanResult(url='http://panel.test/admin', status_code=200, response_time=0.1, redirect_url=None,
+                       content_length=10, server=None, title='Sign in', admin_indicators=[],
+                       target='http://panel.test', etag='"v1"')
+    history.record('http://panel.test', 'admin', 'found', found, page)
+    history.record('http://panel.test', 'backup', 'miss')
+    history.close()
+    
+    history = ScanHistory(path, dead_after=1)
+    assert history.previous_scans == 1
+    assert history.conditional_headers('http://panel.test', 'admin') == {'If-None-Match': '"v1"'}
+    previous, digest = history.previous_result('http://panel.test', 'admin')
+    assert (previous.url, digest) == (found.url, page)
+    assert history.previous_result('http://panel.test', 'backup') is None
+    assert len(history.dead) == 1
+    history.close()
+
+
+def test_unchanged_panels_are_reused_from_304s(scan, server, tmp_path):
+    requests = []
+    base = server(site({'/admin': LOGIN.format('/admin')}, requests))
+    options = dict(history=str(tmp_path / 'history.db'), fingerprint=False, calibrate=False)
+    
+    scan(base, ['admin', 'backup'], **options)
+    requests.clear()
+    finder = scan(base, ['admin', 'backup'], **options)
+    assert ('/admin', None) not in requests
+    assert finder.not_modified == 1
+    assert [r.title for r in finder.results] == ['Sign in']
+    assert finder.diff == {'new': [], 'changed': [], 'disappeared': []}
+
+
+def test_aliases_of_a_reused_panel_stay_aliases(scan, server, tmp_path):
+    base = server(site({'/admin/': LOGIN.format('/admin/')}, []))
+    options = dict(history=str(tmp_path / 'history.db'), threads=1, fingerprint=False, calibrate=False)
+    
+    for _ in range(3):
+        finder = scan(base, ['admin/', 'admin', 'administrator'], **options)
+        assert [(r.url, len(r.aliases)) for r in finder.results] == [(base + '/admin/', 2)]
+    assert finder.not_modified == 1
+    assert finder.diff == {'new': [], 'changed': [], 'disappeared': []}
+
+
+def test_dead_paths_are_skipped_and_changes_reported(scan, server, tmp_path):
+    requests = []
+    pages = {'/admin': LOGIN.format('/admin'), '/panel': '<title>Panel</title>password'}
+    base = server(site(pages, requests))
+    options = dict(history=str(tmp_path / 'history.db'), dead_after=1, explore=0, fingerprint=False,
+                   calibrate=False)
+    scan(base, ['admin', 'panel', 'backup'], **options)
+    
+    pages['/admin'] = '<title>Administration</title><input type="password">'
+    pages['/new'] = '<title>New admin</title>password'
+    del pages['/panel']
+    requests.clear()
+    finder = scan(base, ['admin', 'panel', 'backup', 'new'], **options)
+    assert '/backup' not in [path for path, _ in requests]
+    assert finder.history_skipped == 1
+    assert [entry['url'] for entry in finder.diff['new']] == [base + '/new']
+    assert finder.diff['changed'] == [{'url': base + '/admin', 'changes': {'title': ['Sign in', 'Administration']}}]
+    assert finder.diff['disappeared'] == [{'url': base + '/panel', 'target': base}]
@@ -0,0 +1,108 @@
+import csv
+import json
+import socket
+import sqlite3
+
+import pytest
+from aiohttp import web
+
+from admin_finder import (CSVSink, HTMLSink, JSONSink, NDJSONSink, SQLiteSink, ScanResult, TextSink,
+                          create_sink)
+
+LOGIN = b'<html><title>Admin login</title><form>username <input type="password"></form></html>'
+PMA = b'<html><title>phpMyAdmin</title>username password</html>'
+
+
+async def handler(request):
+    if request.path in ('/admin', '/admin/'):
+        return web.Response(body=LOGIN, content_type='text/html')
+    if request.path == '/phpmyadmin':
+        return web.Response(body=PMA, content_type='text/html')
+    return web.Response(status=404)
+
+
+def result(path, **changes):
+    fields = dict(url=f'http://panel.test/{path}', status_code=200, response_time=0.25, redirect_url=None,
+                  content_length=10, server='nginx', title='Admin login', admin_indicators=['admin', 'login'],
+                  target='http://panel.test', score=2.0, classification='login-form')
+    fields.update(changes)
+    return ScanResult(**fields)
+
+
+SCAN_INFO = {'target': 'http://panel.test', 'target_label': 'http://panel.test', 'found_panels': 2,
+             'aliases': {'http://panel.test/admin': ['http://panel.test/admin/']}}
+
+
+def test_sinks_are_picked_by_extension():
+    assert type(create_sink('out.JSON')) is JSONSink
+    assert type(create_sink('out.jsonl')) is NDJSONSink
+    assert type(create_sink('out.sqlite3')) is SQLiteSink
+    assert type(create_sink('out.htm')) is HTMLSink
+    assert type(create_sink('out.log')) is TextSink
+
+
+def test_file_sinks_stream_results_and_aliases(tmp_path):
+    paths = {kind: str(tmp_path / f'out.{kind}') for kind in ('json', 'ndjson', 'csv', 'txt')}
+    sinks = [create_sink(path) for path in paths.values()]
+    first, second = result('admin'), result('cpanel', title='cPanel')
+    for sink in sinks:
+        sink.open()
+        sink.write(first)
+    # Output is readable before the scan ends
+    assert json.loads(open(paths['ndjson']).readline())['url'] == first.url
+    first.aliases.append('http://panel.test/admin/')
+    for sink in sinks:
+        sink.alias(first, 'http://panel.test/admin/')
+        sink.write(second)
+        sink.close(SCAN_INFO)
+    
+    report = json.load(open(paths['json']))
+    assert [r['url'] for r in report['results']] == [first.url, second.url]
+    assert report['scan_info']['found_panels'] == 2
+    lines = [json.loads(line) for line in open(paths['ndjson'])]
+    assert lines[1] == {'url': 'http://panel.test/admin/', 'alias_of': first.url}
+    rows = list(csv.reader(open(paths['csv'], newline='')))
+    assert rows[0] == CSVSink.HEADER and [row[0] for row in rows[1:]] == [first.url, second.url]
+    text = open(paths['txt']).read()
+    assert '1. http://panel.test/admin\n' in text and '      = http://panel.test/admin/' in text
+
+
+def test_sqlite_sink_updates_aliases_and_replaces_old_runs(tmp_path):
+    path = str(tmp_path / 'out.db')
+    for run in range(2):
+        sink = SQLiteSink(path)
+        sink.open()
+        primary = result('admin')
+        sink.write(primary)
+        primary.aliases.append('http://panel.test/admin/')
+        sink.alias(primary, 'http://panel.test/admin/')
+        sink.close({'run': run})
+    
+    db = sqlite3.connect(path)
+    assert db.execute('SELECT url, aliases FROM results').fetchall() == [
+        ('http://panel.test/admin', 'http://panel.test/admin/')]
+    assert db.execute('SELECT key, value FROM scan_info').fetchall() == [('run', '1')]
+
+
+def test_scan_streams_to_sinks_without_keeping_results(scan, tmp_path):
+    outputs = [str(tmp_path / name) for name in ('out.ndjson', 'out.db', 'out.html')]
+    finder = scan(handler, ['admin', 'phpmyadmin', 'admin/', 'nothing'], threads=1, keep_results=False,
+                  fingerprint=False, output=outputs)
+    
+    assert finder.results == [] and finder.found_count == 2
+    lines = [json.loads(line) for line in open(outputs[0])]
+    assert sorted(line['url'].rsplit('/', 1)[1] for line in lines if 'status_code' in line) == [
+        'admin', 'phpmyadmin']
+    db = sqlite3.connect(outputs[1])
+    assert db.execute("SELECT aliases FROM results WHERE url LIKE '%/admin'").fetchone()[0].endswith('/admin/')
+    assert 'phpMyAdmin' in open(outputs[2]).read()
+
+
+def test_sinks_are_closed_when_the_metrics_endpoint_fails(scan, tmp_path):
+    output = str(tmp_path / 'out.json')
+    with socket.socket() as busy:
+        busy.bind(('127.0.0.1', 0))
+        busy.listen()
+        with pytest.raises(OSError):
+            scan(handler, ['admin'], output=[output], metrics_port=busy.getsockname()[1])
+    assert json.load(open(output))['results'] == []
@@ -0,0 +1,219 @@
+import asyncio
+import shutil
+import socket
+import ssl
+import subprocess
+import threading
+
+import aiohttp
+import httpx
+import pytest
+
+from admin_finder import AdminPanelFinder, HTTP2Transport, ScanConfig, ScanMetrics
+
+
+@pytest.fixture
+def run_with_stub(monkeypatch):
+    """Run scenario(transport) against an opened HTTP2Transport whose httpx
+    clients answer from handler instead of the network"""
+    def run(handler, scenario):
+        client_class = httpx.AsyncClient
+        monkeypatch.setattr(httpx, 'AsyncClient', lambda **kwargs: client_class(
+            transport=httpx.MockTransport(handler), **kwargs))
+        
+        async def main():
+            transport = HTTP2Transport(limit=4, connections_per_host=2, timeout=5,
+                                       ssl_context=ssl.create_default_context(), metrics=ScanMetrics())
+            await transport.open()
+            try:
+                return await scenario(transport)
+            finally:
+                await transport.close()
+        return asyncio.run(main())
+    return run
+
+
+def test_range_get_reads_only_up_to_the_body_cap(run_with_stub):
+    seen = []
+    
+    def handler(request):
+        seen.append((request.method, request.headers.get('Range')))
+        return httpx.Response(206, content=b'x' * 5000, headers={'Set-Cookie': 'sid=1; Path=/'})
+    
+    finder = AdminPanelFinder(config=ScanConfig(targets=('https://panel.test',), probe='range', max_body=1024))
+    
+    async def scenario(transport):
+        headers = finder._template('https://panel.test').get_headers
+        async with transport.get('https://panel.test/admin', headers=headers) as response:
+            body = await finder._read_capped(response, finder.max_body)
+            return response, body, transport.metrics
+    
+    response, body, metrics = run_with_stub(handler, scenario)
+    assert seen == [('GET', 'bytes=0-1023')]
+    assert response.status == 206
+    assert response.content_length == 5000
+    assert 'sid' in response.cookies
+    assert body == b'x' * 1024
+    assert metrics.requests == 1 and metrics.statuses[206] == 1
+
+
+def test_head_sends_no_body_and_follows_redirects(run_with_stub):
+    seen = []
+    
+    def handler(request):
+        seen.append((request.method, request.url.path))
+        if request.url.path == '/admin':
+            return httpx.Response(301, headers={'Location': '/admin/'})
+        return httpx.Response(200, headers={'Content-Length': '321'})
+    
+    async def scenario(transport):
+        async with transport.head('https://panel.test/admin', headers={}) as response:
+            return response, await response.content.read()
+    
+    response, body = run_with_stub(handler, scenario)
+    assert seen == [('HEAD', '/admin'), ('HEAD', '/admin/')]
+    assert response.status == 200
+    assert str(response.url) == 'https://panel.test/admin/'
+    assert [previous.status for previous in response.history] == [301]
+    assert response.content_length == 321
+    assert body == b''
+
+
+@pytest.mark.parametrize('error, expected', [
+    (httpx.ConnectTimeout('timed out'), asyncio.TimeoutError),
+    (httpx.ConnectError('refused'), aiohttp.ClientConnectionError),
+    (httpx.TooManyRedirects('loop'), aiohttp.ClientError),
+])
+def test_httpx_errors_map_onto_aiohttp_errors(run_with_stub, error, expected):
+    def handler(request):
+        raise error
+    
+    async def scenario(transport):
+        with pytest.raises(expected):
+            async with transport.get('https://panel.test/admin', headers={}):
+                pass
+        return transport.metrics
+    
+    metrics = run_with_stub(handler, scenario)
+    assert metrics.in_flight == 0
+    assert metrics.errors[type(error).__name__] == 1
+
+
+def test_errors_while_streaming_the_body_are_mapped(run_with_stub):
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b'<html>'
+            raise httpx.ReadError('connection reset')
+    
+    def handler(request):
+        return httpx.Response(200, stream=BrokenStream())
+    
+    async def scenario(transport):
+        async with transport.get('https://panel.test/admin', headers={}) as response:
+            assert await response.content.read(3) == b'<ht'
+            assert await response.content.read(10) == b'ml>'
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await response.content.read(10)
+    
+    run_with_stub(handler, scenario)
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+@pytest.fixture
+def hypercorn_server(tmp_path):
+    """Serve an ASGI app with hypercorn over TLS (h2 via ALPN) and plain
+    HTTP; yields the https and http base URLs and the TLS certificate"""
+    pytest.importorskip('hypercorn')
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    if shutil.which('openssl') is None:
+        pytest.skip('openssl is needed to create a test certificate')
+    cert, key = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1',
+                    '-keyout', str(key), '-out', str(cert)], check=True, capture_output=True)
+    requests = []
+    in_flight = [0, 0]
+    
+    async def app(scope, receive, send):
+        if scope['type'] != 'http':
+            return
+        requests.append((scope['http_version'], scope['client'][1]))
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.2)
+        in_flight[0] -= 1
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'text/plain')]})
+        await send({'type': 'http.response.body', 'body': scope['http_version'].encode()})
+    
+    tls_port, plain_port = free_port(), free_port()
+    config = Config()
+    config.bind = [f'127.0.0.1:{tls_port}']
+    config.insecure_bind = [f'127.0.0.1:{plain_port}']
+    config.certfile, config.keyfile = str(cert), str(key)
+    config.accesslog = config.errorlog = None
+    loop = asyncio.new_event_loop()
+    shutdown = asyncio.Event()
+    started = threading.Event()
+    
+    def run():
+        asyncio.set_event_loop(loop)
+        task = loop.create_task(serve(app, config, shutdown_trigger=shutdown.wait))
+        loop.call_soon(started.set)
+        loop.run_until_complete(task)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+    for port in (tls_port, plain_port):
+        for _ in range(100):
+            with socket.socket() as probe:
+                if probe.connect_ex(('127.0.0.1', port)) == 0:
+                    break
+            threading.Event().wait(0.05)
+    yield f'https://127.0.0.1:{tls_port}', f'http://127.0.0.1:{plain_port}', str(cert), requests, in_flight
+    loop.call_soon_threadsafe(shutdown.set)
+    thread.join()
+    loop.close()
+
+
+def fetch_all(urls, cafile):
+    """GET every URL concurrently over one HTTP2Transport connection per host"""
+    async def main():
+        transport = HTTP2Transport(limit=8, connections_per_host=1, timeout=5,
+                                   ssl_context=ssl.create_default_context(cafile=cafile), metrics=ScanMetrics())
+        await transport.open()
+        
+        async def fetch(url):
+            async with transport.get(url, headers={}) as response:
+                return response.status, await response.content.read()
+        try:
+            return await asyncio.gather(*(fetch(url) for url in urls))
+        finally:
+            await transport.close()
+    return asyncio.run(main())
+
+
+def test_https_targets_negotiate_h2_and_multiplex_one_connection(hypercorn_server):
+    https, _, cert, requests, in_flight = hypercorn_server
+    
+    responses = fetch_all([f'{https}/admin{index}' for index in range(6)], cert)
+    
+    assert responses == [(200, b'2')] * 6
+    assert {version for version, _ in requests} == {'2'}
+    assert len({port for _, port in requests}) == 1
+    assert in_flight[1] == 6
+
+
+def test_plain_http_targets_fall_back_to_http11(hypercorn_server):
+    _, http, cert, requests, _ = hypercorn_server
+    
+    responses = fetch_all([f'{http}/admin{index}' for index in range(3)], cert)
+    
+    assert responses == [(200, b'1.1')] * 3
+    assert {version for version, _ in requests} == {'1.1'}
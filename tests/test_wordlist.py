@@ -0,0 +1,67 @@
+import gzip
+import os
+import threading
+
+import pytest
+
+from admin_finder import Wordlist
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_files_are_streamed_with_comments_and_duplicates_dropped(tmp_path):
+    first = write(tmp_path / 'a.txt', '# comment\nadmin\n\n/login\nadmin\n')
+    second = write(tmp_path / 'b.txt', 'login\npanel\n')
+    
+    assert list(Wordlist(sources=[first, second])) == ['admin', 'login', 'panel']
+
+
+def test_gzip_files_are_detected_by_content(tmp_path):
+    path = tmp_path / 'list.txt'
+    path.write_bytes(gzip.compress(b'admin\nlogin\n'))
+    
+    assert list(Wordlist(sources=[str(path)])) == ['admin', 'login']
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_pipes_are_read_only_once(compress):
+    data = b'admin\nlogin\n'
+    if compress:
+        data = gzip.compress(data)
+    read_end, write_end = os.pipe()
+    writer = threading.Thread(target=lambda: (os.write(write_end, data), os.close(write_end)))
+    writer.start()
+    try:
+        assert list(Wordlist(sources=[f'/dev/fd/{read_end}'])) == ['admin', 'login']
+    finally:
+        writer.join()
+        os.close(read_end)
+
+
+def test_expansions_follow_each_entry_without_duplicates():
+    wordlist = Wordlist(paths=['admin', 'admin.php', 'panel/'], extensions=['php', '.asp'],
+                        trailing_slash=True, backup_suffixes=True)
+    
+    assert list(wordlist) == [
+        'admin', 'admin.php', 'admin.asp', 'admin/',
+        'admin.php.bak', 'admin.php.old', 'admin.php.orig', 'admin.php.save', 'admin.php~',
+        'panel/',
+    ]
+
+
+@pytest.mark.parametrize('bloom', [False, True])
+def test_dedup_spans_sources(tmp_path, bloom):
+    path = write(tmp_path / 'list.txt', 'login\nAdmin\nadmin\n')
+    wordlist = Wordlist(sources=[path], paths=['admin'], case_variants=True, bloom=bloom, bloom_capacity=1000)
+    
+    assert list(wordlist) == ['admin', 'ADMIN', 'Admin', 'login', 'LOGIN', 'Login']
+
+
+def test_reusable_only_for_repeatable_sources(tmp_path):
+    assert Wordlist(paths=['admin']).reusable
+    assert Wordlist(sources=[write(tmp_path / 'list.txt', 'admin\n')]).reusable
+    assert not Wordlist(sources=['-']).reusable
+    assert not Wordlist(paths=iter(['admin'])).reusable